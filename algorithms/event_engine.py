@@ -0,0 +1,475 @@
+import heapq
+from collections import deque
+from typing import Any, Callable, Iterable, Iterator, List, Tuple, Optional, Sequence
+from models.timeline import IDLE, Timeline
+from utils.instrumentation import SchedulerStats
+from utils.metrics import as_int_array
+
+# Event kinds produced by the simulation cores
+SEGMENT = 'segment'
+COMPLETION = 'completion'
+
+# Field positions in the (index, arrival_time, burst_time, priority) job tuples
+ARRIVAL = 1
+BURST = 2
+PRIORITY = 3
+
+Job = Tuple[int, int, int, int]
+# (SEGMENT, index or None for idle, start_time, duration) or (COMPLETION, index, start_time, completion_time)
+Event = Tuple[str, Optional[int], int, int]
+
+def aged_priorities(
+    arrival_times: Sequence[int],
+    priorities: Sequence[int],
+    aging_rate: float = 0.0
+) -> Sequence[float]:
+    """
+    Returns selection keys that apply priority aging lazily.
+
+    With aging, the effective priority of a process at time t is
+    priority - aging_rate * (t - arrival_time), improving steadily from its arrival. The
+    -aging_rate * t term is the same for every process, so ranking by the time-offset key
+    priority + aging_rate * arrival_time orders the processes by effective priority at
+    every instant. The keys never change, so the heaps need no per-tick updates and each
+    decision stays O(log n). A preempted process keeps its key and with it its age.
+
+    Args:
+        arrival_times (Sequence[int]): The arrival time of each process.
+        priorities (Sequence[int]): The base priority of each process (lower number indicates higher priority).
+        aging_rate (float): The priority levels gained per time unit; 0 disables aging.
+
+    Returns:
+        Sequence[float]: The selection key of each process; the priorities themselves without aging.
+
+    Raises:
+        ValueError: If the aging rate is negative.
+    """
+    if aging_rate < 0:
+        raise ValueError("Aging rate must be a non-negative number.")
+    if not aging_rate:
+        return priorities
+    return (as_int_array(priorities) + aging_rate * as_int_array(arrival_times)).tolist()
+
+def aged_jobs(jobs: Iterable[Job], aging_rate: float = 0.0) -> Iterable[Job]:
+    """
+    Replaces the priority of each job with its aged_priorities selection key.
+
+    Args:
+        jobs (Iterable[Job]): (index, arrival_time, burst_time, priority) tuples.
+        aging_rate (float): The priority levels gained per time unit; 0 disables aging.
+
+    Returns:
+        Iterable[Job]: The jobs with time-offset keys as priorities; the jobs themselves without aging.
+    """
+    if not aging_rate:
+        return jobs
+    return ((index, arrival_time, burst_time, priority + aging_rate * arrival_time)
+            for index, arrival_time, burst_time, priority in jobs)
+
+def preemptive_events(
+    jobs: Iterable[Job],
+    by_remaining: bool,
+    push: Callable[[List, Any], None] = heapq.heappush,
+    pop: Callable[[List], Any] = heapq.heappop
+) -> Iterator[Event]:
+    """
+    Runs an event-driven preemptive simulation over an arrival-ordered stream of jobs.
+
+    Time jumps straight to the next arrival or completion instead of advancing one
+    unit at a time, so the cost depends on the number of processes and preemptions
+    rather than on the length of the timeline. The ready queue is a binary heap keyed
+    on remaining burst time (Shortest Remaining Time First) or on the static priority
+    (lower number indicates higher priority). Jobs are pulled from the stream only when
+    their arrival is reached, so memory is bounded by the ready queue.
+
+    Ties are broken exactly as the unit-time schedulers broke them: among equal keys the
+    process that attained its key first wins, and processes arriving together are taken
+    in index order.
+
+    Args:
+        jobs (Iterable[Job]): (index, arrival_time, burst_time, priority) tuples in arrival order.
+        by_remaining (bool): Schedule by remaining burst time instead of priority.
+        push (Callable[[List, Any], None]): The ready queue insertion; replaced when instrumented.
+        pop (Callable[[List], Any]): The ready queue removal; replaced when instrumented.
+
+    Yields:
+        Event: One segment per uninterrupted run, and a completion after the last segment of each job.
+    """
+    jobs = iter(jobs)
+    pending = next(jobs, None)
+    # Heap entries are (key, time the key was attained, tie order, index, state);
+    # state is [index, arrival_time, remaining, priority, start_time]
+    ready_queue = []
+    current_time = 0
+    running = None
+    segment_start = 0
+
+    while True:
+        if running is None:
+            if not ready_queue:
+                if pending is None:
+                    return
+                # Skip idle gaps in a single step
+                if current_time < pending[ARRIVAL]:
+                    current_time = pending[ARRIVAL]
+
+            # Admit all processes that have arrived by current_time
+            while pending is not None and pending[ARRIVAL] <= current_time:
+                index, arrival_time, burst_time, priority = pending
+                key = burst_time if by_remaining else priority
+                push(ready_queue, (key, current_time, index, index,
+                                   [index, arrival_time, burst_time, priority, None]))
+                pending = next(jobs, None)
+
+            running = pop(ready_queue)[4]
+            # Record start_time if the process is executing for the first time
+            if running[4] is None:
+                running[4] = current_time
+            segment_start = current_time
+
+        finish_time = current_time + running[2]
+        if pending is None or finish_time <= pending[ARRIVAL]:
+            # The running process completes before anything else can happen
+            current_time = finish_time
+            running[2] = 0
+            yield SEGMENT, running[0], segment_start, current_time - segment_start
+            yield COMPLETION, running[0], running[4], current_time
+            running = None
+            continue
+
+        # Run until the next arrival and admit everything arriving at that instant
+        next_arrival = pending[ARRIVAL]
+        running[2] -= next_arrival - current_time
+        current_time = next_arrival
+        while pending is not None and pending[ARRIVAL] == current_time:
+            index, arrival_time, burst_time, priority = pending
+            key = burst_time if by_remaining else priority
+            push(ready_queue, (key, current_time, index, index,
+                               [index, arrival_time, burst_time, priority, None]))
+            pending = next(jobs, None)
+
+        # Preempt only if a newly arrived process has a strictly better key
+        if by_remaining:
+            if ready_queue[0][0] < running[2]:
+                # The preempted process attained its key now, ahead of any later arrival
+                push(ready_queue, (running[2], current_time, -1, running[0], running))
+                yield SEGMENT, running[0], segment_start, current_time - segment_start
+                running = None
+        elif ready_queue[0][0] < running[3]:
+            push(ready_queue, (running[3], running[1], running[0], running[0], running))
+            yield SEGMENT, running[0], segment_start, current_time - segment_start
+            running = None
+
+def non_preemptive_events(
+    jobs: Iterable[Job],
+    key: int,
+    record_idle: bool = False,
+    push: Callable[[List, Any], None] = heapq.heappush,
+    pop: Callable[[List], Any] = heapq.heappop
+) -> Iterator[Event]:
+    """
+    Runs a non-preemptive simulation using an arrival cursor and a binary-heap ready queue.
+
+    At every dispatch all processes that have arrived are admitted and the one with the
+    smallest key runs to completion. Equal keys are served in admission order, and
+    processes admitted at the same dispatch in index order, which is the order a stable
+    sort of the ready queue produces.
+
+    Args:
+        jobs (Iterable[Job]): (index, arrival_time, burst_time, priority) tuples in arrival order.
+        key (int): The job field to select on (ARRIVAL, BURST or PRIORITY); lower is selected first.
+        record_idle (bool): Emit segments with index None for idle gaps.
+        push (Callable[[List, Any], None]): The ready queue insertion; replaced when instrumented.
+        pop (Callable[[List], Any]): The ready queue removal; replaced when instrumented.
+
+    Yields:
+        Event: One segment per dispatched job followed by its completion.
+    """
+    jobs = iter(jobs)
+    pending = next(jobs, None)
+    # Heap entries are (key, admission time, index, burst_time)
+    ready_queue = []
+    current_time = 0
+
+    while pending is not None or ready_queue:
+        # Advance time to the next process arrival if ready queue is empty
+        if not ready_queue and current_time < pending[ARRIVAL]:
+            if record_idle:
+                yield SEGMENT, None, current_time, pending[ARRIVAL] - current_time
+            current_time = pending[ARRIVAL]
+
+        # Add all processes that have arrived by current_time to the ready queue
+        while pending is not None and pending[ARRIVAL] <= current_time:
+            push(ready_queue, (pending[key], current_time, pending[0], pending[BURST]))
+            pending = next(jobs, None)
+
+        _, _, index, burst_time = pop(ready_queue)
+        yield SEGMENT, index, current_time, burst_time
+        yield COMPLETION, index, current_time, current_time + burst_time
+        current_time += burst_time
+
+def _advance_rounds(rounds: int, ready_queue: deque, time: int, time_quantum: int):
+    """Runs the given number of full rounds on the queue entries, recording first start times."""
+    for position, entry in enumerate(ready_queue):
+        if entry[2] is None:
+            entry[2] = time + position * time_quantum
+        entry[1] -= rounds * time_quantum
+
+def round_robin_events(
+    jobs: Iterable[Job],
+    time_quantum: int,
+    queue_factory: Callable[[], deque] = deque,
+    advance_rounds: Callable[[int, deque, int, int], None] = _advance_rounds
+) -> Iterator[Event]:
+    """
+    Runs a Round Robin simulation with an arrival cursor and closed-form fast-forward.
+
+    Processes admitted together join the queue in index order, and arrivals during a
+    slice are queued ahead of the process being re-enqueued. Once per round the engine
+    checks how many full rounds can pass with no arrival and no completion, and skips
+    them in a single step, so the simulation cost no longer grows with burst / quantum.
+    Consecutive slices of the same process are emitted as one run-length encoded segment.
+
+    Args:
+        jobs (Iterable[Job]): (index, arrival_time, burst_time, priority) tuples in arrival order.
+        time_quantum (int): The time quantum for Round Robin scheduling.
+        queue_factory (Callable[[], deque]): Creates the ready queue; replaced when instrumented.
+        advance_rounds (Callable[[int, deque, int, int], None]): Applies skipped rounds to the queue; replaced when instrumented.
+
+    Yields:
+        Event: The execution segments and a completion for each job.
+    """
+    jobs = iter(jobs)
+    pending = next(jobs, None)
+    # Queue entries are [index, remaining, start_time]
+    ready_queue = queue_factory()
+    time = 0
+    # Slice not yet emitted, kept open so the same process can extend it
+    held = None
+    # Number of slices left before the next fast-forward check
+    slices_until_check = 0
+
+    while True:
+        # Enqueue processes that have arrived by the current time, in index order
+        if pending is not None and pending[ARRIVAL] <= time:
+            batch = []
+            while pending is not None and pending[ARRIVAL] <= time:
+                batch.append([pending[0], pending[BURST], None])
+                pending = next(jobs, None)
+            if len(batch) > 1:
+                batch.sort()
+            ready_queue.extend(batch)
+
+        if not ready_queue:
+            if pending is None:
+                break
+            # Advance time to the next process arrival
+            time = pending[ARRIVAL]
+            slices_until_check = 0
+            continue
+
+        if slices_until_check == 0:
+            slices_until_check = len(ready_queue)
+            # Count the full rounds in which every queued process uses its whole quantum
+            rounds = (min(entry[1] for entry in ready_queue) - 1) // time_quantum
+            round_length = len(ready_queue) * time_quantum
+            if pending is not None:
+                # No arrival may be admitted before the last of the skipped rounds ends
+                rounds = min(rounds, (pending[ARRIVAL] - time - 1) // round_length)
+            if rounds > 0:
+                advance_rounds(rounds, ready_queue, time, time_quantum)
+                if len(ready_queue) == 1:
+                    index = ready_queue[0][0]
+                    if held is not None and held[0] == index and held[1] + held[2] == time:
+                        held[2] += rounds * time_quantum
+                    else:
+                        if held is not None:
+                            yield SEGMENT, held[0], held[1], held[2]
+                        held = [index, time, rounds * time_quantum]
+                else:
+                    if held is not None:
+                        yield SEGMENT, held[0], held[1], held[2]
+                        held = None
+                    for round_number in range(rounds):
+                        slice_start = time + round_number * round_length
+                        for entry in ready_queue:
+                            yield SEGMENT, entry[0], slice_start, time_quantum
+                            slice_start += time_quantum
+                time += rounds * round_length
+        slices_until_check -= 1
+
+        current_process = ready_queue.popleft()
+        # Record start_time at first CPU allocation
+        if current_process[2] is None:
+            current_process[2] = time
+        # Execute the process for a time quantum or until completion
+        exec_time = min(time_quantum, current_process[1])
+        if held is not None and held[0] == current_process[0] and held[1] + held[2] == time:
+            held[2] += exec_time
+        else:
+            if held is not None:
+                yield SEGMENT, held[0], held[1], held[2]
+            held = [current_process[0], time, exec_time]
+        time += exec_time
+        current_process[1] -= exec_time
+
+        # Enqueue any newly arrived processes during execution
+        if pending is not None and pending[ARRIVAL] <= time:
+            batch = []
+            while pending is not None and pending[ARRIVAL] <= time:
+                batch.append([pending[0], pending[BURST], None])
+                pending = next(jobs, None)
+            if len(batch) > 1:
+                batch.sort()
+            ready_queue.extend(batch)
+
+        if current_process[1] == 0:
+            yield SEGMENT, held[0], held[1], held[2]
+            held = None
+            yield COMPLETION, current_process[0], current_process[2], time
+        else:
+            # Re-enqueue the current process
+            ready_queue.append(current_process)
+
+def instrumented_events(engine: Callable[..., Iterator[Event]], jobs: Iterable[Job], *args,
+                        stats: Optional[SchedulerStats] = None, **kwargs) -> Iterator[Event]:
+    """
+    Runs an engine, swapping in counting ready queue operations when stats are given.
+
+    Without stats the engine is called unchanged, so it keeps its plain heapq and deque
+    operations and instrumentation costs nothing.
+
+    Args:
+        engine (Callable[..., Iterator[Event]]): preemptive_events, non_preemptive_events or round_robin_events.
+        jobs (Iterable[Job]): (index, arrival_time, burst_time, priority) tuples in arrival order.
+        stats (Optional[SchedulerStats]): The statistics to collect, if any.
+
+    Returns:
+        Iterator[Event]: The engine's event stream.
+    """
+    if stats is None:
+        return engine(jobs, *args, **kwargs)
+    jobs = stats.timed_arrivals(jobs)
+    if engine is round_robin_events:
+        kwargs['queue_factory'] = stats.queue
+        kwargs['advance_rounds'] = stats.full_rounds(_advance_rounds)
+    else:
+        kwargs['push'] = stats.heap_push()
+        kwargs['pop'] = stats.heap_pop()
+    return engine(jobs, *args, **kwargs)
+
+def _arrival_ordered_jobs(
+    arrival_times: Sequence[int],
+    burst_times: Sequence[int],
+    priorities: Optional[Sequence[int]]
+) -> Iterator[Job]:
+    """Yields the job tuples of the given columns sorted by arrival; the sort is stable."""
+    n = len(arrival_times)
+    for index in sorted(range(n), key=arrival_times.__getitem__):
+        yield index, arrival_times[index], burst_times[index], 0 if priorities is None else priorities[index]
+
+def _collect(
+    events: Iterator[Event],
+    ids: Sequence[int],
+    n: int,
+    stats: Optional[SchedulerStats] = None,
+    add_segment: Optional[Callable[[int, int, int], None]] = None
+) -> Tuple[List[int], List[Optional[int]], List[int], Timeline]:
+    """
+    Gathers the completion order, start times, completion times and timeline from an event stream.
+
+    With add_segment, the segments are passed to it as they are produced instead, and the
+    returned timeline is empty.
+    """
+    if stats is not None:
+        events = stats.observe(events)
+    completion_order = []
+    start_times: List[Optional[int]] = [None] * n
+    completion_times = [0] * n
+    gantt_chart = Timeline()
+    if add_segment is None:
+        add_segment = gantt_chart.append
+    for kind, index, time, value in events:
+        if kind == SEGMENT:
+            add_segment(IDLE if index is None else ids[index], time, value)
+        else:
+            completion_order.append(index)
+            start_times[index] = time
+            completion_times[index] = value
+    return completion_order, start_times, completion_times, gantt_chart
+
+def preemptive_schedule(
+    ids: Sequence[int],
+    arrival_times: Sequence[int],
+    burst_times: Sequence[int],
+    priorities: Optional[Sequence[int]] = None,
+    stats: Optional[SchedulerStats] = None
+) -> Tuple[List[Optional[int]], List[int], Timeline]:
+    """
+    Runs an event-driven preemptive simulation over the given process columns.
+
+    Args:
+        ids (Sequence[int]): The process identifiers used in the execution timeline.
+        arrival_times (Sequence[int]): The arrival time of each process.
+        burst_times (Sequence[int]): The burst time of each process.
+        priorities (Optional[Sequence[int]]): The priority of each process, or None to schedule by remaining time.
+        stats (Optional[SchedulerStats]): Collects decision counters and phase timings, if given.
+
+    Returns:
+        Tuple[List[Optional[int]], List[int], Timeline]: The start and completion time of each process and the execution timeline.
+    """
+    jobs = _arrival_ordered_jobs(arrival_times, burst_times, priorities)
+    events = instrumented_events(preemptive_events, jobs, priorities is None, stats=stats)
+    _, start_times, completion_times, gantt_chart = _collect(events, ids, len(arrival_times), stats)
+    return start_times, completion_times, gantt_chart
+
+def non_preemptive_schedule(
+    ids: Sequence[int],
+    arrival_times: Sequence[int],
+    burst_times: Sequence[int],
+    keys: Sequence[int],
+    record_idle: bool = False,
+    stats: Optional[SchedulerStats] = None
+) -> Tuple[List[int], List[int], List[int], Timeline]:
+    """
+    Runs a non-preemptive simulation over the given process columns.
+
+    Args:
+        ids (Sequence[int]): The process identifiers used in the execution timeline.
+        arrival_times (Sequence[int]): The arrival time of each process.
+        burst_times (Sequence[int]): The burst time of each process.
+        keys (Sequence[int]): The selection key of each process (lower is selected first).
+        record_idle (bool): Record idle gaps in the execution timeline.
+        stats (Optional[SchedulerStats]): Collects decision counters and phase timings, if given.
+
+    Returns:
+        Tuple[List[int], List[int], List[int], Timeline]: The dispatch order of process indices, the start and completion time of each process and the execution timeline.
+    """
+    jobs = _arrival_ordered_jobs(arrival_times, burst_times, keys)
+    events = instrumented_events(non_preemptive_events, jobs, PRIORITY, record_idle, stats=stats)
+    return _collect(events, ids, len(arrival_times), stats)
+
+def round_robin_schedule(
+    ids: Sequence[int],
+    arrival_times: Sequence[int],
+    burst_times: Sequence[int],
+    time_quantum: int,
+    stats: Optional[SchedulerStats] = None
+) -> Tuple[List[Optional[int]], List[int], Timeline]:
+    """
+    Runs a Round Robin simulation over the given process columns.
+
+    Args:
+        ids (Sequence[int]): The process identifiers used in the execution timeline.
+        arrival_times (Sequence[int]): The arrival time of each process.
+        burst_times (Sequence[int]): The burst time of each process.
+        time_quantum (int): The time quantum for Round Robin scheduling.
+        stats (Optional[SchedulerStats]): Collects decision counters and phase timings, if given.
+
+    Returns:
+        Tuple[List[Optional[int]], List[int], Timeline]: The start and completion time of each process and the execution timeline.
+    """
+    jobs = _arrival_ordered_jobs(arrival_times, burst_times, None)
+    events = instrumented_events(round_robin_events, jobs, time_quantum, stats=stats)
+    _, start_times, completion_times, gantt_chart = _collect(events, ids, len(arrival_times), stats)
+    return start_times, completion_times, gantt_chart
@@ -1,53 +1,164 @@
-from typing import List, Dict, Tuple
-from models.process import Process
+from typing import TYPE_CHECKING, Optional, Sequence, Tuple
+from models.timeline import IDLE, Timeline
+from models.process_table import Processes, ProcessTable, read_columns, write_results, take_rows
+from algorithms.event_engine import non_preemptive_schedule
+from utils.instrumentation import SchedulerStats
+from utils.metrics import VECTORIZE_MIN_ROWS, as_int_array
 
-def fcfs_scheduling(processes: List[Process]) -> Tuple[List[Process], List[Dict]]:
+if TYPE_CHECKING:
+    import numpy as np
+
+def _fcfs_sorted_times(arrival_times: 'np.ndarray', burst_times: 'np.ndarray') -> Tuple['np.ndarray', 'np.ndarray']:
+    """
+    Computes FCFS start and completion times for processes already sorted by arrival.
+
+    Each process starts at max(arrival, previous completion). Writing prev for the sum of
+    the bursts before a process, that is prev + max over earlier processes of
+    (arrival - prev), which is a running maximum.
+
+    Args:
+        arrival_times (np.ndarray): The arrival times in dispatch order.
+        burst_times (np.ndarray): The burst times in dispatch order.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: The start and completion times in dispatch order.
+    """
+    import numpy as np
+    completion_times = np.cumsum(burst_times)
+    start_times = completion_times - burst_times
+    slack = np.subtract(arrival_times, start_times)
+    np.maximum.accumulate(slack, out=slack)
+    # The clock starts at time 0
+    np.maximum(slack, 0, out=slack)
+    start_times += slack
+    completion_times += slack
+    return start_times, completion_times
+
+def fcfs_vectorized(
+    arrival_times: Sequence[int],
+    burst_times: Sequence[int]
+) -> Tuple['np.ndarray', 'np.ndarray', 'np.ndarray', 'np.ndarray', 'np.ndarray']:
+    """
+    Computes First Come First Serve results in a few NumPy passes.
+
+    Args:
+        arrival_times (Sequence[int]): The arrival time of each process.
+        burst_times (Sequence[int]): The burst time of each process.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]: The dispatch order of process indices, and the start, completion, waiting and turnaround time of each process in input order.
+    """
+    import numpy as np
+    arrival_times = as_int_array(arrival_times)
+    burst_times = as_int_array(burst_times)
+    n = len(arrival_times)
+
+    if n < 2 or bool(np.all(arrival_times[1:] >= arrival_times[:-1])):
+        # Already in arrival order, which is the common case for traces
+        order = np.arange(n)
+        start_times, completion_times = _fcfs_sorted_times(arrival_times, burst_times)
+    else:
+        # Stable sort keeps simultaneous arrivals in input order
+        order = np.argsort(arrival_times, kind='stable')
+        sorted_start, sorted_completion = _fcfs_sorted_times(arrival_times[order], burst_times[order])
+        start_times = np.empty(n, dtype=np.int64)
+        completion_times = np.empty(n, dtype=np.int64)
+        start_times[order] = sorted_start
+        completion_times[order] = sorted_completion
+
+    # For FCFS the waiting time is simply the start delay
+    turnaround_times = completion_times - arrival_times
+    waiting_times = start_times - arrival_times
+    return order, start_times, completion_times, waiting_times, turnaround_times
+
+def fcfs_scheduling(processes: Processes, stats: Optional[SchedulerStats] = None) -> Tuple[Processes, Timeline]:
     """
     Performs First Come First Serve scheduling on the given list of processes.
 
+    A ProcessTable of at least VECTORIZE_MIN_ROWS processes is scheduled through the
+    vectorized path; smaller inputs are scheduled in one pure-Python pass. With stats, the
+    processes are scheduled through the event engine instead, which makes the same decisions
+    one at a time so that they can be counted.
+
     Args:
-        processes (List[Process]): The list of processes to schedule.
+        processes (Processes): The list of processes or ProcessTable to schedule.
+        stats (Optional[SchedulerStats]): Collects decision counters and phase timings, if given.
 
     Returns:
-        Tuple[List[Process], List[Dict]]: The list of processes with updated scheduling attributes and the execution timeline.
+        Tuple[Processes, Timeline]: The processes in completion order with updated scheduling attributes and the execution timeline.
     """
     if not processes:
-        return [], []
+        return [], Timeline()
+
+    if stats is not None:
+        # Serving in arrival order is a non-preemptive schedule keyed on arrival time
+        ids, arrival_times, burst_times, _ = read_columns(processes)
+        dispatch_order, start_times, completion_times, gantt_chart = non_preemptive_schedule(
+            ids, arrival_times, burst_times, arrival_times, record_idle=True, stats=stats
+        )
+        write_results(processes, start_times, completion_times)
+        return take_rows(processes, dispatch_order), gantt_chart
+
+    if isinstance(processes, ProcessTable) and len(processes) >= VECTORIZE_MIN_ROWS:
+        import numpy as np
+        order, start_times, completion_times, _, _ = fcfs_vectorized(processes.arrival_times, processes.burst_times)
+        write_results(processes, start_times, completion_times)
+
+        # The stable sort of already sorted arrivals is the identity, so no row needs moving
+        in_order = bool(np.all(order[1:] > order[:-1]))
+        ids = as_int_array(processes.ids)
+        if in_order:
+            sorted_start, sorted_completion, sorted_ids = start_times, completion_times, ids
+        else:
+            sorted_start, sorted_completion, sorted_ids = start_times[order], completion_times[order], ids[order]
+
+        # Build the timeline vectorized: an idle segment precedes every process that
+        # starts later than the previous completion
+        previous_completion = np.concatenate(([0], sorted_completion[:-1]))
+        idle = sorted_start > previous_completion
+        positions = np.arange(len(order)) + np.cumsum(idle)
+        segment_count = len(order) + int(idle.sum())
+        process_ids = np.full(segment_count, IDLE, dtype=np.int64)
+        segment_starts = np.empty(segment_count, dtype=np.int64)
+        durations = np.empty(segment_count, dtype=np.int64)
+        process_ids[positions] = sorted_ids
+        segment_starts[positions] = sorted_start
+        durations[positions] = sorted_completion - sorted_start
+        idle_positions = positions[idle] - 1
+        segment_starts[idle_positions] = previous_completion[idle]
+        durations[idle_positions] = sorted_start[idle] - previous_completion[idle]
+        gantt_chart = Timeline.from_arrays(process_ids, segment_starts, durations)
+
+        if in_order:
+            return processes, gantt_chart
+        return processes.take(order), gantt_chart
 
+    ids, arrival_times, burst_times, _ = read_columns(processes)
+    n = len(arrival_times)
     # Sort processes based on arrival time
-    sorted_processes = sorted(processes, key=lambda p: p.arrival_time)
+    sorted_indices = sorted(range(n), key=arrival_times.__getitem__)
+    start_times = [0] * n
+    completion_times = [0] * n
     current_time = 0
-    gantt_chart = []
-    completed_processes = []
+    gantt_chart = Timeline()
 
-    for process in sorted_processes:
-        if current_time < process.arrival_time:
+    for index in sorted_indices:
+        if current_time < arrival_times[index]:
             # Record idle time in Gantt chart
-            gantt_chart.append({
-                'process_id': 'Idle',
-                'start_time': current_time,
-                'duration': process.arrival_time - current_time
-            })
-            current_time = process.arrival_time
+            gantt_chart.append(IDLE, current_time, arrival_times[index] - current_time)
+            current_time = arrival_times[index]
 
         # Record execution event for Gantt chart
-        gantt_chart.append({
-            'process_id': process.id,
-            'start_time': current_time,
-            'duration': process.burst_time
-        })
+        gantt_chart.append(ids[index], current_time, burst_times[index])
 
         # Record start time
-        process.start_time = current_time
+        start_times[index] = current_time
         # Update current time based on burst time
-        current_time += process.burst_time
+        current_time += burst_times[index]
         # Record completion time
-        process.completion_time = current_time
-        # Calculate turnaround time
-        process.turnaround_time = process.completion_time - process.arrival_time
-        # Calculate waiting time
-        process.waiting_time = process.start_time - process.arrival_time
+        completion_times[index] = current_time
 
-        completed_processes.append(process)
+    # Turnaround and waiting times follow from the start and completion times
+    write_results(processes, start_times, completion_times)
 
-    return completed_processes, gantt_chart
+    return take_rows(processes, sorted_indices), gantt_chart
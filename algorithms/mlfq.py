@@ -0,0 +1,35 @@
+from typing import Optional, Sequence, Tuple
+from models.timeline import Timeline
+from models.process_table import Processes
+from algorithms.policies import MLFQPolicy
+from utils.instrumentation import SchedulerStats
+
+def mlfq_scheduling(
+    processes: Processes,
+    time_quantum: int,
+    levels: int = 3,
+    quanta: Optional[Sequence[int]] = None,
+    boost_interval: Optional[int] = None,
+    stats: Optional[SchedulerStats] = None
+) -> Tuple[Processes, Timeline]:
+    """
+    Performs Multilevel Feedback Queue scheduling on the given list of processes.
+
+    Args:
+        processes (Processes): The list of processes or ProcessTable to schedule.
+        time_quantum (int): The time quantum of the top level.
+        levels (int): The number of priority levels.
+        quanta (Optional[Sequence[int]]): The quantum of each level, top first; defaults to
+            time_quantum doubled at each lower level.
+        boost_interval (Optional[int]): The time between priority boosts; defaults to eight
+            times the lowest level's quantum, and 0 disables boosting.
+        stats (Optional[SchedulerStats]): Collects decision counters and phase timings, if given.
+
+    Returns:
+        Tuple[Processes, Timeline]: The processes with updated scheduling attributes and the execution timeline.
+
+    Raises:
+        ValueError: If the levels, time quantum, quanta or boost interval are invalid.
+    """
+    # MLFQ has no specialized engine; the policy runs on the shared simulation core
+    return MLFQPolicy(time_quantum, levels, quanta, boost_interval).schedule(processes, stats)
@@ -0,0 +1,384 @@
+import heapq
+from collections import deque
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple
+from models.timeline import Timeline
+from models.process_table import Processes
+from algorithms.event_engine import (
+    ARRIVAL, BURST, PRIORITY, Event, Job, aged_jobs, instrumented_events,
+    non_preemptive_events, preemptive_events, round_robin_events
+)
+from algorithms.policy import SchedulingPolicy, Task
+from utils.instrumentation import SchedulerStats
+
+# The built-in policies answer the shared core's hooks, and their schedule and events
+# methods use the specialized engines of their algorithm modules, which make the same
+# decisions with closed-form shortcuts (vectorized FCFS, Round Robin fast-forward).
+
+class _KeyedPolicy(SchedulingPolicy):
+    """A non-preemptive policy that runs the ready process with the smallest key to completion."""
+
+    def __init__(self):
+        # Heap entries are (key, admission time, index, task); equal keys are served in
+        # admission order, and processes admitted together in index order
+        self._ready = []
+
+    def __len__(self) -> int:
+        return len(self._ready)
+
+    def key(self, task: Task) -> int:
+        raise NotImplementedError
+
+    def on_arrival(self, tasks: List[Task], time: int):
+        for task in tasks:
+            heapq.heappush(self._ready, (self.key(task), time, task.index, task))
+
+    def select_next(self, time: int) -> Task:
+        return heapq.heappop(self._ready)[3]
+
+    def on_preempt(self, task: Task, time: int):
+        heapq.heappush(self._ready, (self.key(task), time, task.index, task))
+
+class FCFSPolicy(_KeyedPolicy):
+    """First Come First Serve: processes run in arrival order."""
+    name = 'fcfs'
+    title = "First Come First Serve"
+    record_idle = True
+
+    def key(self, task: Task) -> int:
+        return task.arrival_time
+
+    def events(self, jobs: Iterable[Job], stats: Optional[SchedulerStats] = None) -> Iterator[Event]:
+        # Arrival-ordered jobs are pushed in key order, so each heap operation is O(1)
+        return instrumented_events(non_preemptive_events, jobs, ARRIVAL, record_idle=True, stats=stats)
+
+    def schedule(self, processes: Processes, stats: Optional[SchedulerStats] = None) -> Tuple[Processes, Timeline]:
+        from algorithms.fcfs import fcfs_scheduling
+        return fcfs_scheduling(processes, stats)
+
+class SJFPolicy(_KeyedPolicy):
+    """Shortest Job First: the ready process with the shortest burst time runs to completion."""
+    name = 'sjf'
+    title = "Shortest Job First"
+
+    def key(self, task: Task) -> int:
+        return task.burst_time
+
+    def events(self, jobs: Iterable[Job], stats: Optional[SchedulerStats] = None) -> Iterator[Event]:
+        return instrumented_events(non_preemptive_events, jobs, BURST, stats=stats)
+
+    def schedule(self, processes: Processes, stats: Optional[SchedulerStats] = None) -> Tuple[Processes, Timeline]:
+        from algorithms.sjf import sjf_scheduling
+        return sjf_scheduling(processes, stats)
+
+class PriorityNonPreemptivePolicy(_KeyedPolicy):
+    """Priority Non-Preemptive: the ready process with the highest priority (lowest number) runs to completion."""
+    name = 'priority_non_preemptive'
+    title = "Priority Non-Preemptive"
+    uses_aging = True
+
+    def __init__(self, aging_rate: float = 0.0):
+        """
+        Args:
+            aging_rate (float): Priority levels a process gains per time unit since its arrival; 0 disables aging.
+
+        Raises:
+            ValueError: If the aging rate is negative.
+        """
+        if aging_rate < 0:
+            raise ValueError("Aging rate must be a non-negative number.")
+        super().__init__()
+        self.aging_rate = aging_rate
+
+    def key(self, task: Task) -> float:
+        # The time-offset key of algorithms.event_engine.aged_priorities
+        if self.aging_rate:
+            return task.priority + self.aging_rate * task.arrival_time
+        return task.priority
+
+    def events(self, jobs: Iterable[Job], stats: Optional[SchedulerStats] = None) -> Iterator[Event]:
+        return instrumented_events(non_preemptive_events, aged_jobs(jobs, self.aging_rate), PRIORITY, stats=stats)
+
+    def schedule(self, processes: Processes, stats: Optional[SchedulerStats] = None) -> Tuple[Processes, Timeline]:
+        from algorithms.priority_non_preemptive import priority_non_preemptive_scheduling
+        return priority_non_preemptive_scheduling(processes, stats, self.aging_rate)
+
+class SRTFPolicy(SchedulingPolicy):
+    """Shortest Remaining Time First: an arrival with a strictly shorter remaining time preempts."""
+    name = 'srtf'
+    title = "Shortest Remaining Time First"
+    preemptive = True
+
+    def __init__(self):
+        # Heap entries are (remaining, time the key was attained, tie order, index, task)
+        self._ready = []
+
+    def __len__(self) -> int:
+        return len(self._ready)
+
+    def on_arrival(self, tasks: List[Task], time: int):
+        for task in tasks:
+            heapq.heappush(self._ready, (task.remaining, time, task.index, task.index, task))
+
+    def select_next(self, time: int) -> Task:
+        return heapq.heappop(self._ready)[4]
+
+    def should_preempt(self, task: Task, time: int) -> bool:
+        return self._ready[0][0] < task.remaining
+
+    def on_preempt(self, task: Task, time: int):
+        # The preempted process attained its key now, ahead of any later arrival
+        heapq.heappush(self._ready, (task.remaining, time, -1, task.index, task))
+
+    def events(self, jobs: Iterable[Job], stats: Optional[SchedulerStats] = None) -> Iterator[Event]:
+        return instrumented_events(preemptive_events, jobs, True, stats=stats)
+
+    def schedule(self, processes: Processes, stats: Optional[SchedulerStats] = None) -> Tuple[Processes, Timeline]:
+        from algorithms.srtf import srtf_scheduling
+        return srtf_scheduling(processes, stats)
+
+class PriorityPreemptivePolicy(SchedulingPolicy):
+    """Priority Preemptive: an arrival with a strictly higher priority (lower number) preempts."""
+    name = 'priority_preemptive'
+    title = "Priority Preemptive"
+    preemptive = True
+    uses_aging = True
+
+    def __init__(self, aging_rate: float = 0.0):
+        """
+        Args:
+            aging_rate (float): Priority levels a process gains per time unit since its arrival; 0 disables aging.
+
+        Raises:
+            ValueError: If the aging rate is negative.
+        """
+        if aging_rate < 0:
+            raise ValueError("Aging rate must be a non-negative number.")
+        self.aging_rate = aging_rate
+        # Heap entries are (key, time the key was attained, tie order, index, task)
+        self._ready = []
+
+    def __len__(self) -> int:
+        return len(self._ready)
+
+    def key(self, task: Task) -> float:
+        # The time-offset key of algorithms.event_engine.aged_priorities; a running
+        # process ages too, so comparisons with it need no update either
+        if self.aging_rate:
+            return task.priority + self.aging_rate * task.arrival_time
+        return task.priority
+
+    def on_arrival(self, tasks: List[Task], time: int):
+        for task in tasks:
+            heapq.heappush(self._ready, (self.key(task), time, task.index, task.index, task))
+
+    def select_next(self, time: int) -> Task:
+        return heapq.heappop(self._ready)[4]
+
+    def should_preempt(self, task: Task, time: int) -> bool:
+        return self._ready[0][0] < self.key(task)
+
+    def on_preempt(self, task: Task, time: int):
+        heapq.heappush(self._ready, (self.key(task), task.arrival_time, task.index, task.index, task))
+
+    def events(self, jobs: Iterable[Job], stats: Optional[SchedulerStats] = None) -> Iterator[Event]:
+        return instrumented_events(preemptive_events, aged_jobs(jobs, self.aging_rate), False, stats=stats)
+
+    def schedule(self, processes: Processes, stats: Optional[SchedulerStats] = None) -> Tuple[Processes, Timeline]:
+        from algorithms.priority_preemptive import priority_preemptive_scheduling
+        return priority_preemptive_scheduling(processes, stats, self.aging_rate)
+
+class RoundRobinPolicy(SchedulingPolicy):
+    """Round Robin: processes take turns in FIFO order, each running for at most one time quantum."""
+    name = 'round_robin'
+    title = "Round Robin"
+    uses_quantum = True
+
+    def __init__(self, time_quantum: int):
+        """
+        Args:
+            time_quantum (int): The time quantum for Round Robin scheduling.
+
+        Raises:
+            ValueError: If the time quantum is not a positive integer.
+        """
+        if time_quantum is None or time_quantum <= 0:
+            raise ValueError("Time quantum must be a positive integer.")
+        self.time_quantum = time_quantum
+        self._ready = deque()
+
+    def __len__(self) -> int:
+        return len(self._ready)
+
+    def on_arrival(self, tasks: List[Task], time: int):
+        # Processes admitted together join the queue in index order
+        if len(tasks) > 1:
+            tasks = sorted(tasks, key=lambda task: task.index)
+        self._ready.extend(tasks)
+
+    def select_next(self, time: int) -> Task:
+        return self._ready.popleft()
+
+    def on_preempt(self, task: Task, time: int):
+        self._ready.append(task)
+
+    def quantum(self, task: Task) -> Optional[int]:
+        return self.time_quantum
+
+    def full_rounds(self, time: int, until: Optional[int]) -> Tuple[int, Sequence[Task]]:
+        # The closed-form skip of algorithms.event_engine.round_robin_events
+        ready = self._ready
+        rounds = (min(task.remaining for task in ready) - 1) // self.time_quantum
+        if until is not None:
+            rounds = min(rounds, (until - time - 1) // (len(ready) * self.time_quantum))
+        return rounds, ready
+
+    def events(self, jobs: Iterable[Job], stats: Optional[SchedulerStats] = None) -> Iterator[Event]:
+        return instrumented_events(round_robin_events, jobs, self.time_quantum, stats=stats)
+
+    def schedule(self, processes: Processes, stats: Optional[SchedulerStats] = None) -> Tuple[Processes, Timeline]:
+        from algorithms.round_robin import round_robin_scheduling
+        return round_robin_scheduling(processes, self.time_quantum, stats)
+
+class MLFQPolicy(SchedulingPolicy):
+    """
+    Multilevel Feedback Queue: new processes start at the top level and sink as they use up their quanta.
+
+    Each level is a FIFO deque with its own quantum, and a bitmap marks the non-empty
+    levels, so selecting the next task takes the lowest set bit in O(1), as in the
+    Linux O(1) scheduler. A task that uses up its level's quantum, over one or several
+    turns, moves down one level; a task preempted by a higher-level arrival keeps its
+    level and the rest of its quantum, and resumes first at that level. At every
+    multiple of boost_interval all tasks return to the top level, so long-running tasks
+    cannot starve. The core has no timer events, so a boost takes effect at the first
+    scheduling event at or after its time.
+
+    A task's level, the time it has used there and the boost period it was last placed
+    in are kept in its policy_state, so tasks can move between the queues of several cores.
+    """
+    name = 'mlfq'
+    title = "Multilevel Feedback Queue"
+    uses_quantum = True
+    preemptive = True
+
+    def __init__(
+        self,
+        time_quantum: int,
+        levels: int = 3,
+        quanta: Optional[Sequence[int]] = None,
+        boost_interval: Optional[int] = None
+    ):
+        """
+        Args:
+            time_quantum (int): The quantum of the top level.
+            levels (int): The number of priority levels.
+            quanta (Optional[Sequence[int]]): The quantum of each level, top first; defaults to
+                time_quantum doubled at each lower level.
+            boost_interval (Optional[int]): The time between priority boosts; defaults to eight
+                times the lowest level's quantum, and 0 disables boosting.
+
+        Raises:
+            ValueError: If the levels, time quantum, quanta or boost interval are invalid.
+        """
+        if time_quantum is None or time_quantum <= 0:
+            raise ValueError("Time quantum must be a positive integer.")
+        if levels <= 0:
+            raise ValueError("Number of levels must be a positive integer.")
+        if quanta is None:
+            quanta = [time_quantum << level for level in range(levels)]
+        if len(quanta) != levels or any(quantum <= 0 for quantum in quanta):
+            raise ValueError("Each level needs a positive time quantum.")
+        if boost_interval is None:
+            boost_interval = 8 * quanta[-1]
+        if boost_interval < 0:
+            raise ValueError("Boost interval must be a non-negative integer.")
+        self.time_quantum = time_quantum
+        self.quanta = list(quanta)
+        self.boost_interval = boost_interval
+        self._levels = [deque() for _ in range(levels)]
+        # Queues merged into the front of the top level by boosts, oldest first
+        self._boosted = deque()
+        # Bit i is set while level i is not empty
+        self._bitmap = 0
+        self._count = 0
+        self._period = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _push(self, level: int, task: Task, used: int, front: bool = False):
+        # The last field is the remaining time at the task's latest dispatch
+        task.policy_state = (level, used, self._period, task.remaining)
+        if not front:
+            self._levels[level].append(task)
+        elif level == 0 and self._boosted:
+            self._boosted[0].appendleft(task)
+        else:
+            self._levels[level].appendleft(task)
+        self._bitmap |= 1 << level
+        self._count += 1
+
+    def _state(self, task: Task) -> Tuple[int, int, int]:
+        """Returns the task's level, used time and remaining time at dispatch, at the top level if boosted since."""
+        level, used, period, remaining = task.policy_state
+        if period < self._period:
+            return 0, 0, remaining
+        return level, used, remaining
+
+    def _boost(self, time: int):
+        """Moves every queued task to the top level if a boost is due."""
+        if not self.boost_interval or time // self.boost_interval <= self._period:
+            return
+        self._period = time // self.boost_interval
+        if self._bitmap:
+            # The level queues become the front of the top level in O(levels); the tasks
+            # in them are reset to the top level when they are next selected
+            self._boosted.extend(queue for queue in self._levels if queue)
+            self._levels = [deque() for _ in self._levels]
+            self._bitmap = 1
+
+    def on_arrival(self, tasks: List[Task], time: int):
+        self._boost(time)
+        # Processes admitted together join the top level in index order
+        if len(tasks) > 1:
+            tasks = sorted(tasks, key=lambda task: task.index)
+        for task in tasks:
+            self._push(0, task, 0)
+
+    def select_next(self, time: int) -> Task:
+        self._boost(time)
+        # The lowest set bit is the highest non-empty level
+        level = (self._bitmap & -self._bitmap).bit_length() - 1
+        if level == 0 and self._boosted:
+            queue = self._boosted[0]
+            task = queue.popleft()
+            if not queue:
+                self._boosted.popleft()
+        else:
+            queue = self._levels[level]
+            task = queue.popleft()
+        if not queue and not (level == 0 and (self._boosted or self._levels[0])):
+            self._bitmap &= ~(1 << level)
+        self._count -= 1
+        level, used, _ = self._state(task)
+        task.policy_state = (level, used, self._period, task.remaining)
+        return task
+
+    def quantum(self, task: Task) -> Optional[int]:
+        level, used, _, _ = task.policy_state
+        return self.quanta[level] - used
+
+    def should_preempt(self, task: Task, time: int) -> bool:
+        self._boost(time)
+        # Arrivals join the top level, so any task below it yields to them
+        level = self._state(task)[0]
+        return bool(self._bitmap & ((1 << level) - 1))
+
+    def on_preempt(self, task: Task, time: int):
+        self._boost(time)
+        level, used, remaining = self._state(task)
+        used += remaining - task.remaining
+        if used >= self.quanta[level]:
+            # The quantum is used up: move down a level with a fresh quantum
+            self._push(min(level + 1, len(self.quanta) - 1), task, 0)
+        else:
+            self._push(level, task, used, front=True)
@@ -0,0 +1,281 @@
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple
+from models.timeline import Timeline
+from models.process_table import Processes, read_columns, write_results, take_rows
+from algorithms.event_engine import SEGMENT, COMPLETION, ARRIVAL, Event, Job, _arrival_ordered_jobs, _collect
+from utils.instrumentation import SchedulerStats
+
+class Task:
+    """
+    The simulation state of one process, as seen by a scheduling policy.
+
+    Attributes:
+        index (int): The position of the process in the input.
+        arrival_time (int): The arrival time of the process.
+        burst_time (int): The execution time required by the process.
+        priority (int): The priority level of the process.
+        remaining (int): The execution time still required.
+        start_time (Optional[int]): The time of the first dispatch, or None before it.
+        core (Optional[int]): The core the task last ran on, in multi-core simulations.
+        policy_state (Any): Per-task bookkeeping owned by the policy, such as a feedback level.
+    """
+
+    __slots__ = (
+        'index', 'arrival_time', 'burst_time', 'priority', 'remaining', 'start_time', 'core', 'policy_state'
+    )
+
+    def __init__(self, index: int, arrival_time: int, burst_time: int, priority: int):
+        self.index = index
+        self.arrival_time = arrival_time
+        self.burst_time = burst_time
+        self.priority = priority
+        self.remaining = burst_time
+        self.start_time = None
+        self.core = None
+        self.policy_state = None
+
+    # Pickled as a plain tuple, which halves the size and time of checkpoints with large ready queues
+    def __getstate__(self) -> tuple:
+        return (self.index, self.arrival_time, self.burst_time, self.priority, self.remaining,
+                self.start_time, self.core, self.policy_state)
+
+    def __setstate__(self, state: tuple):
+        (self.index, self.arrival_time, self.burst_time, self.priority, self.remaining,
+         self.start_time, self.core, self.policy_state) = state
+
+class SchedulingPolicy:
+    """
+    A scheduling policy: the decisions that distinguish one algorithm from another.
+
+    The shared simulation core (policy_events) owns the clock, jumps straight to the
+    next arrival, completion or quantum expiry, and records the timeline and results.
+    A policy owns its ready queue and answers the core through these hooks:
+
+    - on_arrival(tasks, time): admit processes that arrived by time.
+    - select_next(time): remove and return the task to run next.
+    - quantum(task): the longest the task may run before being re-queued, or None.
+    - should_preempt(task, time): for preemptive policies, whether the running task
+      must yield after the arrivals just admitted at time.
+    - on_preempt(task, time): put a task back that lost the CPU before completing.
+
+    A policy instance holds the state of one simulation; create a fresh one per run.
+
+    Attributes:
+        name (str): The registry name.
+        title (str): The human-readable name.
+        uses_quantum (bool): Whether the constructor takes a time quantum.
+        uses_aging (bool): Whether the constructor takes a priority aging rate.
+        preemptive (bool): Whether the core consults should_preempt at every arrival.
+        record_idle (bool): Whether idle gaps appear in the timeline.
+    """
+
+    name = ''
+    title = ''
+    uses_quantum = False
+    uses_aging = False
+    preemptive = False
+    record_idle = False
+
+    def __len__(self) -> int:
+        """Returns the number of tasks in the ready queue."""
+        raise NotImplementedError
+
+    def on_arrival(self, tasks: List[Task], time: int):
+        """Admits the tasks that arrived by time, in arrival order."""
+        raise NotImplementedError
+
+    def select_next(self, time: int) -> Task:
+        """Removes and returns the task to run next; the ready queue is not empty."""
+        raise NotImplementedError
+
+    def on_preempt(self, task: Task, time: int):
+        """Re-queues a task that lost the CPU before completing."""
+        raise NotImplementedError
+
+    def quantum(self, task: Task) -> Optional[int]:
+        """Returns the longest the task may run before being re-queued, or None to run to completion."""
+        return None
+
+    def should_preempt(self, task: Task, time: int) -> bool:
+        """Returns whether the running task must yield to the tasks admitted at time."""
+        return False
+
+    def full_rounds(self, time: int, until: Optional[int]) -> Tuple[int, Sequence[Task]]:
+        """
+        Returns how many full rounds of the ready queue can run without a decision, and its tasks in turn order.
+
+        In a full round every queued task runs once for its whole quantum without completing,
+        and the queue is in the same order afterwards. The incremental Simulator runs such
+        rounds in one step. Policies without rounds return none.
+
+        Args:
+            time (int): The current time; the tasks that arrived by it have been admitted.
+            until (Optional[int]): The time of the next arrival or stop, before which the rounds must end.
+
+        Returns:
+            Tuple[int, Sequence[Task]]: The number of rounds and the queued tasks.
+        """
+        return 0, ()
+
+    def events(self, jobs: Iterable[Job], stats: Optional[SchedulerStats] = None) -> Iterator[Event]:
+        """
+        Simulates the jobs and returns the event stream behind schedule.
+
+        Defaults to the shared simulation core; policies whose schedule uses a specialized
+        engine return that engine's events, so streamed runs keep its shortcuts.
+
+        Args:
+            jobs (Iterable[Job]): (index, arrival_time, burst_time, priority) tuples in arrival order.
+            stats (Optional[SchedulerStats]): Collects decision counters and phase timings, if given.
+
+        Returns:
+            Iterator[Event]: The execution segments and a completion for each job.
+        """
+        return policy_events(jobs, self, stats)
+
+    def returns_input_order(self) -> bool:
+        """Whether schedule returns the processes in input order rather than dispatch order."""
+        return self.preemptive or self.uses_quantum
+
+    def schedule(self, processes: Processes, stats: Optional[SchedulerStats] = None) -> Tuple[Processes, Timeline]:
+        """
+        Schedules the processes on the shared simulation core.
+
+        Args:
+            processes (Processes): The list of processes or ProcessTable to schedule.
+            stats (Optional[SchedulerStats]): Collects decision counters and phase timings, if given.
+
+        Returns:
+            Tuple[Processes, Timeline]: The processes with updated scheduling attributes and the execution timeline.
+        """
+        if not processes:
+            return [], Timeline()
+
+        ids, arrival_times, burst_times, priorities = read_columns(processes)
+        completion_order, start_times, completion_times, gantt_chart = policy_schedule(
+            ids, arrival_times, burst_times, priorities, self, stats
+        )
+        write_results(processes, start_times, completion_times)
+
+        if self.returns_input_order():
+            return processes, gantt_chart
+        return take_rows(processes, completion_order), gantt_chart
+
+def policy_events(
+    jobs: Iterable[Job],
+    policy: SchedulingPolicy,
+    stats: Optional[SchedulerStats] = None
+) -> Iterator[Event]:
+    """
+    Runs the shared event-driven simulation core with the given policy.
+
+    Time jumps straight to the next arrival, completion or quantum expiry. Processes
+    arriving by the same instant are admitted in one on_arrival call; arrivals during a
+    slice are admitted before the task whose quantum expired is re-queued.
+
+    Args:
+        jobs (Iterable[Job]): (index, arrival_time, burst_time, priority) tuples in arrival order.
+        policy (SchedulingPolicy): A fresh policy instance.
+        stats (Optional[SchedulerStats]): Collects decision counters and phase timings, if given.
+
+    Yields:
+        Event: The execution segments and a completion for each job.
+    """
+    on_arrival, select_next, on_preempt = policy.on_arrival, policy.select_next, policy.on_preempt
+    if stats is not None:
+        jobs = stats.timed_arrivals(jobs)
+        on_arrival, select_next, on_preempt = stats.policy_hooks(policy)
+    jobs = iter(jobs)
+    pending = next(jobs, None)
+    quantum = policy.quantum
+    preemptive = policy.preemptive
+    time = 0
+
+    while True:
+        if not policy:
+            if pending is None:
+                return
+            # Skip idle gaps in a single step
+            if time < pending[ARRIVAL]:
+                if policy.record_idle:
+                    yield SEGMENT, None, time, pending[ARRIVAL] - time
+                time = pending[ARRIVAL]
+
+        # Admit all processes that have arrived by the current time
+        if pending is not None and pending[ARRIVAL] <= time:
+            batch = []
+            while pending is not None and pending[ARRIVAL] <= time:
+                batch.append(Task(*pending))
+                pending = next(jobs, None)
+            on_arrival(batch, time)
+
+        task = select_next(time)
+        # Record start_time at first CPU allocation
+        if task.start_time is None:
+            task.start_time = time
+        segment_start = time
+        run_time = task.remaining
+        limit = quantum(task)
+        if limit is not None and limit < run_time:
+            run_time = limit
+        slice_end = time + run_time
+
+        # A preemptive policy is consulted at every arrival before the slice ends
+        preempted = False
+        if preemptive:
+            while pending is not None and pending[ARRIVAL] < slice_end:
+                task.remaining -= pending[ARRIVAL] - time
+                time = pending[ARRIVAL]
+                batch = []
+                while pending is not None and pending[ARRIVAL] == time:
+                    batch.append(Task(*pending))
+                    pending = next(jobs, None)
+                on_arrival(batch, time)
+                if policy.should_preempt(task, time):
+                    preempted = True
+                    break
+        if preempted:
+            on_preempt(task, time)
+            yield SEGMENT, task.index, segment_start, time - segment_start
+            continue
+
+        task.remaining -= slice_end - time
+        time = slice_end
+        if task.remaining == 0:
+            yield SEGMENT, task.index, segment_start, time - segment_start
+            yield COMPLETION, task.index, task.start_time, time
+            continue
+
+        # The quantum expired: arrivals during the slice are queued ahead of the task
+        if pending is not None and pending[ARRIVAL] <= time:
+            batch = []
+            while pending is not None and pending[ARRIVAL] <= time:
+                batch.append(Task(*pending))
+                pending = next(jobs, None)
+            on_arrival(batch, time)
+        on_preempt(task, time)
+        yield SEGMENT, task.index, segment_start, time - segment_start
+
+def policy_schedule(
+    ids: Sequence[int],
+    arrival_times: Sequence[int],
+    burst_times: Sequence[int],
+    priorities: Sequence[int],
+    policy: SchedulingPolicy,
+    stats: Optional[SchedulerStats] = None
+) -> Tuple[List[int], List[Optional[int]], List[int], Timeline]:
+    """
+    Runs the shared simulation core with the given policy over the given process columns.
+
+    Args:
+        ids (Sequence[int]): The process identifiers used in the execution timeline.
+        arrival_times (Sequence[int]): The arrival time of each process.
+        burst_times (Sequence[int]): The burst time of each process.
+        priorities (Sequence[int]): The priority of each process.
+        policy (SchedulingPolicy): A fresh policy instance.
+        stats (Optional[SchedulerStats]): Collects decision counters and phase timings, if given.
+
+    Returns:
+        Tuple[List[int], List[Optional[int]], List[int], Timeline]: The completion order of process indices, the start and completion time of each process and the execution timeline.
+    """
+    jobs = _arrival_ordered_jobs(arrival_times, burst_times, priorities)
+    return _collect(policy_events(jobs, policy, stats), ids, len(arrival_times), stats)
@@ -0,0 +1,181 @@
+from functools import lru_cache
+from importlib import import_module
+from typing import Callable, Dict, List, Optional, Tuple, Type
+from models.process_table import Processes, ProcessTable, read_columns, result_table, write_results
+from models.timeline import Timeline
+from algorithms.event_engine import _arrival_ordered_jobs, _collect
+from algorithms.policy import SchedulingPolicy
+from utils.instrumentation import SchedulerStats
+
+# Installed packages can add policies by declaring entry points in this group, e.g.
+# [project.entry-points."cpu_scheduling.policies"] my_policy = "my_package.module:MyPolicy"
+ENTRY_POINT_GROUP = 'cpu_scheduling.policies'
+
+# The built-in policies, as entry point references so that only the selected one is imported
+BUILTIN_POLICIES: Dict[str, str] = {
+    'fcfs': 'algorithms.policies:FCFSPolicy',
+    'priority_non_preemptive': 'algorithms.policies:PriorityNonPreemptivePolicy',
+    'priority_preemptive': 'algorithms.policies:PriorityPreemptivePolicy',
+    'srtf': 'algorithms.policies:SRTFPolicy',
+    'round_robin': 'algorithms.policies:RoundRobinPolicy',
+    'sjf': 'algorithms.policies:SJFPolicy',
+    'mlfq': 'algorithms.policies:MLFQPolicy'
+}
+
+@lru_cache(maxsize=1)
+def _installed_policies() -> Dict[str, str]:
+    """Returns the policies declared by installed packages; built-in names take precedence."""
+    # Imported here, as scanning installed packages is only needed for names that are not built in
+    from importlib.metadata import entry_points
+    return {
+        entry_point.name: entry_point.value
+        for entry_point in entry_points(group=ENTRY_POINT_GROUP)
+        if entry_point.name not in BUILTIN_POLICIES
+    }
+
+def available_algorithms() -> List[str]:
+    """
+    Returns the names of all registered scheduling policies, built-in ones first.
+
+    Returns:
+        List[str]: The algorithm names.
+    """
+    return list(BUILTIN_POLICIES) + sorted(_installed_policies())
+
+def get_policy(name: str) -> Type[SchedulingPolicy]:
+    """
+    Imports and returns the policy class registered under name.
+
+    Built-in names are resolved without scanning the installed packages.
+
+    Args:
+        name (str): The algorithm name.
+
+    Returns:
+        Type[SchedulingPolicy]: The policy class.
+
+    Raises:
+        ValueError: If the algorithm is unknown.
+    """
+    reference = BUILTIN_POLICIES.get(name) or _installed_policies().get(name)
+    if reference is None:
+        raise ValueError(f"Unknown scheduling algorithm '{name}'.")
+    module, _, attribute = reference.partition(':')
+    return getattr(import_module(module), attribute)
+
+def create_policy(name: str, time_quantum: Optional[int] = None, aging_rate: Optional[float] = None) -> SchedulingPolicy:
+    """
+    Creates a fresh instance of the named policy.
+
+    Args:
+        name (str): The algorithm name.
+        time_quantum (Optional[int]): The time quantum, passed only to policies that use one.
+        aging_rate (Optional[float]): The priority aging rate, passed only to policies that support aging.
+
+    Returns:
+        SchedulingPolicy: The policy, ready for one simulation.
+
+    Raises:
+        ValueError: If the algorithm is unknown or the time quantum or aging rate is invalid.
+    """
+    policy_class = get_policy(name)
+    if policy_class.uses_quantum:
+        return policy_class(time_quantum)
+    if policy_class.uses_aging and aging_rate is not None:
+        return policy_class(aging_rate)
+    return policy_class()
+
+def run_algorithm(
+    name: str,
+    processes: Processes,
+    time_quantum: Optional[int] = None,
+    stats: Optional[SchedulerStats] = None,
+    aging_rate: Optional[float] = None
+) -> Tuple[Processes, Timeline]:
+    """
+    Runs the named algorithm on the given processes.
+
+    Args:
+        name (str): The algorithm name.
+        processes (Processes): The list of processes or ProcessTable to schedule.
+        time_quantum (Optional[int]): The time quantum, required for Round Robin scheduling.
+        stats (Optional[SchedulerStats]): Collects decision counters and phase timings, if given.
+        aging_rate (Optional[float]): The priority aging rate, used by the priority schedulers.
+
+    Returns:
+        Tuple[Processes, Timeline]: The scheduled processes and the execution timeline.
+
+    Raises:
+        ValueError: If the algorithm is unknown or the time quantum or aging rate is invalid.
+    """
+    return create_policy(name, time_quantum, aging_rate).schedule(processes, stats)
+
+def simulate(
+    name: str,
+    workload: Processes,
+    time_quantum: Optional[int] = None,
+    stats: Optional[SchedulerStats] = None,
+    aging_rate: Optional[float] = None
+) -> Tuple[ProcessTable, Timeline]:
+    """
+    Runs the named algorithm without modifying the workload.
+
+    The results are written to a result table that shares the workload's input columns,
+    so any number of simulations, including concurrent ones in separate threads, can use
+    one loaded workload.
+
+    Args:
+        name (str): The algorithm name.
+        workload (Processes): The list of processes or ProcessTable to schedule; it is only read.
+        time_quantum (Optional[int]): The time quantum, required for Round Robin scheduling.
+        stats (Optional[SchedulerStats]): Collects decision counters and phase timings, if given.
+        aging_rate (Optional[float]): The priority aging rate, used by the priority schedulers.
+
+    Returns:
+        Tuple[ProcessTable, Timeline]: The scheduled processes and the execution timeline.
+
+    Raises:
+        ValueError: If the algorithm is unknown or the time quantum or aging rate is invalid.
+    """
+    return run_algorithm(name, result_table(workload), time_quantum, stats, aging_rate)
+
+def simulate_streamed(
+    name: str,
+    workload: Processes,
+    add_segment: Callable[[int, int, int], None],
+    time_quantum: Optional[int] = None,
+    aging_rate: Optional[float] = None
+) -> ProcessTable:
+    """
+    Runs the named algorithm without modifying the workload, handing each segment to add_segment as it is produced.
+
+    The segments come from the policy's events, the engine behind run_algorithm, so the
+    results and segments are the same and its shortcuts, such as the Round Robin
+    fast-forward, apply. The timeline is never held in memory, so a trace writer's add
+    method can stream it to a file.
+
+    Args:
+        name (str): The algorithm name.
+        workload (Processes): The list of processes or ProcessTable to schedule; it is only read.
+        add_segment (Callable[[int, int, int], None]): Called with the process id, start time and
+            duration of each segment, in time order.
+        time_quantum (Optional[int]): The time quantum, required for Round Robin scheduling.
+        aging_rate (Optional[float]): The priority aging rate, used by the priority schedulers.
+
+    Returns:
+        ProcessTable: The scheduled processes, ordered like the result of run_algorithm.
+
+    Raises:
+        ValueError: If the algorithm is unknown or the time quantum or aging rate is invalid.
+    """
+    policy = create_policy(name, time_quantum, aging_rate)
+    table = result_table(workload)
+    ids, arrival_times, burst_times, priorities = read_columns(workload)
+    jobs = _arrival_ordered_jobs(arrival_times, burst_times, priorities)
+    completion_order, start_times, completion_times, _ = _collect(
+        policy.events(jobs), ids, len(arrival_times), add_segment=add_segment
+    )
+    write_results(table, start_times, completion_times)
+    if policy.returns_input_order():
+        return table
+    return table.take(completion_order)
@@ -0,0 +1,323 @@
+import heapq
+from time import perf_counter
+from typing import Dict, List, Optional, Sequence
+import numpy as np
+from models.process import Process
+from models.timeline import IDLE, Timeline
+from algorithms.policy import Task
+from algorithms.registry import create_policy
+from utils.instrumentation import SchedulerStats
+
+class Simulator:
+    """
+    An incremental simulation that keeps its clock and ready queue between calls.
+
+    Processes can be submitted at any time, as long as they do not arrive before the
+    current simulation time, and the simulation advances only as far as asked. Each call
+    costs only the work from the current time onward. The decisions are those of the
+    shared simulation core, so submitting a whole workload up front and running until idle
+    gives the same results as the batch scheduling functions.
+
+    Decisions due exactly at the current time are made on the next call, so a process
+    submitted with arrival_time equal to the current time is still considered by them.
+
+    Once per round, full rounds in which no task completes and nothing arrives are run
+    in one step (SchedulingPolicy.full_rounds), so a Round Robin simulation costs no more
+    than algorithms.event_engine.round_robin_events however long the bursts are.
+
+    Attributes:
+        time (int): The current simulation time.
+        timeline (Timeline): The execution segments completed so far.
+    """
+
+    def __init__(
+        self,
+        algorithm: str,
+        time_quantum: Optional[int] = None,
+        stats: Optional[SchedulerStats] = None,
+        aging_rate: Optional[float] = None
+    ):
+        """
+        Args:
+            algorithm (str): The policy name, e.g. 'fcfs', 'sjf', 'srtf' or 'round_robin'.
+            time_quantum (Optional[int]): The time quantum, required for Round Robin scheduling.
+            stats (Optional[SchedulerStats]): Collects decision counters and phase timings, if given.
+            aging_rate (Optional[float]): The priority aging rate, used by the priority policies.
+
+        Raises:
+            ValueError: If the algorithm is unknown or the time quantum or aging rate is invalid.
+        """
+        self._policy = create_policy(algorithm, time_quantum, aging_rate)
+        if stats is None:
+            self._on_arrival = self._policy.on_arrival
+            self._select_next = self._policy.select_next
+            self._on_preempt = self._policy.on_preempt
+        else:
+            self._on_arrival, self._select_next, self._on_preempt = stats.policy_hooks(self._policy)
+            self._record = stats.timed(self._record, 'bookkeeping')
+            self._complete = stats.timed(self._complete, 'bookkeeping')
+            self._skip_rounds = stats.full_rounds(self._skip_rounds)
+        self._stats = stats
+        # Index of the task in the last recorded segment and whether it has completed
+        self._last_index = None
+        self._last_completed = True
+        self.time = 0
+        # Time of the last simulated event; idle time after it is recorded once the CPU is busy again
+        self._clock = 0
+        self.timeline = Timeline()
+        # Submitted processes that have not arrived yet: (arrival_time, submission order)
+        self._arrivals = []
+        # Processes in the system by submission order, until they complete
+        self._processes: Dict[int, Process] = {}
+        self._submitted = 0
+        self._running: Optional[Task] = None
+        self._segment_start = 0
+        self._slice_end = 0
+        # Number of dispatches left before the next check for full rounds
+        self._slices_until_check = 0
+
+    def submit(self, process: Process, index: Optional[int] = None):
+        """
+        Adds a process to the simulation.
+
+        Args:
+            process (Process): The process to schedule; its results are set when it completes.
+            index (Optional[int]): The tie-breaking order among processes with equal keys, like
+                the input position in the batch functions; defaults to the submission order. It
+                must differ from that of every process in the system.
+
+        Raises:
+            ValueError: If the process arrives before the current simulation time.
+        """
+        if process.arrival_time < self.time:
+            raise ValueError(
+                f"Process {process.id} arrives at {process.arrival_time}, before the current simulation time {self.time}."
+            )
+        if index is None:
+            index = self._submitted
+        self._submitted += 1
+        self._processes[index] = process
+        heapq.heappush(self._arrivals, (process.arrival_time, index))
+
+    def advance_to(self, time: int) -> List[Process]:
+        """
+        Runs the simulation up to the given time.
+
+        Args:
+            time (int): The time to advance to; it must not be before the current time.
+
+        Returns:
+            List[Process]: The processes that completed, in completion order.
+
+        Raises:
+            ValueError: If the time is before the current simulation time.
+        """
+        if time < self.time:
+            raise ValueError(f"Cannot advance to {time}, before the current simulation time {self.time}.")
+        completed = self._run(time)
+        self.time = time
+        return completed
+
+    def run_until_idle(self) -> List[Process]:
+        """
+        Runs the simulation until every submitted process has completed.
+
+        Returns:
+            List[Process]: The processes that completed, in completion order.
+        """
+        completed = self._run(None)
+        self.time = max(self.time, self._clock)
+        return completed
+
+    def pop_segments(self) -> Timeline:
+        """
+        Removes and returns the finished execution segments, so long runs can be streamed in bounded memory.
+
+        The last segment stays in the timeline, since it may still be extended by the next one.
+
+        Returns:
+            Timeline: The segments before the last one, in time order.
+        """
+        timeline = self.timeline
+        if len(timeline) < 2:
+            return Timeline()
+        self.timeline = Timeline.from_arrays(*(column[-1:] for column in
+                                               (timeline.process_ids, timeline.start_times, timeline.durations)))
+        for column in (timeline.process_ids, timeline.start_times, timeline.durations):
+            del column[-1]
+        return timeline
+
+    @property
+    def idle(self) -> bool:
+        """Whether no process is running, ready or waiting to arrive."""
+        return self._running is None and not self._policy and not self._arrivals
+
+    def _admit(self, time: int):
+        """Hands the processes that have arrived by time to the policy as one batch."""
+        arrivals = self._arrivals
+        if not arrivals or arrivals[0][0] > time:
+            return
+        batch = []
+        while arrivals and arrivals[0][0] <= time:
+            arrival_time, index = heapq.heappop(arrivals)
+            process = self._processes[index]
+            batch.append(Task(index, arrival_time, process.burst_time, process.priority))
+        self._on_arrival(batch, time)
+
+    def _record(self, task: Task, end_time: int):
+        """Adds the running task's segment up to end_time to the timeline."""
+        self.timeline.append(self._processes[task.index].id, self._segment_start, end_time - self._segment_start)
+        if self._stats is not None and task.index != self._last_index:
+            self._count_switch(task.index)
+
+    def _count_switch(self, index: int):
+        """Counts the CPU passing to another task, as SchedulerStats.observe does for the engines."""
+        if self._last_index is not None:
+            self._stats.context_switches += 1
+        if not self._last_completed:
+            self._stats.preemptions += 1
+        self._last_index = index
+        self._last_completed = False
+
+    def _skip_rounds(self, rounds: int, tasks: Sequence[Task], time: int) -> int:
+        """Runs the given number of full rounds of the queued tasks and returns the time they end."""
+        quantum = self._policy.quantum
+        slices = [(self._processes[task.index].id, quantum(task)) for task in tasks]
+        slice_start = time
+        for task, (_, length) in zip(tasks, slices):
+            # Record start_time at first CPU allocation
+            if task.start_time is None:
+                task.start_time = slice_start
+            task.remaining -= rounds * length
+            slice_start += length
+        round_length = slice_start - time
+        if self._stats is not None:
+            if tasks[0].index != self._last_index:
+                self._count_switch(tasks[0].index)
+            if len(tasks) > 1:
+                # Every later slice takes the CPU from a task that is still running
+                switches = rounds * len(tasks) - 1
+                self._stats.context_switches += switches
+                self._stats.preemptions += switches
+                self._last_index = tasks[-1].index
+        if len(slices) == 1:
+            # A lone task's slices form one run
+            self.timeline.append(slices[0][0], time, rounds * round_length)
+            return time + rounds * round_length
+        process_ids = [process_id for process_id, _ in slices]
+        if len(set(process_ids)) < len(process_ids):
+            # Slices of processes sharing an id may merge, so they go through append
+            append = self.timeline.append
+            for _ in range(rounds):
+                for process_id, length in slices:
+                    append(process_id, time, length)
+                    time += length
+            return time
+        # Only the first slice can continue the last segment; the rest are added as whole columns
+        lengths = np.array([length for _, length in slices], dtype=np.int64)
+        offsets = np.cumsum(lengths) - lengths
+        starts = (time + offsets + round_length * np.arange(rounds, dtype=np.int64)[:, None]).ravel()
+        timeline = self.timeline
+        timeline.append(process_ids[0], time, slices[0][1])
+        timeline.process_ids.frombytes(np.tile(np.array(process_ids, dtype=np.int64), rounds)[1:].tobytes())
+        timeline.start_times.frombytes(starts[1:].tobytes())
+        timeline.durations.frombytes(np.tile(lengths, rounds)[1:].tobytes())
+        return time + rounds * round_length
+
+    def _complete(self, task: Task, time: int) -> Process:
+        """Stores the results of a finished task on its process."""
+        process = self._processes.pop(task.index)
+        process.start_time = task.start_time
+        process.completion_time = time
+        process.turnaround_time = process.completion_time - process.arrival_time
+        process.waiting_time = process.turnaround_time - process.burst_time
+        process.remaining_burst_time = 0
+        self._last_completed = True
+        return process
+
+    def _run(self, horizon: Optional[int]) -> List[Process]:
+        """
+        Processes every event before horizon, or every event if horizon is None.
+
+        Mirrors algorithms.policy.policy_events, stopping instead of deciding at the horizon.
+        """
+        stats = self._stats
+        if stats is not None:
+            # Time not spent in the policy hooks or on bookkeeping counts as dispatch
+            started = perf_counter()
+            measured = sum(stats.phase_seconds.values())
+        policy = self._policy
+        arrivals = self._arrivals
+        completed = []
+        time = self._clock
+        task = self._running
+
+        while True:
+            if task is None:
+                if not policy:
+                    if not arrivals or (horizon is not None and arrivals[0][0] >= horizon):
+                        break
+                    # Skip idle gaps in a single step
+                    if time < arrivals[0][0]:
+                        if policy.record_idle:
+                            self.timeline.append(IDLE, time, arrivals[0][0] - time)
+                        time = arrivals[0][0]
+                    self._slices_until_check = 0
+                elif horizon is not None and time >= horizon:
+                    break
+
+                # Admit all processes that have arrived by the current time
+                self._admit(time)
+                if self._slices_until_check == 0:
+                    self._slices_until_check = len(policy)
+                    until = arrivals[0][0] if arrivals else None
+                    if horizon is not None and (until is None or horizon < until):
+                        until = horizon
+                    rounds, tasks = policy.full_rounds(time, until)
+                    if rounds > 0:
+                        time = self._skip_rounds(rounds, tasks, time)
+                self._slices_until_check -= 1
+                task = self._select_next(time)
+                # Record start_time at first CPU allocation
+                if task.start_time is None:
+                    task.start_time = time
+                self._segment_start = time
+                run_time = task.remaining
+                limit = policy.quantum(task)
+                if limit is not None and limit < run_time:
+                    run_time = limit
+                self._slice_end = time + run_time
+
+            # A preemptive policy is consulted at every arrival before the slice ends
+            if policy.preemptive and arrivals and arrivals[0][0] < self._slice_end:
+                arrival_time = arrivals[0][0]
+                if horizon is not None and arrival_time >= horizon:
+                    break
+                task.remaining -= arrival_time - time
+                time = arrival_time
+                self._admit(time)
+                if policy.should_preempt(task, time):
+                    self._on_preempt(task, time)
+                    self._record(task, time)
+                    task = None
+                continue
+
+            if horizon is not None and self._slice_end >= horizon:
+                break
+            task.remaining -= self._slice_end - time
+            time = self._slice_end
+            self._record(task, time)
+            if task.remaining == 0:
+                completed.append(self._complete(task, time))
+            else:
+                # The quantum expired: arrivals during the slice are queued ahead of the task
+                self._admit(time)
+                self._on_preempt(task, time)
+            task = None
+
+        self._running = task
+        self._clock = time
+        if stats is not None:
+            elapsed = perf_counter() - started
+            stats.phase_seconds['dispatch'] += max(elapsed - (sum(stats.phase_seconds.values()) - measured), 0.0)
+        return completed
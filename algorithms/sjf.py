@@ -1,59 +1,29 @@
-from typing import List, Dict, Tuple
-from models.process import Process
+from typing import Optional, Tuple
+from models.timeline import Timeline
+from models.process_table import Processes, read_columns, write_results, take_rows
+from algorithms.event_engine import non_preemptive_schedule
+from utils.instrumentation import SchedulerStats
 
-def sjf_scheduling(processes: List[Process]) -> Tuple[List[Process], List[Dict]]:
+def sjf_scheduling(processes: Processes, stats: Optional[SchedulerStats] = None) -> Tuple[Processes, Timeline]:
     """
     Performs Shortest Job First scheduling on the given list of processes.
 
     Args:
-        processes (List[Process]): The list of processes to schedule.
+        processes (Processes): The list of processes or ProcessTable to schedule.
+        stats (Optional[SchedulerStats]): Collects decision counters and phase timings, if given.
 
     Returns:
-        Tuple[List[Process], List[Dict]]: The list of processes with updated scheduling attributes and the execution timeline.
+        Tuple[Processes, Timeline]: The processes in completion order with updated scheduling attributes and the execution timeline.
     """
     if not processes:
-        return [], []
+        return [], Timeline()
 
-    completed_processes = []
-    gantt_chart = []
-    current_time = 0
-    ready_queue = []
-    processes_left = processes.copy()
+    # Select the process with the shortest burst time
+    ids, arrival_times, burst_times, _ = read_columns(processes)
+    dispatch_order, start_times, completion_times, gantt_chart = non_preemptive_schedule(
+        ids, arrival_times, burst_times, burst_times, stats=stats
+    )
 
-    while processes_left or ready_queue:
-        # Add all processes that have arrived by current_time to the ready queue
-        arrived_processes = [p for p in processes_left if p.arrival_time <= current_time]
-        for process in arrived_processes:
-            ready_queue.append(process)
-            processes_left.remove(process)
+    write_results(processes, start_times, completion_times)
 
-        if ready_queue:
-            # Select the process with the shortest burst time
-            ready_queue.sort(key=lambda p: p.burst_time)
-            current_process = ready_queue.pop(0)
-
-            # Record start time
-            if current_time < current_process.arrival_time:
-                current_time = current_process.arrival_time
-            current_process.start_time = current_time
-
-            # Record execution event for Gantt chart
-            gantt_chart.append({
-                'process_id': current_process.id,
-                'start_time': current_time,
-                'duration': current_process.burst_time
-            })
-
-            # Update current time and process attributes
-            current_time += current_process.burst_time
-            current_process.completion_time = current_time
-            current_process.turnaround_time = current_process.completion_time - current_process.arrival_time
-            current_process.waiting_time = current_process.start_time - current_process.arrival_time
-
-            completed_processes.append(current_process)
-        else:
-            # Advance time to the next process arrival
-            next_arrival = min(p.arrival_time for p in processes_left)
-            current_time = next_arrival
-
-    return completed_processes, gantt_chart
+    return take_rows(processes, dispatch_order), gantt_chart
@@ -0,0 +1,313 @@
+import heapq
+import time as clock
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+from models.timeline import IDLE, Timeline
+from models.process_table import Processes, read_columns, write_results
+from algorithms.event_engine import ARRIVAL, Job, _arrival_ordered_jobs
+from algorithms.policy import SchedulingPolicy, Task
+from algorithms.registry import create_policy
+from utils.instrumentation import SchedulerStats
+
+class SMPSchedule(NamedTuple):
+    """
+    The result of a multi-core simulation.
+
+    Attributes:
+        processes (Processes): The processes with updated scheduling attributes, in input order.
+        timelines (List[Timeline]): The execution timeline of each core.
+        core_metrics (List[Dict[str, float]]): Per-core busy time, utilization, dispatches, migrations and steals.
+        migrations (int): The number of times a process resumed on a different core than it last ran on.
+    """
+    processes: Processes
+    timelines: List[Timeline]
+    core_metrics: List[Dict[str, float]]
+    migrations: int
+
+def smp_events(
+    jobs: Iterable[Job],
+    ids: Sequence[int],
+    n: int,
+    queues: List[SchedulingPolicy],
+    cores: int,
+    work_stealing: bool = True,
+    stats: Optional[SchedulerStats] = None
+) -> Tuple[List[Optional[int]], List[int], List[Timeline], List[Dict[str, float]]]:
+    """
+    Runs an event-driven multi-core simulation over an arrival-ordered stream of jobs.
+
+    A heap holds the end of the running slice of every busy core, and time jumps straight
+    to the next slice end or arrival. Each ready queue is a policy instance: one per core,
+    or a single queue shared by all cores. With per-core queues an arrival goes to the
+    lowest-numbered idle core, or else to the next core in turn, and a core whose queue is
+    empty steals the next task of the longest queue.
+
+    Arrivals reach a queue when its policy would have seen them on a single CPU: at once
+    for preemptive policies, otherwise at the queue's next dispatch or quantum expiry. On
+    one core the simulation therefore makes exactly the single-CPU decisions, and for
+    policies that record idle time, such as FCFS, each core's timeline includes its idle
+    gaps before a dispatch as the single-CPU timeline does. With a shared
+    queue, a preemptive policy preempts the lowest-numbered core whose task must yield.
+
+    Args:
+        jobs (Iterable[Job]): (index, arrival_time, burst_time, priority) tuples in arrival order.
+        ids (Sequence[int]): The process identifiers used in the execution timelines.
+        n (int): The number of jobs.
+        queues (List[SchedulingPolicy]): Fresh policy instances, one per core or a single shared one.
+        cores (int): The number of cores.
+        work_stealing (bool): Let a core with an empty queue steal from the longest queue.
+        stats (Optional[SchedulerStats]): Collects decision counters and phase timings, if given.
+
+    Returns:
+        Tuple[List[Optional[int]], List[int], List[Timeline], List[Dict[str, float]]]: The start and
+        completion time of each process, the timeline of each core and the per-core counters.
+    """
+    shared = len(queues) == 1 and cores > 1
+    queue_of = [0] * cores if shared else list(range(cores))
+    preemptive = queues[0].preemptive
+    if stats is not None:
+        jobs = stats.timed_arrivals(jobs)
+        hooks = [stats.policy_hooks(queue) for queue in queues]
+    else:
+        hooks = [(queue.on_arrival, queue.select_next, queue.on_preempt) for queue in queues]
+    # Arrivals not yet handed to each queue's policy
+    inboxes: List[List[Task]] = [[] for _ in queues]
+    # Tasks waiting in each queue, inbox included, so stealing need not ask the policies
+    waiting = [0] * len(queues)
+    total_waiting = 0
+
+    running: List[Optional[Task]] = [None] * cores
+    segment_start = [0] * cores
+    # Time up to which the running task's remaining time has been charged
+    charged = [0] * cores
+    # Bumped whenever a core's slice ends early, invalidating its heap entry
+    version = [0] * cores
+    busy = [0] * cores
+    dispatches = [0] * cores
+    migrations_in = [0] * cores
+    steals = [0] * cores
+    timelines = [Timeline() for _ in range(cores)]
+    # The end of each core's last segment, from which an idle gap is recorded for policies that record idle time
+    free_since = [0] * cores
+    record_idle = queues[0].record_idle
+    idle = list(range(cores))
+    is_idle = [True] * cores
+    # Heap entries are (slice end, core, version)
+    slice_ends = []
+    start_times: List[Optional[int]] = [None] * n
+    completion_times = [0] * n
+    next_core = 0
+
+    def admit(queue: int, time: int):
+        if inboxes[queue]:
+            hooks[queue][0](inboxes[queue], time)
+            inboxes[queue] = []
+
+    def stop(core: int, time: int) -> Task:
+        task = running[core]
+        task.remaining -= time - charged[core]
+        busy[core] += time - segment_start[core]
+        timelines[core].append(ids[task.index], segment_start[core], time - segment_start[core])
+        free_since[core] = time
+        running[core] = None
+        version[core] += 1
+        return task
+
+    def dispatch(core: int, time: int) -> bool:
+        nonlocal total_waiting
+        queue = queue_of[core]
+        if waiting[queue]:
+            admit(queue, time)
+            task = hooks[queue][1](time)
+            waiting[queue] -= 1
+        elif work_stealing and total_waiting:
+            victim = max(range(cores), key=waiting.__getitem__)
+            admit(victim, time)
+            task = hooks[victim][1](time)
+            waiting[victim] -= 1
+            steals[core] += 1
+        else:
+            return False
+        total_waiting -= 1
+
+        if task.core is not None and task.core != core:
+            migrations_in[core] += 1
+        if stats is not None and timelines[core] and timelines[core].process_ids[-1] != ids[task.index]:
+            stats.context_switches += 1
+        if record_idle and time > free_since[core]:
+            timelines[core].append(IDLE, free_since[core], time - free_since[core])
+        task.core = core
+        if task.start_time is None:
+            task.start_time = time
+        running[core] = task
+        segment_start[core] = charged[core] = time
+        run_time = task.remaining
+        limit = queues[queue].quantum(task)
+        if limit is not None and limit < run_time:
+            run_time = limit
+        version[core] += 1
+        heapq.heappush(slice_ends, (time + run_time, core, version[core]))
+        dispatches[core] += 1
+        return True
+
+    if stats is not None:
+        queue_seconds = stats.phase_seconds['admission'] + stats.phase_seconds['selection']
+        started = clock.perf_counter()
+    jobs = iter(jobs)
+    pending = next(jobs, None)
+
+    while True:
+        # Drop slices that ended early
+        while slice_ends and slice_ends[0][2] != version[slice_ends[0][1]]:
+            heapq.heappop(slice_ends)
+        if slice_ends:
+            time = slice_ends[0][0]
+            if pending is not None and pending[ARRIVAL] < time:
+                time = pending[ARRIVAL]
+        elif pending is not None:
+            time = pending[ARRIVAL]
+        else:
+            break
+
+        # Cores that may need a new task at this instant
+        touched = []
+        expired = []
+        targets = []
+        while slice_ends and slice_ends[0][0] == time:
+            _, core, slice_version = heapq.heappop(slice_ends)
+            if slice_version != version[core]:
+                continue
+            task = stop(core, time)
+            touched.append(core)
+            if task.remaining == 0:
+                start_times[task.index] = task.start_time
+                completion_times[task.index] = time
+            else:
+                expired.append((core, task))
+
+        if pending is not None and pending[ARRIVAL] == time:
+            while pending is not None and pending[ARRIVAL] == time:
+                task = Task(*pending)
+                pending = next(jobs, None)
+                if shared:
+                    core = 0
+                elif idle:
+                    core = heapq.heappop(idle)
+                    is_idle[core] = False
+                    touched.append(core)
+                else:
+                    core = next_core
+                    next_core = (next_core + 1) % cores
+                inboxes[queue_of[core]].append(task)
+                waiting[queue_of[core]] += 1
+                total_waiting += 1
+                targets.append(core)
+
+            if preemptive:
+                for queue in set(queue_of[core] for core in targets):
+                    admit(queue, time)
+
+        # Arrivals during an expired slice are queued ahead of the expired task
+        for core, task in expired:
+            admit(queue_of[core], time)
+            hooks[queue_of[core]][2](task, time)
+            waiting[queue_of[core]] += 1
+            total_waiting += 1
+            if stats is not None:
+                stats.preemptions += 1
+
+        if len(touched) > 1:
+            touched = sorted(set(touched))
+        for core in touched:
+            if running[core] is None and not is_idle[core] and not dispatch(core, time):
+                is_idle[core] = True
+                heapq.heappush(idle, core)
+        if shared:
+            while idle and waiting[0]:
+                core = heapq.heappop(idle)
+                is_idle[core] = False
+                dispatch(core, time)
+
+        if preemptive and targets:
+            # Only tasks that were already running are checked, and a preempted core takes
+            # its new task at once, so one arrival preempts at most one core
+            for core in (range(cores) if shared else sorted(set(targets))):
+                task = running[core]
+                # Free cores may already have taken every arrival
+                if task is None or segment_start[core] == time or not waiting[queue_of[core]]:
+                    continue
+                task.remaining -= time - charged[core]
+                charged[core] = time
+                if queues[queue_of[core]].should_preempt(task, time):
+                    hooks[queue_of[core]][2](stop(core, time), time)
+                    waiting[queue_of[core]] += 1
+                    total_waiting += 1
+                    if stats is not None:
+                        stats.preemptions += 1
+                    dispatch(core, time)
+
+    if stats is not None:
+        # Everything outside the queue hooks counts as dispatch
+        queue_seconds = stats.phase_seconds['admission'] + stats.phase_seconds['selection'] - queue_seconds
+        stats.phase_seconds['dispatch'] += max(clock.perf_counter() - started - queue_seconds, 0.0)
+
+    core_metrics = [
+        {
+            'core': core,
+            'busy_time': busy[core],
+            'dispatches': dispatches[core],
+            'migrations': migrations_in[core],
+            'steals': steals[core],
+            'segments': len(timelines[core])
+        }
+        for core in range(cores)
+    ]
+    return start_times, completion_times, timelines, core_metrics
+
+def smp_scheduling(
+    processes: Processes,
+    algorithm: str,
+    cores: int,
+    time_quantum: Optional[int] = None,
+    global_queue: bool = False,
+    work_stealing: bool = True,
+    stats: Optional[SchedulerStats] = None,
+    aging_rate: Optional[float] = None
+) -> SMPSchedule:
+    """
+    Schedules the processes on several cores with one of the registered policies.
+
+    Args:
+        processes (Processes): The list of processes or ProcessTable to schedule.
+        algorithm (str): The policy name, e.g. 'fcfs', 'sjf', 'srtf', 'round_robin' or 'priority_preemptive'.
+        cores (int): The number of cores.
+        time_quantum (Optional[int]): The time quantum, required for Round Robin scheduling.
+        global_queue (bool): Share one ready queue between all cores instead of one queue per core.
+        work_stealing (bool): With per-core queues, let a core with an empty queue steal work.
+        stats (Optional[SchedulerStats]): Collects decision counters and phase timings, if given.
+        aging_rate (Optional[float]): The priority aging rate, used by the priority policies.
+
+    Returns:
+        SMPSchedule: The processes, per-core timelines, per-core metrics and migration count.
+
+    Raises:
+        ValueError: If the number of cores is not positive, or the algorithm, time quantum or aging rate is invalid.
+    """
+    if cores <= 0:
+        raise ValueError("Number of cores must be a positive integer.")
+    queues = [create_policy(algorithm, time_quantum, aging_rate) for _ in range(1 if global_queue else cores)]
+    if not processes:
+        return SMPSchedule([], [Timeline() for _ in range(cores)], [], 0)
+
+    ids, arrival_times, burst_times, priorities = read_columns(processes)
+    jobs = _arrival_ordered_jobs(arrival_times, burst_times, priorities)
+    start_times, completion_times, timelines, core_metrics = smp_events(
+        jobs, ids, len(arrival_times), queues, cores, work_stealing, stats
+    )
+    write_results(processes, start_times, completion_times)
+
+    # Utilization is measured over the span from the first arrival to the last completion
+    span = max(completion_times) - min(arrival_times)
+    for metrics in core_metrics:
+        metrics['utilization'] = metrics['busy_time'] / span if span else 0.0
+    migrations = sum(metrics['migrations'] for metrics in core_metrics)
+    return SMPSchedule(processes, timelines, core_metrics, migrations)
@@ -0,0 +1,92 @@
+from typing import Dict, Iterable, Iterator, Optional, Tuple, Union
+from models.process import Process
+from models.timeline import IDLE, Segment
+from algorithms.event_engine import (
+    SEGMENT, COMPLETION, ARRIVAL, BURST, PRIORITY, Job,
+    preemptive_events, non_preemptive_events, round_robin_events, instrumented_events
+)
+from utils.instrumentation import SchedulerStats
+
+StreamEvent = Tuple[str, Union[Process, Segment]]
+
+def _jobs(processes: Iterable[Process], in_flight: Dict[int, Process]) -> Iterator[Job]:
+    """
+    Turns an arrival-ordered stream of processes into job tuples.
+
+    Each process is registered in in_flight when it is pulled, so the caller can map
+    events back to it until it completes.
+
+    Raises:
+        ValueError: If the processes are not in arrival order.
+    """
+    last_arrival = None
+    for index, process in enumerate(processes):
+        if last_arrival is not None and process.arrival_time < last_arrival:
+            raise ValueError(
+                f"Process {process.id} arrives at {process.arrival_time}, before the previous arrival at {last_arrival}. "
+                "Streamed processes must be in arrival order."
+            )
+        last_arrival = process.arrival_time
+        in_flight[index] = process
+        yield index, process.arrival_time, process.burst_time, process.priority
+
+def stream_scheduling(
+    processes: Iterable[Process],
+    algorithm: str,
+    time_quantum: Optional[int] = None,
+    stats: Optional[SchedulerStats] = None
+) -> Iterator[StreamEvent]:
+    """
+    Schedules a stream of processes and yields results as soon as they are produced.
+
+    Processes are pulled from the iterable only when the simulation reaches their arrival
+    time, and are released once they complete, so memory is bounded by the ready queue
+    rather than by the length of the trace. The iterable may be endless.
+
+    Args:
+        processes (Iterable[Process]): The processes to schedule, in arrival order.
+        algorithm (str): One of 'fcfs', 'sjf', 'srtf', 'priority_non_preemptive', 'priority_preemptive' or 'round_robin'.
+        time_quantum (Optional[int]): The time quantum, required for Round Robin scheduling.
+        stats (Optional[SchedulerStats]): Collects decision counters and phase timings, if given.
+
+    Yields:
+        StreamEvent: ('segment', (process_id, start_time, duration)) for each execution segment,
+        with IDLE as the process id of idle time, and ('completion', process) with updated
+        scheduling attributes for each finished process.
+
+    Raises:
+        ValueError: If the algorithm is unknown, the time quantum is invalid or the processes are out of order.
+    """
+    in_flight: Dict[int, Process] = {}
+    jobs = _jobs(processes, in_flight)
+
+    if algorithm == 'fcfs':
+        events = instrumented_events(non_preemptive_events, jobs, ARRIVAL, record_idle=True, stats=stats)
+    elif algorithm == 'sjf':
+        events = instrumented_events(non_preemptive_events, jobs, BURST, stats=stats)
+    elif algorithm == 'priority_non_preemptive':
+        events = instrumented_events(non_preemptive_events, jobs, PRIORITY, stats=stats)
+    elif algorithm == 'srtf':
+        events = instrumented_events(preemptive_events, jobs, True, stats=stats)
+    elif algorithm == 'priority_preemptive':
+        events = instrumented_events(preemptive_events, jobs, False, stats=stats)
+    elif algorithm == 'round_robin':
+        if time_quantum is None or time_quantum <= 0:
+            raise ValueError("Time quantum must be a positive integer.")
+        events = instrumented_events(round_robin_events, jobs, time_quantum, stats=stats)
+    else:
+        raise ValueError(f"Unknown scheduling algorithm '{algorithm}'.")
+    if stats is not None:
+        events = stats.observe(events)
+
+    for kind, index, time, value in events:
+        if kind == SEGMENT:
+            yield SEGMENT, (IDLE if index is None else in_flight[index].id, time, value)
+        else:
+            process = in_flight.pop(index)
+            process.start_time = time
+            process.completion_time = value
+            process.turnaround_time = process.completion_time - process.arrival_time
+            process.waiting_time = process.turnaround_time - process.burst_time
+            process.remaining_burst_time = 0
+            yield COMPLETION, process
@@ -0,0 +1,277 @@
+import argparse
+import gc
+import json
+import sys
+import time
+import tracemalloc
+from typing import Dict, List, Optional, Sequence
+import numpy as np
+from models.process_table import ProcessTable
+from algorithms.batched import batch_simulate
+from algorithms.registry import available_algorithms, get_policy, run_algorithm
+from utils.workload_generator import generate_workload, generate_workload_batch
+
+# Scenario name -> (arrival pattern, burst distribution, priority distribution)
+SCENARIOS = {
+    'poisson': ('poisson', 'exponential', 'uniform'),
+    'heavy_tail': ('poisson', 'pareto', 'uniform'),
+    'storms': ('bursty', 'exponential', 'uniform'),
+    'skewed_priority': ('poisson', 'exponential', 'skewed')
+}
+SIZES = (1_000, 10_000, 100_000, 1_000_000)
+TIME_QUANTUM = 4
+DEFAULT_BASELINE = 'benchmark_baseline.json'
+
+
+def _run(algorithm: str, workload: ProcessTable):
+    """Runs one algorithm on a fresh table sharing the workload's input columns."""
+    processes = ProcessTable.from_columns(workload.arrival_times, workload.burst_times, workload.priorities)
+    return run_algorithm(algorithm, processes, TIME_QUANTUM if get_policy(algorithm).uses_quantum else None)
+
+
+def measure(algorithm: str, workload: ProcessTable, repeat: int, memory: bool) -> Dict[str, float]:
+    """
+    Measures the best wall time over repeat runs and, optionally, the peak traced memory of one run.
+
+    Args:
+        algorithm (str): The algorithm name.
+        workload (ProcessTable): The workload to schedule.
+        repeat (int): The number of timed runs.
+        memory (bool): Whether to make an extra traced run to measure peak memory.
+
+    Returns:
+        Dict[str, float]: 'seconds' and, if measured, 'peak_bytes'.
+    """
+    best = float('inf')
+    for _ in range(repeat):
+        gc.collect()
+        started = time.perf_counter()
+        _run(algorithm, workload)
+        best = min(best, time.perf_counter() - started)
+    result = {'seconds': best}
+
+    if memory:
+        # Tracing slows the run down, so memory is measured separately from time
+        gc.collect()
+        tracemalloc.start()
+        try:
+            _run(algorithm, workload)
+            result['peak_bytes'] = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    return result
+
+
+def measure_batch(algorithm: str, workloads: np.ndarray, counts: np.ndarray, repeat: int) -> Dict[str, float]:
+    """
+    Measures the best wall time of batch_simulate over repeat runs of a batch of workloads.
+
+    Args:
+        algorithm (str): The algorithm name.
+        workloads (np.ndarray): The (workloads, processes, 3) batch.
+        counts (np.ndarray): The process count of each workload.
+        repeat (int): The number of timed runs.
+
+    Returns:
+        Dict[str, float]: 'seconds' and 'workloads_per_second'.
+    """
+    time_quantum = TIME_QUANTUM if get_policy(algorithm).uses_quantum else None
+    best = float('inf')
+    for _ in range(repeat):
+        gc.collect()
+        started = time.perf_counter()
+        batch_simulate(workloads, algorithm, time_quantum, counts=counts)
+        best = min(best, time.perf_counter() - started)
+    return {'seconds': best, 'workloads_per_second': len(counts) / best}
+
+
+def run_batch_benchmarks(
+    scenarios: Sequence[str],
+    algorithms: Sequence[str],
+    count: int,
+    repeat: int = 3,
+    seed: int = 0,
+    log=None
+) -> Dict[str, Dict[str, float]]:
+    """
+    Benchmarks batched simulation of many small workloads (10 to 50 processes) per scenario and algorithm.
+
+    Args:
+        scenarios (Sequence[str]): Scenario names from SCENARIOS.
+        algorithms (Sequence[str]): Algorithm names.
+        count (int): The number of workloads in each batch.
+        repeat (int): The number of timed runs per case; the best is kept.
+        seed (int): The workload seed.
+        log (Optional[TextIO]): Where to report progress, if anywhere.
+
+    Returns:
+        Dict[str, Dict[str, float]]: Measurements keyed by 'scenario/algorithm/batch-count'.
+    """
+    results = {}
+    for scenario in scenarios:
+        arrivals, bursts, priorities = SCENARIOS[scenario]
+        workloads, counts = generate_workload_batch(count, arrivals=arrivals, bursts=bursts,
+                                                    priorities=priorities, seed=seed)
+        for algorithm in algorithms:
+            key = f"{scenario}/{algorithm}/batch-{count}"
+            results[key] = measure_batch(algorithm, workloads, counts, repeat)
+            if log is not None:
+                print(f"{key:45} {results[key]['seconds']:10.4f} s  {results[key]['workloads_per_second']:12.0f} workloads/s",
+                      file=log)
+    return results
+
+
+def run_benchmarks(
+    scenarios: Sequence[str],
+    algorithms: Sequence[str],
+    sizes: Sequence[int],
+    repeat: int = 3,
+    memory: bool = True,
+    seed: int = 0,
+    log=None
+) -> Dict[str, Dict[str, float]]:
+    """
+    Benchmarks every algorithm on every scenario and size.
+
+    Args:
+        scenarios (Sequence[str]): Scenario names from SCENARIOS.
+        algorithms (Sequence[str]): Algorithm names.
+        sizes (Sequence[int]): Workload sizes in processes.
+        repeat (int): The number of timed runs per case; the best is kept.
+        memory (bool): Whether to measure peak memory.
+        seed (int): The workload seed.
+        log (Optional[TextIO]): Where to report progress, if anywhere.
+
+    Returns:
+        Dict[str, Dict[str, float]]: Measurements keyed by 'scenario/algorithm/size'.
+    """
+    results = {}
+    for scenario in scenarios:
+        arrivals, bursts, priorities = SCENARIOS[scenario]
+        for size in sizes:
+            workload = generate_workload(size, arrivals, bursts, priorities, seed=seed)
+            for algorithm in algorithms:
+                key = f"{scenario}/{algorithm}/{size}"
+                results[key] = measure(algorithm, workload, repeat, memory)
+                if log is not None:
+                    peak = results[key].get('peak_bytes')
+                    peak_text = '' if peak is None else f"  {peak / 2 ** 20:9.1f} MiB"
+                    print(f"{key:45} {results[key]['seconds']:10.4f} s{peak_text}", file=log)
+    return results
+
+
+def find_regressions(
+    results: Dict[str, Dict[str, float]],
+    baseline: Dict[str, Dict[str, float]],
+    time_tolerance: float,
+    memory_tolerance: float,
+    min_seconds: float = 0.005
+) -> List[str]:
+    """
+    Compares results against a baseline.
+
+    A case regresses when its time exceeds the baseline by more than time_tolerance
+    (plus min_seconds of absolute slack for timer noise) or its peak memory exceeds the
+    baseline by more than memory_tolerance. Cases missing from the baseline are skipped;
+    missing_cases lists them.
+
+    Args:
+        results (Dict[str, Dict[str, float]]): The new measurements.
+        baseline (Dict[str, Dict[str, float]]): The stored measurements.
+        time_tolerance (float): The allowed relative slowdown, e.g. 0.25 for 25%.
+        memory_tolerance (float): The allowed relative memory growth.
+        min_seconds (float): Absolute slack added to the time limit.
+
+    Returns:
+        List[str]: A description of each regression.
+    """
+    regressions = []
+    for key, result in results.items():
+        reference = baseline.get(key)
+        if reference is None:
+            continue
+        limit = reference['seconds'] * (1 + time_tolerance) + min_seconds
+        if result['seconds'] > limit:
+            regressions.append(f"{key}: {result['seconds']:.4f} s > {limit:.4f} s (baseline {reference['seconds']:.4f} s)")
+        if 'peak_bytes' in result and 'peak_bytes' in reference:
+            limit = reference['peak_bytes'] * (1 + memory_tolerance)
+            if result['peak_bytes'] > limit:
+                regressions.append(f"{key}: {result['peak_bytes']} B > {limit:.0f} B (baseline {reference['peak_bytes']} B)")
+    return regressions
+
+
+def missing_cases(results: Dict[str, Dict[str, float]], baseline: Dict[str, Dict[str, float]]) -> List[str]:
+    """
+    Returns the cases that find_regressions cannot compare, since the baseline has no measurement of them.
+
+    Args:
+        results (Dict[str, Dict[str, float]]): The new measurements.
+        baseline (Dict[str, Dict[str, float]]): The stored measurements.
+
+    Returns:
+        List[str]: The keys of the uncompared cases, sorted.
+    """
+    return sorted(key for key in results if key not in baseline)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the scheduling algorithms on synthetic workloads.")
+    parser.add_argument('--scenarios', nargs='+', default=list(SCENARIOS), choices=list(SCENARIOS))
+    parser.add_argument('--algorithms', nargs='+', default=available_algorithms(), choices=available_algorithms())
+    parser.add_argument('--sizes', nargs='+', type=int, default=list(SIZES))
+    parser.add_argument('--repeat', type=int, default=3, help="timed runs per case (best is kept)")
+    parser.add_argument('--no-memory', action='store_true', help="skip peak memory measurement")
+    parser.add_argument('--batch', type=int, metavar='WORKLOADS',
+                        help="instead, time batched simulation of this many workloads of 10 to 50 processes")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE, help="baseline JSON file")
+    parser.add_argument('--save-baseline', action='store_true', help="store these results as the new baseline")
+    parser.add_argument('--time-tolerance', type=float, default=0.25)
+    parser.add_argument('--memory-tolerance', type=float, default=0.10)
+    parser.add_argument('--allow-missing', action='store_true',
+                        help="pass when some cases are not in the baseline, as long as one is compared")
+    args = parser.parse_args(argv)
+
+    if args.batch is not None:
+        if args.batch <= 0:
+            parser.error("--batch must be a positive number of workloads.")
+        results = run_batch_benchmarks(args.scenarios, args.algorithms, args.batch, args.repeat, args.seed,
+                                       log=sys.stdout)
+    else:
+        results = run_benchmarks(args.scenarios, args.algorithms, args.sizes, args.repeat,
+                                 not args.no_memory, args.seed, log=sys.stdout)
+
+    if args.save_baseline:
+        with open(args.baseline, 'w') as file:
+            json.dump(results, file, indent=2, sort_keys=True)
+        print(f"\nBaseline saved to {args.baseline}.")
+        return 0
+
+    try:
+        with open(args.baseline) as file:
+            baseline = json.load(file)
+    except FileNotFoundError:
+        # Without a baseline nothing was checked, which must not pass as a clean gate
+        print(f"\nNo baseline at {args.baseline}; run with --save-baseline to create one.", file=sys.stderr)
+        return 2
+
+    missing = missing_cases(results, baseline)
+    if missing:
+        print(f"\nNot in the baseline, so not compared: {', '.join(missing)}", file=sys.stderr)
+        # A run that compared nothing must not pass as a clean gate, as with a missing baseline
+        if len(missing) == len(results) or not args.allow_missing:
+            print(f"Run with --save-baseline to update {args.baseline}.", file=sys.stderr)
+            return 2
+
+    regressions = find_regressions(results, baseline, args.time_tolerance, args.memory_tolerance)
+    if regressions:
+        print("\nRegressions:")
+        for regression in regressions:
+            print(f"  {regression}")
+        return 1
+    print("\nNo regressions against the baseline.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
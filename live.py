@@ -0,0 +1,367 @@
+import argparse
+import asyncio
+import json
+import os
+import stat
+import sys
+import time
+from typing import AsyncIterator, Dict, List, Optional, Sequence, TextIO, Tuple
+from algorithms.registry import available_algorithms
+from algorithms.simulator import Simulator
+from models.process import Process
+from models.timeline import IDLE, Timeline
+from utils.input_handler import parse_record
+from utils.report import FIELDS
+from utils.summary import Distribution
+
+DEFAULT_QUEUE_SIZE = 4096
+DEFAULT_BATCH_SIZE = 256
+DEFAULT_TICK = 0.05
+# Lines read from a regular file per thread hand-off
+READ_CHUNK = 1 << 16
+# Step durations collected before they are added to the latency distribution
+LATENCY_BATCH = 1024
+
+# Marks the end of the feed in the ingestion queue
+_END = None
+
+
+async def _pipe_lines(file) -> AsyncIterator[bytes]:
+    """Yields the lines of a pipe, FIFO or terminal through the event loop."""
+    loop = asyncio.get_running_loop()
+    reader = asyncio.StreamReader()
+    transport, _ = await loop.connect_read_pipe(lambda: asyncio.StreamReaderProtocol(reader), file)
+    try:
+        async for line in reader:
+            yield line
+    finally:
+        transport.close()
+
+
+async def _file_lines(file) -> AsyncIterator[bytes]:
+    """Yields the lines of a regular file, read in chunks on a worker thread."""
+    while True:
+        lines = await asyncio.to_thread(file.readlines, READ_CHUNK)
+        if not lines:
+            return
+        for line in lines:
+            yield line
+
+
+async def _socket_lines(source: str, listen: bool) -> AsyncIterator[bytes]:
+    """Yields the lines sent over a TCP or Unix socket, connecting to it or accepting one connection."""
+    scheme, _, address = source.partition('://')
+    if scheme == 'tcp':
+        host, _, port = address.rpartition(':')
+        if not host or not port.isdigit():
+            raise ValueError(f"Invalid TCP address '{address}'. Expected HOST:PORT.")
+    if not listen:
+        if scheme == 'tcp':
+            reader, writer = await asyncio.open_connection(host, int(port))
+        else:
+            reader, writer = await asyncio.open_unix_connection(address)
+    else:
+        connected = asyncio.get_running_loop().create_future()
+
+        def accept(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+            if not connected.done():
+                connected.set_result((reader, writer))
+            else:
+                writer.close()
+        if scheme == 'tcp':
+            server = await asyncio.start_server(accept, host, int(port))
+        else:
+            server = await asyncio.start_unix_server(accept, address)
+        async with server:
+            reader, writer = await connected
+    try:
+        async for line in reader:
+            yield line
+    finally:
+        writer.close()
+
+
+async def feed_lines(source: str, listen: bool = False) -> AsyncIterator[bytes]:
+    """
+    Yields the raw lines of a live feed.
+
+    Lines are only read as fast as they are consumed, so a slow consumer stops reading
+    and the pipe or socket buffers fill up, pushing back on the producer.
+
+    Args:
+        source (str): '-' for standard input, 'tcp://HOST:PORT', 'unix://PATH', or the path
+            of a named pipe or file.
+        listen (bool): For sockets, accept one connection instead of connecting.
+
+    Yields:
+        bytes: Each line of the feed.
+
+    Raises:
+        FileNotFoundError: If the named pipe or file does not exist.
+        ValueError: If a socket address is invalid.
+    """
+    if source.startswith(('tcp://', 'unix://')):
+        lines = _socket_lines(source, listen)
+    else:
+        if source == '-':
+            file = sys.stdin.buffer
+        else:
+            # Opening a named pipe blocks until a writer opens it
+            file = await asyncio.to_thread(open, source, 'rb')
+        mode = os.fstat(file.fileno()).st_mode
+        if stat.S_ISFIFO(mode) or stat.S_ISSOCK(mode) or stat.S_ISCHR(mode):
+            lines = _pipe_lines(file)
+        else:
+            lines = _file_lines(file)
+    async for line in lines:
+        yield line
+
+
+class LiveRun:
+    """
+    Drives an incremental simulation from a live feed of 'arrival_time burst_time priority' records.
+
+    A reader task parses the feed into a bounded queue; when the simulation falls behind,
+    the queue fills, the reader stops reading and the feed is pushed back on. The
+    simulation takes at most batch_size records per step and yields to the event loop
+    between steps, so the work done per scheduling step stays bounded.
+
+    Without a speed, records are simulated as fast as they arrive, in trace time. With a
+    speed, arrivals are replayed in real time at that many time units per second: each
+    record is admitted once the wall clock reaches its arrival, and the simulation clock
+    follows the wall clock in ticks, so completions are reported as they happen. Records
+    whose arrival is already past, because the feed is late or out of order, are
+    admitted at the current simulation time and counted as late. Once the feed ends, the
+    remaining work is simulated at once.
+
+    Completions and, optionally, execution segments are written as JSON lines. Processes
+    are numbered from 1 in feed order.
+
+    Attributes:
+        simulator (Simulator): The incremental simulation.
+        ingested (int): The number of records submitted.
+        late (int): The number of records admitted after their arrival time.
+        skipped (int): The number of invalid lines skipped.
+        latency (Distribution): The duration of each scheduling step in microseconds.
+    """
+
+    def __init__(
+        self,
+        algorithm: str,
+        time_quantum: Optional[int] = None,
+        aging_rate: Optional[float] = None,
+        output: Optional[TextIO] = None,
+        speed: Optional[float] = None,
+        segments: bool = True,
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        tick: float = DEFAULT_TICK
+    ):
+        """
+        Args:
+            algorithm (str): The policy name, e.g. 'fcfs', 'srtf' or 'round_robin'.
+            time_quantum (Optional[int]): The time quantum, required for Round Robin scheduling.
+            aging_rate (Optional[float]): The priority aging rate, used by the priority policies.
+            output (Optional[TextIO]): Where to write the events; defaults to standard output.
+            speed (Optional[float]): Time units per second for a real-time replay; None simulates in trace time.
+            segments (bool): Write execution segments as well as completions.
+            queue_size (int): The number of parsed records buffered before the feed is pushed back on.
+            batch_size (int): The largest number of records admitted in one step.
+            tick (float): Seconds between clock updates of a real-time replay while no records arrive.
+
+        Raises:
+            ValueError: If the algorithm is unknown or a setting is invalid.
+        """
+        if speed is not None and speed <= 0:
+            raise ValueError("Speed must be a positive number.")
+        if queue_size <= 0 or batch_size <= 0:
+            raise ValueError("Queue and batch sizes must be positive integers.")
+        if tick <= 0:
+            raise ValueError("Tick must be a positive number.")
+        self.simulator = Simulator(algorithm, time_quantum, aging_rate=aging_rate)
+        self.output = sys.stdout if output is None else output
+        self.speed = speed
+        self.segments = segments
+        self.queue_size = queue_size
+        self.batch_size = batch_size
+        self.tick = tick
+        self.ingested = 0
+        self.late = 0
+        self.skipped = 0
+        self.latency = Distribution()
+        # Step durations not yet added to latency, which takes them in batches
+        self._latencies: List[int] = []
+        # Loop time at simulation time 0 of a real-time replay, set by the first record
+        self._origin: Optional[float] = None
+
+    def _clock(self, loop: asyncio.AbstractEventLoop) -> int:
+        """Returns the simulation time the wall clock has reached in a real-time replay."""
+        return int((loop.time() - self._origin) * self.speed)
+
+    async def _read(self, lines: AsyncIterator[bytes], queue: asyncio.Queue):
+        """Parses the feed into the queue, pacing it in a real-time replay."""
+        loop = asyncio.get_running_loop()
+        line_number = 0
+        async for line in lines:
+            line_number += 1
+            try:
+                record = parse_record(line.decode(), line_number)
+            except (UnicodeDecodeError, ValueError) as e:
+                print(f"Warning: {e} Skipped.", file=sys.stderr)
+                self.skipped += 1
+                continue
+            if record is None:
+                continue
+            if self.speed is not None:
+                if self._origin is None:
+                    # The first record is due immediately
+                    self._origin = loop.time() - record[0] / self.speed
+                delay = self._origin + record[0] / self.speed - loop.time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            # Waits while the queue is full, so the simulation paces the reader
+            await queue.put(record)
+        await queue.put(_END)
+
+    def _write(self, completed: List[Process], timeline: Timeline):
+        """Writes the finished segments and completions of one step."""
+        lines = []
+        if self.segments:
+            for process_id, start_time, duration in timeline:
+                lines.append(json.dumps({
+                    'event': 'segment',
+                    'process_id': 'Idle' if process_id == IDLE else process_id,
+                    'start_time': start_time,
+                    'duration': duration
+                }))
+        for process in completed:
+            event = {'event': 'completion'}
+            event.update(zip(FIELDS, (
+                process.id, process.arrival_time, process.burst_time, process.priority, process.start_time,
+                process.completion_time, process.waiting_time, process.turnaround_time
+            )))
+            lines.append(json.dumps(event))
+        if lines:
+            self.output.write('\n'.join(lines) + '\n')
+            self.output.flush()
+
+    def _step(self, records: List[Tuple[int, int, int]], loop: asyncio.AbstractEventLoop) -> List[Process]:
+        """Submits a batch of records and advances the simulation; returns the completed processes."""
+        simulator = self.simulator
+        completed = []
+        for arrival_time, burst_time, priority in records:
+            if arrival_time < simulator.time:
+                self.late += 1
+                arrival_time = simulator.time
+            completed += simulator.advance_to(arrival_time)
+            self.ingested += 1
+            simulator.submit(Process(arrival_time, burst_time, priority, self.ingested))
+        if self.speed is not None and self._origin is not None:
+            completed += simulator.advance_to(max(self._clock(loop), simulator.time))
+        return completed
+
+    async def _simulate(self, queue: asyncio.Queue):
+        """Runs the simulation from the queue until the feed ends."""
+        loop = asyncio.get_running_loop()
+        while True:
+            try:
+                if self.speed is None:
+                    record = await queue.get()
+                else:
+                    record = await asyncio.wait_for(queue.get(), self.tick)
+                records = [record]
+            except asyncio.TimeoutError:
+                records = []
+            while len(records) < self.batch_size and not queue.empty():
+                records.append(queue.get_nowait())
+            finished = _END in records
+            if finished:
+                records = records[:records.index(_END)]
+
+            started = time.perf_counter()
+            completed = self._step(records, loop)
+            if finished:
+                completed += self.simulator.run_until_idle()
+            self._latencies.append(int((time.perf_counter() - started) * 1e6))
+            if finished or len(self._latencies) >= LATENCY_BATCH:
+                self.latency.add(self._latencies)
+                self._latencies = []
+
+            if finished:
+                timeline, self.simulator.timeline = self.simulator.timeline, Timeline()
+            else:
+                timeline = self.simulator.pop_segments()
+            self._write(completed, timeline)
+            if finished:
+                return
+            # Let the reader refill the queue between steps
+            await asyncio.sleep(0)
+
+    async def run(self, source: str, listen: bool = False) -> Dict:
+        """
+        Reads the feed until it ends and simulates every record.
+
+        Args:
+            source (str): The feed, as accepted by feed_lines.
+            listen (bool): For sockets, accept one connection instead of connecting.
+
+        Returns:
+            Dict: The counts of ingested, late and skipped records and the step latency
+            in microseconds (p50, p99 and max).
+        """
+        queue = asyncio.Queue(self.queue_size)
+        reader = asyncio.create_task(self._read(feed_lines(source, listen), queue))
+        simulation = asyncio.create_task(self._simulate(queue))
+        try:
+            # Whichever fails first stops the other
+            done, _ = await asyncio.wait({reader, simulation}, return_when=asyncio.FIRST_EXCEPTION)
+            for task in done:
+                task.result()
+            await simulation
+        finally:
+            reader.cancel()
+            simulation.cancel()
+        return {
+            'ingested': self.ingested,
+            'late': self.late,
+            'skipped': self.skipped,
+            'step_latency_us': {key: self.latency.to_dict()[key] for key in ('p50', 'p99', 'max')}
+        }
+
+
+def main(argv: Optional[Sequence[str]] = None):
+    parser = argparse.ArgumentParser(description="Schedule processes from a live feed of 'arrival_time burst_time priority' lines.")
+    parser.add_argument('source', help="'-' for standard input, a named pipe or file, tcp://HOST:PORT or unix://PATH")
+    parser.add_argument('--algorithm', required=True, choices=available_algorithms(), help="scheduling algorithm")
+    parser.add_argument('--quantum', type=int, help="time quantum for Round Robin scheduling")
+    parser.add_argument('--aging-rate', type=float, metavar='RATE', help="priority aging rate for the priority algorithms")
+    parser.add_argument('--listen', action='store_true', help="accept one connection on the socket instead of connecting")
+    parser.add_argument('--speed', type=float, help="replay arrivals in real time at this many time units per second")
+    parser.add_argument('--no-segments', action='store_true', help="write completions only")
+    parser.add_argument('--queue-size', type=int, default=DEFAULT_QUEUE_SIZE,
+                        help=f"records buffered before the feed is pushed back on (default: {DEFAULT_QUEUE_SIZE})")
+    parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE,
+                        help=f"largest number of records admitted per step (default: {DEFAULT_BATCH_SIZE})")
+    args = parser.parse_args(argv)
+
+    try:
+        live = LiveRun(args.algorithm, args.quantum, args.aging_rate, speed=args.speed, segments=not args.no_segments,
+                       queue_size=args.queue_size, batch_size=args.batch_size)
+        summary = asyncio.run(live.run(args.source, args.listen))
+    except FileNotFoundError as e:
+        print(f"Error: Input file '{e.filename}' not found.", file=sys.stderr)
+        return 1
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    except KeyboardInterrupt:
+        return 130
+
+    latency = summary['step_latency_us']
+    print(f"Ingested {summary['ingested']} processes ({summary['late']} late, {summary['skipped']} skipped lines); "
+          f"step latency p50={latency['p50']}us p99={latency['p99']}us max={latency['max']}us.", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
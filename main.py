@@ -1,4 +1,57 @@
-from scheduler import run
+import argparse
+import sys
 
 if __name__ == "__main__":
-    run()
+    parser = argparse.ArgumentParser(
+        description="Simulate CPU scheduling algorithms. Without --input, the simulator runs interactively."
+    )
+    parser.add_argument('--input', help="workload file (text or binary); runs without prompting")
+    # Names are validated by the registry, so start-up does not scan installed packages
+    parser.add_argument('--algorithm', help="scheduling algorithm, e.g. fcfs, sjf, srtf, round_robin; required with --input")
+    parser.add_argument('--quantum', type=int, help="time quantum for Round Robin scheduling")
+    parser.add_argument('--format', choices=['table', 'csv', 'json', 'summary', 'summary-json'], default='table',
+                        help="output format; the summary formats print aggregate metrics and percentiles only")
+    parser.add_argument('--no-gantt', action='store_true', help="omit the Gantt chart")
+    parser.add_argument('--aging-rate', type=float, metavar='RATE',
+                        help="priority levels a waiting process gains per time unit, for the priority algorithms")
+    parser.add_argument('--cores', type=int, default=1, help="number of CPU cores to simulate")
+    parser.add_argument('--global-queue', action='store_true', help="share one ready queue between all cores")
+    parser.add_argument('--no-stealing', action='store_true', help="disable work stealing between per-core queues")
+    parser.add_argument('--stats', action='store_true', help="print scheduler statistics after the results")
+    parser.add_argument('--stats-json', metavar='FILE', help="export scheduler statistics as JSON")
+    parser.add_argument('--trace', metavar='FILE', help="export the execution timeline as a trace file")
+    parser.add_argument('--trace-format', choices=['chrome', 'binary'], default='chrome',
+                        help="Chrome Trace Event JSON for Perfetto, or the compact binary format (default: chrome)")
+    parser.add_argument('--trace-tracks', choices=['process', 'cpu'], default='process',
+                        help="one Chrome trace track per process or per CPU (default: process)")
+    parser.add_argument('--checkpoint', metavar='FILE', help="snapshot the single-core simulation to FILE so it can be resumed")
+    parser.add_argument('--checkpoint-every', type=float, metavar='SECONDS', help="seconds between snapshots")
+    parser.add_argument('--time-limit', type=float, metavar='SECONDS',
+                        help="snapshot and stop with exit status 75 after this many seconds")
+    parser.add_argument('--resume', action='store_true', help="continue from the checkpoint file if it exists")
+    parser.add_argument('--cache-dir', metavar='DIR', help="reuse results of identical single-core runs stored in DIR")
+    parser.add_argument('--cache-size', type=int, default=256, metavar='MB', help="size limit of the result cache (default: 256)")
+    args = parser.parse_args()
+    if args.cache_size <= 0:
+        parser.error("--cache-size must be a positive integer")
+    cache_size = args.cache_size * 1024 * 1024
+    if args.checkpoint is None and (args.checkpoint_every is not None or args.time_limit is not None or args.resume):
+        parser.error("--checkpoint-every, --time-limit and --resume require --checkpoint")
+    if args.checkpoint is not None and (args.cores != 1 or args.global_queue or args.stats or args.stats_json):
+        parser.error("--checkpoint supports single-core runs without statistics only")
+    if args.aging_rate is not None and args.aging_rate < 0:
+        parser.error("--aging-rate must be a non-negative number")
+
+    if args.input is None:
+        from scheduler import run
+        run(show_stats=args.stats, stats_file=args.stats_json, cache_dir=args.cache_dir, cache_size=cache_size)
+    else:
+        if args.algorithm is None:
+            parser.error("--algorithm is required with --input")
+        from scheduler import run_batch
+        sys.exit(run_batch(args.input, args.algorithm, args.quantum, args.format,
+                           not args.no_gantt, args.stats, args.stats_json,
+                           args.cores, args.global_queue, not args.no_stealing,
+                           args.cache_dir, cache_size, args.aging_rate,
+                           args.trace, args.trace_format, args.trace_tracks,
+                           args.checkpoint, args.checkpoint_every, args.time_limit, args.resume))
@@ -1,3 +1,9 @@
+import itertools
+from typing import Optional
+
+# Ids for processes created without one; next() on a count is atomic, so threads never share an id
+_next_id = itertools.count(1)
+
 class Process:
     """
     Represents a process with its scheduling attributes.
@@ -14,11 +20,16 @@ class Process:
         remaining_burst_time (int): Remaining burst time for preemptive algorithms.
     """
 
-    _id_counter = 1
-
-    def __init__(self, arrival_time: int, burst_time: int, priority: int):
-        self.id = Process._id_counter
-        Process._id_counter += 1
+    def __init__(self, arrival_time: int, burst_time: int, priority: int, process_id: Optional[int] = None):
+        """
+        Args:
+            arrival_time (int): The arrival time of the process.
+            burst_time (int): The execution time required by the process.
+            priority (int): The priority level of the process.
+            process_id (Optional[int]): The identifier, normally assigned by the loader; a
+                process-wide unique one is drawn if omitted.
+        """
+        self.id = next(_next_id) if process_id is None else process_id
         self.arrival_time = arrival_time
         self.burst_time = burst_time
         self.priority = priority
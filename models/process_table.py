@@ -0,0 +1,369 @@
+import sys
+from array import array
+from operator import sub
+from typing import TYPE_CHECKING, Iterable, List, Optional, Sequence, Tuple, Union
+from models.process import Process
+from utils.metrics import VECTORIZE_MIN_ROWS, as_int_array, compute_times
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# Sentinel stored in the start time column for processes that have not started yet
+NOT_STARTED = -1
+
+
+class ProcessRow:
+    """
+    A lightweight view of one row of a ProcessTable.
+
+    Exposes the same attributes as Process, reading from and writing to the
+    table columns, so code written against Process keeps working.
+    """
+
+    __slots__ = ('_table', '_index')
+
+    def __init__(self, table: 'ProcessTable', index: int):
+        self._table = table
+        self._index = index
+
+    @property
+    def id(self) -> int:
+        return self._table.ids[self._index]
+
+    @property
+    def arrival_time(self) -> int:
+        return self._table.arrival_times[self._index]
+
+    @arrival_time.setter
+    def arrival_time(self, value: int):
+        self._table.arrival_times[self._index] = value
+
+    @property
+    def burst_time(self) -> int:
+        return self._table.burst_times[self._index]
+
+    @burst_time.setter
+    def burst_time(self, value: int):
+        self._table.burst_times[self._index] = value
+
+    @property
+    def priority(self) -> int:
+        return self._table.priorities[self._index]
+
+    @priority.setter
+    def priority(self, value: int):
+        self._table.priorities[self._index] = value
+
+    @property
+    def start_time(self) -> Optional[int]:
+        value = self._table.start_times[self._index]
+        return None if value == NOT_STARTED else value
+
+    @start_time.setter
+    def start_time(self, value: Optional[int]):
+        self._table.start_times[self._index] = NOT_STARTED if value is None else value
+
+    @property
+    def completion_time(self) -> int:
+        return self._table.completion_times[self._index]
+
+    @completion_time.setter
+    def completion_time(self, value: int):
+        self._table.completion_times[self._index] = value
+
+    @property
+    def waiting_time(self) -> int:
+        return self._table.waiting_times[self._index]
+
+    @waiting_time.setter
+    def waiting_time(self, value: int):
+        self._table.waiting_times[self._index] = value
+
+    @property
+    def turnaround_time(self) -> int:
+        return self._table.turnaround_times[self._index]
+
+    @turnaround_time.setter
+    def turnaround_time(self, value: int):
+        self._table.turnaround_times[self._index] = value
+
+    @property
+    def remaining_burst_time(self) -> int:
+        return self._table.remaining_burst_times[self._index]
+
+    @remaining_burst_time.setter
+    def remaining_burst_time(self, value: int):
+        self._table.remaining_burst_times[self._index] = value
+
+
+class ProcessTable:
+    """
+    A compact columnar table of processes backed by typed arrays.
+
+    Each scheduling attribute is stored as a signed 64-bit array instead of one
+    Process object per row. Indexing or iterating yields ProcessRow views.
+
+    Attributes:
+        ids (array): Identifier of each process.
+        arrival_times (array): The arrival time of each process.
+        burst_times (array): The execution time required by each process.
+        priorities (array): The priority level of each process.
+        start_times (array): The start time of each process, or NOT_STARTED.
+        completion_times (array): The completion time of each process.
+        waiting_times (array): The waiting time of each process.
+        turnaround_times (array): The turnaround time of each process.
+        remaining_burst_times (array): Remaining burst time for preemptive algorithms.
+    """
+
+    def __init__(
+        self,
+        arrival_times: Iterable[int],
+        burst_times: Iterable[int],
+        priorities: Iterable[int],
+        ids: Optional[Iterable[int]] = None
+    ):
+        self.arrival_times = array('q', arrival_times)
+        self.burst_times = array('q', burst_times)
+        self.priorities = array('q', priorities)
+        self._init_columns(ids)
+
+    def _init_columns(self, ids: Optional[Iterable[int]]):
+        """Validates the input columns and allocates the result columns."""
+        n = len(self.arrival_times)
+        if len(self.burst_times) != n or len(self.priorities) != n:
+            raise ValueError("All process columns must have the same length.")
+        # IDs are local to the table unless given explicitly
+        if ids is not None:
+            self.ids = array('q', ids)
+        elif n < VECTORIZE_MIN_ROWS:
+            self.ids = array('q', range(1, n + 1))
+        else:
+            import numpy as np
+            self.ids = _to_column(np.arange(1, n + 1))
+        if len(self.ids) != n:
+            raise ValueError("All process columns must have the same length.")
+        self.start_times = array('q', [NOT_STARTED]) * n
+        self.completion_times = array('q', bytes(8 * n))
+        self.waiting_times = array('q', bytes(8 * n))
+        self.turnaround_times = array('q', bytes(8 * n))
+        if isinstance(self.burst_times, array) and self.burst_times.typecode == 'q':
+            self.remaining_burst_times = array('q', self.burst_times)
+        else:
+            self.remaining_burst_times = _to_column(as_int_array(self.burst_times))
+
+    @classmethod
+    def from_columns(
+        cls,
+        arrival_times: Sequence[int],
+        burst_times: Sequence[int],
+        priorities: Sequence[int],
+        ids: Optional[Iterable[int]] = None
+    ) -> 'ProcessTable':
+        """
+        Builds a table around existing integer columns.
+
+        array and memoryview columns, such as memory-mapped file contents, are used as-is
+        without copying; NumPy arrays are copied into array('q') columns.
+
+        Args:
+            arrival_times (Sequence[int]): The arrival time of each process.
+            burst_times (Sequence[int]): The burst time of each process.
+            priorities (Sequence[int]): The priority of each process.
+            ids (Optional[Iterable[int]]): The identifier of each process, numbered from 1 if omitted.
+
+        Returns:
+            ProcessTable: A table over the given columns.
+        """
+        table = cls.__new__(cls)
+        table.arrival_times = _as_column(arrival_times)
+        table.burst_times = _as_column(burst_times)
+        table.priorities = _as_column(priorities)
+        table._init_columns(ids)
+        return table
+
+    @classmethod
+    def from_processes(cls, processes: Iterable[Process]) -> 'ProcessTable':
+        """
+        Builds a table from Process instances, keeping their identifiers.
+
+        Args:
+            processes (Iterable[Process]): The processes to copy.
+
+        Returns:
+            ProcessTable: A table holding the arrival, burst and priority of each process.
+        """
+        processes = list(processes)
+        return cls(
+            (p.arrival_time for p in processes),
+            (p.burst_time for p in processes),
+            (p.priority for p in processes),
+            (p.id for p in processes)
+        )
+
+    def take(self, indices: Sequence[int]) -> 'ProcessTable':
+        """
+        Returns a new table holding the given rows, in the given order.
+
+        Args:
+            indices (Sequence[int]): The row indices to gather.
+
+        Returns:
+            ProcessTable: A copy of the selected rows including their scheduling results.
+        """
+        names = ('ids', 'arrival_times', 'burst_times', 'priorities', 'start_times', 'completion_times',
+                 'waiting_times', 'turnaround_times', 'remaining_burst_times')
+        table = ProcessTable.__new__(ProcessTable)
+        if len(indices) < VECTORIZE_MIN_ROWS:
+            for name in names:
+                column = getattr(self, name)
+                setattr(table, name, array('q', [column[i] for i in indices]))
+            return table
+        # Gather every column with one vectorized pass
+        import numpy as np
+        index = np.asarray(indices, dtype=np.intp)
+        for name in names:
+            setattr(table, name, _to_column(as_int_array(getattr(self, name))[index]))
+        return table
+
+    def __len__(self) -> int:
+        return len(self.arrival_times)
+
+    def __getitem__(self, index: int) -> ProcessRow:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("ProcessTable index out of range")
+        return ProcessRow(self, index)
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield ProcessRow(self, index)
+
+
+Processes = Union[List[Process], ProcessTable]
+
+
+def _as_column(values: Sequence[int]) -> Sequence[int]:
+    """Returns array and memoryview columns unchanged and copies anything else into array('q')."""
+    if isinstance(values, (array, memoryview)):
+        return values
+    # A NumPy array can only exist once NumPy is imported, so small loads never import it here
+    numpy = sys.modules.get('numpy')
+    if numpy is not None and isinstance(values, numpy.ndarray):
+        return _to_column(values)
+    return array('q', values)
+
+
+def _to_column(values: 'np.ndarray') -> array:
+    """Copies an integer NumPy array into an array('q') column."""
+    import numpy as np
+    column = array('q')
+    # Read straight from the array's buffer; tobytes would make a second full copy
+    column.frombytes(memoryview(np.ascontiguousarray(values, dtype=np.int64)).cast('B'))
+    return column
+
+
+def read_columns(processes: Processes) -> Tuple[Sequence[int], Sequence[int], Sequence[int], Sequence[int]]:
+    """
+    Returns the id, arrival, burst and priority columns of the given processes.
+
+    Args:
+        processes (Processes): A list of Process instances or a ProcessTable.
+
+    Returns:
+        Tuple[Sequence[int], Sequence[int], Sequence[int], Sequence[int]]: The ids, arrival times, burst times and priorities.
+    """
+    if isinstance(processes, ProcessTable):
+        return processes.ids, processes.arrival_times, processes.burst_times, processes.priorities
+    return (
+        [p.id for p in processes],
+        [p.arrival_time for p in processes],
+        [p.burst_time for p in processes],
+        [p.priority for p in processes]
+    )
+
+
+def write_results(
+    processes: Processes,
+    start_times: Sequence[Optional[int]],
+    completion_times: Sequence[int]
+):
+    """
+    Stores scheduling results on the given processes and derives waiting and turnaround times.
+
+    Results of any earlier run are overwritten, so scheduling the same processes again
+    gives the same results.
+
+    Args:
+        processes (Processes): A list of Process instances or a ProcessTable.
+        start_times (Sequence[Optional[int]]): The first dispatch time of each process.
+        completion_times (Sequence[int]): The completion time of each process.
+    """
+    if isinstance(processes, ProcessTable) and len(processes) < VECTORIZE_MIN_ROWS:
+        completion_times = array('q', completion_times)
+        turnaround_times = array('q', map(sub, completion_times, processes.arrival_times))
+        processes.start_times = array('q', start_times)
+        processes.completion_times = completion_times
+        processes.turnaround_times = turnaround_times
+        processes.waiting_times = array('q', map(sub, turnaround_times, processes.burst_times))
+        processes.remaining_burst_times = array('q', bytes(8 * len(processes)))
+        return
+
+    if isinstance(processes, ProcessTable):
+        # Derive the table columns in a few vectorized passes
+        start_times = as_int_array(start_times)
+        completion_times = as_int_array(completion_times)
+        turnaround_times, waiting_times = compute_times(
+            as_int_array(processes.arrival_times), as_int_array(processes.burst_times), completion_times
+        )
+        processes.start_times = _to_column(start_times)
+        processes.completion_times = _to_column(completion_times)
+        processes.turnaround_times = _to_column(turnaround_times)
+        processes.waiting_times = _to_column(waiting_times)
+        processes.remaining_burst_times = array('q', bytes(8 * len(processes)))
+        return
+
+    for process, start_time, completion_time in zip(processes, start_times, completion_times):
+        process.remaining_burst_time = 0
+        process.start_time = start_time
+        process.completion_time = completion_time
+        process.turnaround_time = process.completion_time - process.arrival_time
+        process.waiting_time = process.turnaround_time - process.burst_time
+
+
+def result_table(processes: Processes) -> ProcessTable:
+    """
+    Returns a table to hold the results of one simulation of the given processes.
+
+    The table shares the input columns of a ProcessTable without copying them and has
+    its own result columns. The algorithms only read the input columns, so simulations
+    can run on result tables of the same workload concurrently, from several threads,
+    without affecting the workload or each other. A list of processes is copied once.
+
+    Args:
+        processes (Processes): A list of Process instances or a ProcessTable.
+
+    Returns:
+        ProcessTable: A table with the same ids and input columns and fresh result columns.
+    """
+    if isinstance(processes, ProcessTable):
+        return ProcessTable.from_columns(
+            processes.arrival_times, processes.burst_times, processes.priorities, processes.ids
+        )
+    return ProcessTable.from_processes(processes)
+
+
+def take_rows(processes: Processes, indices: Sequence[int]) -> Processes:
+    """
+    Returns the given rows of the processes in the given order.
+
+    Args:
+        processes (Processes): A list of Process instances or a ProcessTable.
+        indices (Sequence[int]): The row indices to gather.
+
+    Returns:
+        Processes: A list of the same Process instances, or a new ProcessTable.
+    """
+    if isinstance(processes, ProcessTable):
+        return processes.take(indices)
+    return [processes[i] for i in indices]
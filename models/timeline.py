@@ -0,0 +1,180 @@
+import sys
+from array import array
+from bisect import bisect_right
+from typing import Dict, Iterable, Iterator, List, Sequence, Tuple, Union
+
+# Process id stored for idle segments
+IDLE = -1
+
+Segment = Tuple[int, int, int]
+
+
+class Timeline:
+    """
+    A run-length encoded execution timeline backed by parallel integer arrays.
+
+    Segments are kept in time order as (process_id, start_time, duration). Appending a
+    segment that continues the last one for the same process extends it in place, so the
+    timeline never holds more segments than there are uninterrupted runs. Idle time is
+    stored with the IDLE process id.
+
+    Attributes:
+        process_ids (array): The process id of each segment, or IDLE.
+        start_times (array): The start time of each segment.
+        durations (array): The duration of each segment.
+    """
+
+    __slots__ = ('process_ids', 'start_times', 'durations')
+
+    def __init__(self):
+        self.process_ids = array('q')
+        self.start_times = array('q')
+        self.durations = array('q')
+
+    @classmethod
+    def from_arrays(
+        cls,
+        process_ids: Sequence[int],
+        start_times: Sequence[int],
+        durations: Sequence[int]
+    ) -> 'Timeline':
+        """
+        Builds a timeline from already run-length encoded columns without merging.
+
+        Args:
+            process_ids (Sequence[int]): The process id of each segment, or IDLE.
+            start_times (Sequence[int]): The start time of each segment, in time order.
+            durations (Sequence[int]): The duration of each segment.
+
+        Returns:
+            Timeline: A timeline holding copies of the columns.
+        """
+        timeline = cls()
+        # A NumPy array can only exist once NumPy is imported, so plain columns never import it here
+        np = sys.modules.get('numpy')
+        for name, values in (('process_ids', process_ids), ('start_times', start_times), ('durations', durations)):
+            if np is not None and isinstance(values, np.ndarray):
+                # Read straight from the array's buffer rather than through an intermediate bytes copy
+                column = array('q')
+                column.frombytes(memoryview(np.ascontiguousarray(values, dtype=np.int64)).cast('B'))
+            else:
+                column = array('q', values)
+            setattr(timeline, name, column)
+        return timeline
+
+    @classmethod
+    def from_events(cls, events: Iterable[Dict]) -> 'Timeline':
+        """
+        Builds a timeline from a list of {'process_id', 'start_time', 'duration'} events.
+
+        Args:
+            events (Iterable[Dict]): The execution events; 'Idle' marks idle time.
+
+        Returns:
+            Timeline: The merged timeline.
+        """
+        timeline = cls()
+        for event in events:
+            process_id = event['process_id']
+            timeline.append(IDLE if process_id == 'Idle' else process_id, event['start_time'], event['duration'])
+        return timeline
+
+    def append(self, process_id: int, start_time: int, duration: int):
+        """
+        Appends a segment, merging it into the last one when it continues the same run.
+
+        Args:
+            process_id (int): The process id, or IDLE.
+            start_time (int): The start time of the segment.
+            duration (int): The duration of the segment.
+        """
+        if self.process_ids and self.process_ids[-1] == process_id \
+                and self.start_times[-1] + self.durations[-1] == start_time:
+            self.durations[-1] += duration
+            return
+        self.process_ids.append(process_id)
+        self.start_times.append(start_time)
+        self.durations.append(duration)
+
+    @property
+    def end_time(self) -> int:
+        """The time at which the last segment ends, or 0 for an empty timeline."""
+        if not self.process_ids:
+            return 0
+        return self.start_times[-1] + self.durations[-1]
+
+    def window(self, start_time: int, end_time: int) -> 'Timeline':
+        """
+        Returns the part of the timeline within [start_time, end_time).
+
+        Segments crossing either boundary are clipped to it.
+
+        Args:
+            start_time (int): The start of the window.
+            end_time (int): The end of the window (exclusive).
+
+        Returns:
+            Timeline: The segments overlapping the window.
+        """
+        timeline = Timeline()
+        first = max(bisect_right(self.start_times, start_time) - 1, 0)
+        last = bisect_right(self.start_times, end_time - 1)
+        for index in range(first, last):
+            segment_start = self.start_times[index]
+            segment_end = segment_start + self.durations[index]
+            clipped_start = max(segment_start, start_time)
+            clipped_end = min(segment_end, end_time)
+            if clipped_start < clipped_end:
+                timeline.process_ids.append(self.process_ids[index])
+                timeline.start_times.append(clipped_start)
+                timeline.durations.append(clipped_end - clipped_start)
+        return timeline
+
+    def to_events(self) -> List[Dict]:
+        """
+        Returns the timeline as a list of {'process_id', 'start_time', 'duration'} events.
+
+        Returns:
+            List[Dict]: The segments in time order, with 'Idle' for idle time.
+        """
+        return [
+            {
+                'process_id': 'Idle' if process_id == IDLE else process_id,
+                'start_time': start_time,
+                'duration': duration
+            }
+            for process_id, start_time, duration in self
+        ]
+
+    def __len__(self) -> int:
+        return len(self.process_ids)
+
+    def __iter__(self) -> Iterator[Segment]:
+        return zip(self.process_ids, self.start_times, self.durations)
+
+    def __getitem__(self, index: int) -> Segment:
+        return self.process_ids[index], self.start_times[index], self.durations[index]
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Timeline):
+            return NotImplemented
+        return (self.process_ids == other.process_ids and self.start_times == other.start_times
+                and self.durations == other.durations)
+
+
+GanttChart = Union[Timeline, List[Dict]]
+
+
+def as_timeline(gantt_chart: GanttChart) -> Timeline:
+    """
+    Returns the given execution timeline as a Timeline.
+
+    Args:
+        gantt_chart (GanttChart): A Timeline or a list of event dictionaries.
+
+    Returns:
+        Timeline: The timeline itself, or a merged copy of the events.
+    """
+    if isinstance(gantt_chart, Timeline):
+        return gantt_chart
+    return Timeline.from_events(gantt_chart)
@@ -1,42 +1,82 @@
-from algorithms.fcfs import fcfs_scheduling
-from algorithms.priority_non_preemptive import priority_non_preemptive_scheduling
-from algorithms.priority_preemptive import priority_preemptive_scheduling
-from algorithms.round_robin import round_robin_scheduling
-from algorithms.sjf import sjf_scheduling
-from algorithms.srtf import srtf_scheduling
-from utils.display import display_process_info
+import os
+import sys
+from typing import Optional, TextIO, Tuple
+from algorithms.registry import available_algorithms, get_policy, run_algorithm
+from models.process_table import Processes
+from models.timeline import Timeline
 from utils.gantt_chart import generate_gantt_chart
-from utils.input_handler import read_process_data
+from utils.input_handler import read_workload
+from utils.instrumentation import SchedulerStats
+from utils.metrics import as_int_array
 
-def run():
+def _write_stats(
+    stats: Optional[SchedulerStats],
+    show_stats: bool,
+    stats_file: Optional[str],
+    writer: Optional[TextIO] = None
+):
+    """Prints and/or exports the scheduler statistics as requested."""
+    if show_stats:
+        stats.report(writer)
+    if stats_file:
+        with open(stats_file, 'w') as file:
+            file.write(stats.to_json() + "\n")
+        print(f"Scheduler statistics written to {stats_file}.", file=writer)
+
+def _run_cached(
+    algorithm: str,
+    processes: Processes,
+    time_quantum: Optional[int],
+    stats: Optional[SchedulerStats],
+    cache_dir: Optional[str],
+    cache_size: Optional[int],
+    aging_rate: Optional[float] = None
+) -> Tuple[Processes, Timeline]:
+    """Runs the algorithm through the result cache when one is configured and no statistics are wanted."""
+    # Instrumented runs are always simulated, since a cached result has no counters
+    if cache_dir is None or stats is not None:
+        return run_algorithm(algorithm, processes, time_quantum, stats, aging_rate)
+    from utils.result_cache import DEFAULT_MAX_BYTES, ResultCache
+    cache = ResultCache(cache_dir, DEFAULT_MAX_BYTES if cache_size is None else cache_size)
+    return cache.run(algorithm, processes, time_quantum, aging_rate)
+
+def run(
+    show_stats: bool = False,
+    stats_file: Optional[str] = None,
+    cache_dir: Optional[str] = None,
+    cache_size: Optional[int] = None
+):
+    """
+    Runs the interactive simulator.
+
+    Args:
+        show_stats (bool): Print the scheduler statistics after the results.
+        stats_file (Optional[str]): Export the scheduler statistics as JSON to this file.
+        cache_dir (Optional[str]): Reuse results stored in this result cache directory, if given.
+        cache_size (Optional[int]): The size limit of the result cache in bytes.
+    """
+    # Instrumentation is only enabled when its output is wanted
+    stats = SchedulerStats() if show_stats or stats_file else None
     input_file = input("Enter the path to the input file: ")
     try:
-        processes = read_process_data(input_file)
+        processes = read_workload(input_file)
         print(f"Successfully read {len(processes)} processes.\n")
 
+        policies = [get_policy(name) for name in available_algorithms()]
+        numbers = [str(number) for number in range(1, len(policies) + 1)]
         print("Select Scheduling Algorithm:")
-        print("1. First Come First Serve Scheduling")
-        print("2. Priority Non-Preemptive Scheduling")
-        print("3. Priority Preemptive Scheduling")
-        print("4. Shortest Remaining Time First Scheduling")
-        print("5. Round Robin Scheduling")
-        print("6. Shortest Job First Scheduling")
-        choice = input("Enter your choice (1, 2, 3, 4, 5, or 6): ")
-
-        if choice == '1':
-            scheduled_processes, gantt_chart = fcfs_scheduling(processes)
-            print("\nFirst Come First Serve Scheduling Simulation Results:\n")
-        elif choice == '2':
-            scheduled_processes, gantt_chart = priority_non_preemptive_scheduling(processes)
-            print("\nPriority Non-Preemptive Scheduling Simulation Results:\n")
-        elif choice == '3':
-            scheduled_processes, gantt_chart = priority_preemptive_scheduling(processes)
-            print("\nPriority Preemptive Scheduling Simulation Results:\n")
-        elif choice == '4':
-            scheduled_processes, gantt_chart = srtf_scheduling(processes)
-            print("\nShortest Remaining Time First Scheduling Simulation Results:\n")
-        elif choice == '5':
-            time_quantum_input = input("Enter the time quantum for Round Robin Scheduling: ")
+        for number, policy in zip(numbers, policies):
+            print(f"{number}. {policy.title} Scheduling")
+        choice = input(f"Enter your choice ({', '.join(numbers[:-1])}, or {numbers[-1]}): ")
+
+        if choice not in numbers:
+            print("Invalid choice. Exiting.")
+            return
+        policy = policies[int(choice) - 1]
+
+        time_quantum = None
+        if policy.uses_quantum:
+            time_quantum_input = input(f"Enter the time quantum for {policy.title} Scheduling: ")
             try:
                 time_quantum = int(time_quantum_input)
                 if time_quantum <= 0:
@@ -45,20 +85,188 @@ def run():
             except ValueError:
                 print("Invalid time quantum. Exiting.")
                 return
-            scheduled_processes, gantt_chart = round_robin_scheduling(processes, time_quantum)
-            print("\nRound Robin Scheduling Simulation Results:\n")
-        elif choice == '6':
-            scheduled_processes, gantt_chart = sjf_scheduling(processes)
-            print("\nShortest Job First Scheduling Simulation Results:\n")
-        else:
-            print("Invalid choice. Exiting.")
-            return
 
+        scheduled_processes, gantt_chart = _run_cached(
+            policy.name, processes, time_quantum, stats, cache_dir, cache_size
+        )
+        print(f"\n{policy.title} Scheduling Simulation Results:\n")
+
+        # tabulate is only needed for the table output
+        from utils.display import display_process_info
         display_process_info(scheduled_processes)
         generate_gantt_chart(gantt_chart)
+
+        _write_stats(stats, show_stats, stats_file)
     except FileNotFoundError:
         print(f"Error: Input file '{input_file}' not found.")
     except ValueError as ve:
         print(f"Error: {ve}")
     except Exception as e:
         print(f"An unexpected error occurred: {e}")
+
+def run_batch(
+    input_file: str,
+    algorithm: str,
+    time_quantum: Optional[int] = None,
+    output_format: str = 'table',
+    show_gantt: bool = True,
+    show_stats: bool = False,
+    stats_file: Optional[str] = None,
+    cores: int = 1,
+    global_queue: bool = False,
+    work_stealing: bool = True,
+    cache_dir: Optional[str] = None,
+    cache_size: Optional[int] = None,
+    aging_rate: Optional[float] = None,
+    trace_file: Optional[str] = None,
+    trace_format: str = 'chrome',
+    trace_tracks: str = 'process',
+    checkpoint_file: Optional[str] = None,
+    checkpoint_interval: Optional[float] = None,
+    time_limit: Optional[float] = None,
+    resume: bool = False
+) -> int:
+    """
+    Runs one simulation without prompting and writes the results to standard output.
+
+    Only the selected algorithm is imported, and tabulate only for table output, so
+    scripted runs start quickly.
+
+    Args:
+        input_file (str): The path to the workload file.
+        algorithm (str): A name from algorithms.registry.available_algorithms().
+        time_quantum (Optional[int]): The time quantum, required for Round Robin scheduling.
+        output_format (str): 'table', 'csv', 'json', or 'summary' / 'summary-json' for aggregate
+            metrics and latency percentiles only.
+        show_gantt (bool): Draw the Gantt chart (table) or include the timeline (JSON); CSV and summaries never include it.
+        show_stats (bool): Print the scheduler statistics after the results.
+        stats_file (Optional[str]): Export the scheduler statistics as JSON to this file.
+        cores (int): The number of cores; more than one runs the multi-core engine.
+        global_queue (bool): With several cores, share one ready queue instead of one per core.
+        work_stealing (bool): With per-core queues, let idle cores steal work.
+        cache_dir (Optional[str]): Reuse single-core results stored in this result cache directory, if given.
+        cache_size (Optional[int]): The size limit of the result cache in bytes.
+        aging_rate (Optional[float]): Lower the priority number of waiting processes by this much per
+            time unit, for the priority algorithms.
+        trace_file (Optional[str]): Export the execution timeline to this trace file.
+        trace_format (str): 'chrome' for Chrome Trace Event JSON (Perfetto), or 'binary'.
+        trace_tracks (str): 'process' for one Chrome trace track per process, 'cpu' for one per CPU.
+        checkpoint_file (Optional[str]): Snapshot the single-core simulation to this file so it can be resumed.
+        checkpoint_interval (Optional[float]): Seconds between snapshots.
+        time_limit (Optional[float]): Seconds after which to snapshot and stop.
+        resume (bool): Continue from the checkpoint file if it exists.
+
+    Returns:
+        int: The exit status: 0 on success, 1 on error, and os.EX_TEMPFAIL (75) when the
+        time limit stopped the run before it finished.
+    """
+    stats = SchedulerStats() if show_stats or stats_file else None
+    # Whether the timeline went straight to the trace file instead of being kept
+    timeline_streamed = False
+    try:
+        processes = read_workload(input_file)
+        if checkpoint_file is not None and cores == 1 and not global_queue:
+            from algorithms.checkpoint import CheckpointedRun
+            # A binary trace is streamed by the run itself, so the timeline is never held in memory
+            streamed_trace = trace_file if trace_format == 'binary' else None
+            checkpointed = CheckpointedRun(processes, algorithm, time_quantum, aging_rate, streamed_trace)
+            try:
+                if resume and os.path.exists(checkpoint_file):
+                    checkpointed.restore(checkpoint_file)
+                finished = checkpointed.run(checkpoint_file, checkpoint_interval, time_limit)
+            except OSError as e:
+                print(f"Error: Could not write checkpoint '{checkpoint_file}': {e}", file=sys.stderr)
+                return 1
+            if not finished:
+                print(f"Checkpoint written to {checkpoint_file} at simulation time {checkpointed.simulator.time}; "
+                      "run again with --resume to continue.", file=sys.stderr)
+                return os.EX_TEMPFAIL
+            scheduled_processes, gantt_chart = checkpointed.results()
+            if streamed_trace is not None:
+                trace_file = None
+                timeline_streamed = True
+            core_timelines = core_metrics = None
+        elif cores == 1 and not global_queue and trace_file and stats is None and cache_dir is None \
+                and not (show_gantt and output_format in ('table', 'json')):
+            from algorithms.registry import simulate_streamed
+            from utils.trace_export import open_trace
+            # No output needs the timeline, so it is streamed to the trace as the simulation runs
+            try:
+                with open_trace(trace_file, trace_format, trace_tracks) as trace:
+                    scheduled_processes = simulate_streamed(algorithm, processes, trace.add, time_quantum, aging_rate)
+            except OSError as e:
+                print(f"Error: Could not write trace '{trace_file}': {e}", file=sys.stderr)
+                return 1
+            gantt_chart = None
+            trace_file = None
+            timeline_streamed = True
+            core_timelines = core_metrics = None
+        elif cores == 1 and not global_queue:
+            scheduled_processes, gantt_chart = _run_cached(
+                algorithm, processes, time_quantum, stats, cache_dir, cache_size, aging_rate
+            )
+            core_timelines = core_metrics = None
+        else:
+            from algorithms.smp import smp_scheduling
+            schedule = smp_scheduling(
+                processes, algorithm, cores, time_quantum, global_queue, work_stealing, stats, aging_rate
+            )
+            scheduled_processes, core_timelines, core_metrics = schedule.processes, schedule.timelines, schedule.core_metrics
+            gantt_chart = None
+    except FileNotFoundError:
+        print(f"Error: Input file '{input_file}' not found.", file=sys.stderr)
+        return 1
+    except ValueError as ve:
+        print(f"Error: {ve}", file=sys.stderr)
+        return 1
+
+    if trace_file:
+        from utils.trace_export import open_trace
+        try:
+            with open_trace(trace_file, trace_format, trace_tracks) as trace:
+                for core, timeline in enumerate([gantt_chart] if core_timelines is None else core_timelines):
+                    trace.add_timeline(timeline, core)
+        except (OSError, ValueError) as e:
+            print(f"Error: Could not write trace '{trace_file}': {e}", file=sys.stderr)
+            return 1
+
+    if output_format in ('summary', 'summary-json'):
+        # Aggregates the result columns directly, without building per-process rows
+        from utils.summary import MetricsSummary
+        summary = MetricsSummary(cores)
+        summary.add_processes(scheduled_processes)
+        if timeline_streamed:
+            # Every burst ran to completion, so the busy time is their total
+            summary.busy_time += int(as_int_array(scheduled_processes.burst_times).sum())
+        else:
+            for timeline in ([gantt_chart] if core_timelines is None else core_timelines):
+                summary.add_timeline(timeline)
+        if output_format == 'summary':
+            summary.report()
+        else:
+            print(summary.to_json())
+    elif output_format == 'table':
+        from utils.display import display_process_info
+        display_process_info(scheduled_processes)
+        if core_metrics is not None:
+            from utils.display import display_core_metrics
+            print()
+            display_core_metrics(core_metrics)
+        if show_gantt:
+            if core_timelines is None:
+                generate_gantt_chart(gantt_chart)
+            else:
+                for core, timeline in enumerate(core_timelines):
+                    print(f"\nCPU{core}:", end='')
+                    generate_gantt_chart(timeline)
+    elif output_format == 'csv':
+        from utils.report import write_csv
+        write_csv(scheduled_processes, sys.stdout)
+    else:
+        from utils.report import write_json
+        write_json(scheduled_processes, sys.stdout, gantt_chart if show_gantt else None,
+                   core_metrics, core_timelines if show_gantt else None)
+
+    # Keep machine-readable output clean
+    _write_stats(stats, show_stats, stats_file, sys.stdout if output_format in ('table', 'summary') else sys.stderr)
+    return 0
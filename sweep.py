@@ -0,0 +1,185 @@
+import argparse
+import csv
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence, TextIO
+from algorithms.registry import available_algorithms, get_policy, run_algorithm
+from models.process_table import ProcessTable, result_table
+from utils.input_handler import read_workload
+from utils.metrics import summarize_schedule
+from utils.result_cache import DEFAULT_MAX_BYTES, ResultCache
+
+COLUMNS = [
+    'workload', 'algorithm', 'time_quantum', 'processes', 'average_waiting_time',
+    'average_turnaround_time', 'max_waiting_time', 'max_turnaround_time', 'makespan',
+    'throughput', 'cpu_utilization', 'segments', 'elapsed_seconds'
+]
+
+
+class SweepJob(NamedTuple):
+    """One simulation in a sweep: a workload file, an algorithm and its time quantum."""
+    workload: str
+    algorithm: str
+    time_quantum: Optional[int] = None
+
+
+def build_jobs(
+    workloads: Iterable[str],
+    algorithms: Optional[Sequence[str]] = None,
+    time_quanta: Sequence[int] = (1, 2, 4, 8)
+) -> List[SweepJob]:
+    """
+    Builds the cross product of workloads and algorithms, expanding Round Robin over the quantum grid.
+
+    Args:
+        workloads (Iterable[str]): Paths to workload files.
+        algorithms (Optional[Sequence[str]]): Names of the algorithms to run; defaults to all registered ones.
+        time_quanta (Sequence[int]): Time quanta to try for Round Robin scheduling.
+
+    Returns:
+        List[SweepJob]: The jobs, grouped by workload.
+
+    Raises:
+        ValueError: If an algorithm is unknown or a time quantum is not positive.
+    """
+    if algorithms is None:
+        algorithms = available_algorithms()
+    # Resolving each policy also rejects unknown names
+    uses_quantum = {algorithm: get_policy(algorithm).uses_quantum for algorithm in algorithms}
+    if any(time_quantum <= 0 for time_quantum in time_quanta):
+        raise ValueError("Time quantum must be a positive integer.")
+
+    jobs = []
+    for workload in workloads:
+        for algorithm in algorithms:
+            if uses_quantum[algorithm]:
+                jobs.extend(SweepJob(workload, algorithm, time_quantum) for time_quantum in time_quanta)
+            else:
+                jobs.append(SweepJob(workload, algorithm))
+    return jobs
+
+
+@lru_cache(maxsize=4)
+def _load(workload: str) -> ProcessTable:
+    """Loads a workload once per worker process."""
+    return read_workload(workload)
+
+
+@lru_cache(maxsize=4)
+def _result_cache(directory: str, max_bytes: int) -> ResultCache:
+    """Opens a result cache once per worker process."""
+    return ResultCache(directory, max_bytes)
+
+
+def run_job(job: SweepJob, cache_dir: Optional[str] = None, cache_size: int = DEFAULT_MAX_BYTES) -> Dict:
+    """
+    Runs one sweep job and returns its summary row.
+
+    The algorithms write their results into the table they are given, so each job runs
+    on a result table that shares only the read-only input columns of the cached workload.
+
+    Args:
+        job (SweepJob): The job to run.
+        cache_dir (Optional[str]): Reuse results stored in this result cache directory, if given.
+        cache_size (int): The size limit of the result cache in bytes.
+
+    Returns:
+        Dict: The summary metrics of the job, keyed by the names in COLUMNS.
+    """
+    processes = result_table(_load(job.workload))
+
+    started = time.perf_counter()
+    if cache_dir is None:
+        _, gantt_chart = run_algorithm(job.algorithm, processes, job.time_quantum)
+    else:
+        _, gantt_chart = _result_cache(cache_dir, cache_size).run(job.algorithm, processes, job.time_quantum)
+    elapsed = time.perf_counter() - started
+
+    # The input table holds every process with its results, whatever order is returned
+    row = {'workload': job.workload, 'algorithm': job.algorithm, 'time_quantum': job.time_quantum}
+    row.update(summarize_schedule(
+        processes.arrival_times, processes.burst_times,
+        processes.waiting_times, processes.turnaround_times, len(gantt_chart)
+    ))
+    row['elapsed_seconds'] = elapsed
+    return row
+
+
+def run_sweep(
+    jobs: Sequence[SweepJob],
+    max_workers: Optional[int] = None,
+    cache_dir: Optional[str] = None,
+    cache_size: int = DEFAULT_MAX_BYTES
+) -> List[Dict]:
+    """
+    Runs the jobs across a pool of worker processes.
+
+    Args:
+        jobs (Sequence[SweepJob]): The jobs to run.
+        max_workers (Optional[int]): The number of worker processes; defaults to the CPU count.
+        cache_dir (Optional[str]): Reuse results stored in this result cache directory, if given.
+        cache_size (int): The size limit of the result cache in bytes.
+
+    Returns:
+        List[Dict]: One summary row per job, in job order.
+    """
+    run = partial(run_job, cache_dir=cache_dir, cache_size=cache_size)
+    if max_workers == 1:
+        return [run(job) for job in jobs]
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        # Jobs are grouped by workload, so chunks let a worker reuse its cached workload
+        chunksize = max(1, len(jobs) // ((max_workers or os.cpu_count() or 1) * 4))
+        return list(executor.map(run, jobs, chunksize=chunksize))
+
+
+def write_csv(rows: Iterable[Dict], output: TextIO):
+    """
+    Writes summary rows as CSV.
+
+    Args:
+        rows (Iterable[Dict]): The summary rows.
+        output (TextIO): The file to write to.
+    """
+    writer = csv.DictWriter(output, fieldnames=COLUMNS)
+    writer.writeheader()
+    writer.writerows(rows)
+
+
+def main(argv: Optional[Sequence[str]] = None):
+    parser = argparse.ArgumentParser(description="Run scheduling algorithms over many workloads in parallel.")
+    parser.add_argument('workloads', nargs='+', help="workload files (text or binary)")
+    parser.add_argument('--algorithms', nargs='+', default=available_algorithms(), choices=available_algorithms(),
+                        help="algorithms to run (default: all)")
+    parser.add_argument('--quanta', nargs='+', type=int, default=[1, 2, 4, 8],
+                        help="time quanta for Round Robin scheduling")
+    parser.add_argument('--workers', type=int, default=None, help="number of worker processes")
+    parser.add_argument('--output', default=None, help="CSV file to write (default: standard output)")
+    parser.add_argument('--cache-dir', metavar='DIR', help="reuse results of identical runs stored in DIR")
+    parser.add_argument('--cache-size', type=int, default=256, metavar='MB', help="size limit of the result cache (default: 256)")
+    args = parser.parse_args(argv)
+    if args.cache_size <= 0:
+        parser.error("--cache-size must be a positive integer")
+
+    try:
+        jobs = build_jobs(args.workloads, args.algorithms, args.quanta)
+        rows = run_sweep(jobs, args.workers, args.cache_dir, args.cache_size * 1024 * 1024)
+    except FileNotFoundError as e:
+        print(f"Error: Input file '{e.filename}' not found.", file=sys.stderr)
+        return 1
+    except ValueError as ve:
+        print(f"Error: {ve}", file=sys.stderr)
+        return 1
+
+    if args.output:
+        with open(args.output, 'w', newline='') as output:
+            write_csv(rows, output)
+    else:
+        write_csv(rows, sys.stdout)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,163 @@
+import mmap
+import struct
+import sys
+from typing import Sequence
+from models.process_table import ProcessTable
+from utils.metrics import as_int_array
+
+# Header: magic, format version, column type code, padding, process count (little-endian)
+HEADER = struct.Struct('<4sHcxQ')
+MAGIC = b'CPUW'
+VERSION = 1
+TYPECODES = {'i': '<i4', 'q': '<i8'}
+
+
+def is_binary_workload(file_path: str) -> bool:
+    """
+    Checks whether the given file starts with the binary workload magic number.
+
+    Args:
+        file_path (str): The path to the file.
+
+    Returns:
+        bool: True if the file is a binary workload file.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+    """
+    with open(file_path, 'rb') as file:
+        return file.read(len(MAGIC)) == MAGIC
+
+
+def write_binary_workload(
+    file_path: str,
+    arrival_times: Sequence[int],
+    burst_times: Sequence[int],
+    priorities: Sequence[int],
+    typecode: str = 'q'
+):
+    """
+    Writes process columns to a fixed-width binary workload file.
+
+    The file holds a 16-byte header followed by the arrival time, burst time and
+    priority columns, each stored contiguously as little-endian int32 ('i') or int64 ('q').
+
+    Args:
+        file_path (str): The path of the file to write.
+        arrival_times (Sequence[int]): The arrival time of each process.
+        burst_times (Sequence[int]): The burst time of each process.
+        priorities (Sequence[int]): The priority of each process.
+        typecode (str): 'i' for int32 columns or 'q' for int64 columns.
+
+    Raises:
+        ValueError: If the type code is unknown, the columns differ in length or a value does not fit.
+    """
+    import numpy as np
+    if typecode not in TYPECODES:
+        raise ValueError(f"Unsupported column type '{typecode}'. Expected 'i' or 'q'.")
+    dtype = np.dtype(TYPECODES[typecode])
+    columns = [as_int_array(column) for column in (arrival_times, burst_times, priorities)]
+    n = len(columns[0])
+    if any(len(column) != n for column in columns):
+        raise ValueError("All process columns must have the same length.")
+    limits = np.iinfo(dtype)
+    for column in columns:
+        if n and (column.min() < limits.min or column.max() > limits.max):
+            raise ValueError(f"Process data does not fit in {dtype.itemsize * 8}-bit columns.")
+
+    with open(file_path, 'wb') as file:
+        file.write(HEADER.pack(MAGIC, VERSION, typecode.encode('ascii'), n))
+        for column in columns:
+            file.write(column.astype(dtype, copy=False).tobytes())
+
+
+def read_binary_workload(file_path: str) -> ProcessTable:
+    """
+    Loads a binary workload file by memory-mapping it.
+
+    On little-endian hosts the input columns of the returned table are read-only views
+    straight into the mapped file, so no process data is copied.
+
+    Args:
+        file_path (str): The path to the binary workload file.
+
+    Returns:
+        ProcessTable: A table whose arrival, burst and priority columns view the file.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+        ValueError: If the file is not a valid binary workload or holds invalid process data.
+    """
+    import numpy as np
+    with open(file_path, 'rb') as file:
+        header = file.read(HEADER.size)
+        if len(header) < HEADER.size:
+            raise ValueError(f"'{file_path}' is not a binary workload file.")
+        magic, version, typecode, n = HEADER.unpack(header)
+        if magic != MAGIC:
+            raise ValueError(f"'{file_path}' is not a binary workload file.")
+        if version != VERSION:
+            raise ValueError(f"Unsupported binary workload version {version}.")
+        typecode = typecode.decode('ascii')
+        if typecode not in TYPECODES:
+            raise ValueError(f"Unsupported column type '{typecode}'.")
+        if n == 0:
+            raise ValueError("Input file contains no valid process data.")
+        itemsize = np.dtype(TYPECODES[typecode]).itemsize
+        file.seek(0, 2)
+        if file.tell() != HEADER.size + 3 * n * itemsize:
+            raise ValueError(f"'{file_path}' is truncated or has trailing data.")
+        mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    columns = []
+    for column_index in range(3):
+        offset = HEADER.size + column_index * n * itemsize
+        view = memoryview(mapped)[offset:offset + n * itemsize]
+        if sys.byteorder == 'little':
+            columns.append(view.cast(typecode))
+        else:
+            columns.append(np.frombuffer(view, dtype=TYPECODES[typecode]).astype(np.int64))
+
+    # Same checks as the text loader, reported by record number
+    arrival_times, burst_times, priorities = (as_int_array(column) for column in columns)
+    invalid = (arrival_times < 0) | (burst_times <= 0) | (priorities < 0)
+    if invalid.any():
+        raise ValueError(
+            f"Record {int(invalid.argmax()) + 1}: Invalid values. Arrival time and priority must be non-negative; burst time must be positive."
+        )
+
+    return ProcessTable.from_columns(*columns)
+
+
+def text_to_binary(text_path: str, binary_path: str, typecode: str = 'q'):
+    """
+    Converts a text workload file to a binary workload file.
+
+    Args:
+        text_path (str): The path to the text workload file.
+        binary_path (str): The path of the binary file to write.
+        typecode (str): 'i' for int32 columns or 'q' for int64 columns.
+    """
+    # Imported here because input_handler itself depends on this module
+    from utils.input_handler import read_process_table
+
+    table = read_process_table(text_path)
+    write_binary_workload(binary_path, table.arrival_times, table.burst_times, table.priorities, typecode)
+
+
+def binary_to_text(binary_path: str, text_path: str):
+    """
+    Converts a binary workload file to a text workload file.
+
+    Args:
+        binary_path (str): The path to the binary workload file.
+        text_path (str): The path of the text file to write.
+    """
+    import numpy as np
+    table = read_binary_workload(binary_path)
+    data = np.column_stack([
+        as_int_array(table.arrival_times),
+        as_int_array(table.burst_times),
+        as_int_array(table.priorities)
+    ])
+    np.savetxt(text_path, data, fmt='%d')
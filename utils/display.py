@@ -1,39 +1,71 @@
-from models.process import Process
+from typing import Dict, List
+from models.process_table import Processes, ProcessTable, NOT_STARTED
 from tabulate import tabulate
-from typing import List
+from utils.metrics import average_times
 
-def display_process_info(processes: List[Process]):
+def display_process_info(processes: Processes):
     """
     Displays the scheduling information for each process.
 
     Args:
-        processes (List[Process]): The list of processes with scheduling info.
+        processes (Processes): The list of processes or ProcessTable with scheduling info.
     """
     if not processes:
         print("No processes to display.")
         return
 
     headers = ["Process", "Arrival", "Burst", "Priority", "Start", "Completion", "Waiting", "Turnaround"]
-    table = []
-    for process in processes:
-        table.append([
-            f"P{process.id}",
-            process.arrival_time,
-            process.burst_time,
-            process.priority,
-            process.start_time,
-            process.completion_time,
-            process.waiting_time,
-            process.turnaround_time
-        ])
+    if isinstance(processes, ProcessTable):
+        # Read the columns directly instead of building a view per row
+        table = [
+            [f"P{pid}", arrival, burst, priority, None if start == NOT_STARTED else start,
+             completion, waiting, turnaround]
+            for pid, arrival, burst, priority, start, completion, waiting, turnaround in zip(
+                processes.ids, processes.arrival_times, processes.burst_times, processes.priorities,
+                processes.start_times, processes.completion_times, processes.waiting_times,
+                processes.turnaround_times
+            )
+        ]
+        waiting_times = processes.waiting_times
+        turnaround_times = processes.turnaround_times
+    else:
+        table = []
+        for process in processes:
+            table.append([
+                f"P{process.id}",
+                process.arrival_time,
+                process.burst_time,
+                process.priority,
+                process.start_time,
+                process.completion_time,
+                process.waiting_time,
+                process.turnaround_time
+            ])
+        waiting_times = [p.waiting_time for p in processes]
+        turnaround_times = [p.turnaround_time for p in processes]
 
     print(tabulate(table, headers=headers, tablefmt="grid"))
 
-    total_waiting_time = sum(p.waiting_time for p in processes)
-    total_turnaround_time = sum(p.turnaround_time for p in processes)
     n = len(processes)
     if n > 0:
-        print(f"\nAverage Waiting Time: {total_waiting_time / n:.2f}")
-        print(f"Average Turnaround Time: {total_turnaround_time / n:.2f}")
+        average_waiting_time, average_turnaround_time = average_times(waiting_times, turnaround_times)
+        print(f"\nAverage Waiting Time: {average_waiting_time:.2f}")
+        print(f"Average Turnaround Time: {average_turnaround_time:.2f}")
     else:
         print("\nNo processes to calculate average times.")
+
+
+def display_core_metrics(core_metrics: List[Dict[str, float]]):
+    """
+    Displays the busy time, utilization, dispatches, migrations and steals of each core.
+
+    Args:
+        core_metrics (List[Dict[str, float]]): The per-core metrics of a multi-core simulation.
+    """
+    headers = ["Core", "Busy", "Utilization", "Dispatches", "Migrations", "Steals"]
+    table = [
+        [f"CPU{metrics['core']}", metrics['busy_time'], f"{metrics['utilization']:.2%}",
+         metrics['dispatches'], metrics['migrations'], metrics['steals']]
+        for metrics in core_metrics
+    ]
+    print(tabulate(table, headers=headers, tablefmt="grid"))
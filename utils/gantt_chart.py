@@ -1,68 +1,152 @@
-from typing import List, Dict
-import shutil
+import sys
+from typing import Iterator, Optional, TextIO, Tuple
+from models.timeline import IDLE, GanttChart, Timeline, as_timeline
 
 
-def generate_gantt_chart(gantt_chart: List[Dict]):
+def _cells(timeline: Timeline, begin: int, end: int, time_scale: int) -> Iterator[Tuple[int, int]]:
     """
-    Generates and displays the Gantt chart based on the execution timeline.
+    Yields (process_id, columns) cells covering [begin, end), time_scale time units per column.
+
+    Gaps between segments are reported as IDLE. A column shared by several segments shows
+    the process that occupies most of it. Runs of columns with the same process are merged
+    into one cell, and a segment covering many columns is handled in one step, so the cost
+    is proportional to the number of segments plus the number of columns.
+    """
+    process_ids, start_times, durations = timeline.process_ids, timeline.start_times, timeline.durations
+    n = len(process_ids)
+    index = 0
+    column_start = begin
+    label = None
+    count = 0
+
+    while column_start < end:
+        column_end = min(column_start + time_scale, end)
+        # Skip segments that end before this column
+        while index < n and start_times[index] + durations[index] <= column_start:
+            index += 1
+
+        # Find the run (segment or gap) containing the start of the column
+        if index < n and start_times[index] <= column_start:
+            run_label = process_ids[index]
+            run_end = start_times[index] + durations[index]
+        else:
+            run_label = IDLE
+            run_end = start_times[index] if index < n else end
+
+        if run_end >= column_end:
+            # The run covers whole columns; count them in one step
+            covered_end = min(run_end, end)
+            columns = (covered_end - column_start) // time_scale
+            if covered_end == end and (end - column_start) % time_scale:
+                columns += 1
+            column_label = run_label
+        else:
+            # Mixed column: pick the process with the largest share
+            shares = {}
+            time = column_start
+            position = index
+            while time < column_end:
+                if position < n and start_times[position] <= time:
+                    part_label = process_ids[position]
+                    part_end = min(start_times[position] + durations[position], column_end)
+                    position += 1
+                else:
+                    part_label = IDLE
+                    part_end = min(start_times[position], column_end) if position < n else column_end
+                shares[part_label] = shares.get(part_label, 0) + part_end - time
+                time = part_end
+            column_label = max(shares, key=shares.get)
+            columns = 1
+
+        if column_label == label:
+            count += columns
+        else:
+            if label is not None:
+                yield label, count
+            label, count = column_label, columns
+        column_start += columns * time_scale
+
+    if label is not None:
+        yield label, count
+
+
+def render_gantt_chart(
+    gantt_chart: GanttChart,
+    writer: Optional[TextIO] = None,
+    start_time: Optional[int] = None,
+    end_time: Optional[int] = None,
+    time_scale: int = 1,
+    width: Optional[int] = None
+):
+    """
+    Renders the Gantt chart and streams it to writer one line block at a time.
+
+    Only the lines being built are held in memory, so the output cost depends on the
+    number of columns drawn rather than on the length of the trace. A window limits
+    the chart to [start_time, end_time), and time_scale maps that many time units to
+    each column.
 
     Args:
-        gantt_chart (List[Dict]): The execution timeline as a list of dictionaries.
+        gantt_chart (GanttChart): The execution timeline as a Timeline or a list of dictionaries.
+        writer (Optional[TextIO]): Where to write the chart; defaults to standard output.
+        start_time (Optional[int]): The start of the window; defaults to the first segment.
+        end_time (Optional[int]): The end of the window (exclusive); defaults to the end of the timeline.
+        time_scale (int): The number of time units drawn per column.
+        width (Optional[int]): The maximum line width; defaults to the terminal width.
+
+    Raises:
+        ValueError: If time_scale is not a positive integer.
     """
-    if not gantt_chart:
-        print("No Gantt chart to display.")
+    if time_scale <= 0:
+        raise ValueError("Time scale must be a positive integer.")
+    if writer is None:
+        writer = sys.stdout
+
+    timeline = as_timeline(gantt_chart)
+    if timeline:
+        begin = timeline.start_times[0] if start_time is None else start_time
+        end = timeline.end_time if end_time is None else min(end_time, timeline.end_time)
+    if not timeline or begin >= end:
+        writer.write("No Gantt chart to display.\n")
         return
+    if start_time is not None or end_time is not None:
+        timeline = timeline.window(begin, end)
 
-    # Merge consecutive events with the same process_id
-    merged_events = []
-    for event in gantt_chart:
-        if not merged_events:
-            merged_events.append(event.copy())
-        else:
-            last_event = merged_events[-1]
-            if (
-                event['process_id'] == last_event['process_id']
-                and event['start_time'] == last_event['start_time'] + last_event['duration']
-            ):
-                merged_events[-1]['duration'] += event['duration']
-            else:
-                merged_events.append(event.copy())
-
-    # Determine the length of the longest time value
-    time_values = [event['start_time'] for event in merged_events]
-    time_values.append(merged_events[-1]['start_time'] + merged_events[-1]['duration'])
-    max_time_length = max(len(str(time)) for time in time_values)
+    # Times only grow, so the end time is the longest time value
+    max_time_length = len(str(end))
 
     # Get terminal width and adjust for time labels
-    columns, _ = shutil.get_terminal_size(fallback=(80, 24))
-    max_width = columns - (max_time_length + 1)
+    if width is None:
+        import shutil
+        width, _ = shutil.get_terminal_size(fallback=(80, 24))
+    max_width = width - (max_time_length + 1)
 
     # Determine the length of the longest process name
-    process_names = [f"P{event['process_id']}" for event in merged_events if event['process_id'] != 'Idle']
-    longest_process_name = max((len(name) for name in process_names), default=2)
+    largest_id = max((process_id for process_id in timeline.process_ids if process_id != IDLE), default=None)
+    longest_process_name = 2 if largest_id is None else len(f"P{largest_id}")
     unit_width = 4 + longest_process_name  # 4 additional spaces for padding
 
     # Calculate maximum units per line
     max_units_per_line = max(1, (max_width) // (unit_width + 1))  # +1 for '+'
 
-    chart_lines = []
-    index = 0
-    current_time = merged_events[0]['start_time']
+    writer.write("\nGantt Chart:\n")
+    cells = _cells(timeline, begin, end, time_scale)
+    cell = next(cells, None)
+    column = 0
 
-    while index < len(merged_events):
+    while cell is not None:
         line_top = "+"
         line_middle = "|"
         line_bottom = "+"
         time_positions = []
         units_in_line = 0
 
-        while units_in_line < max_units_per_line and index < len(merged_events):
-            event = merged_events[index]
-            duration = event['duration']
+        while units_in_line < max_units_per_line and cell is not None:
+            process_id, units = cell
 
             # Calculate units to draw in the current line
             remaining_units = max_units_per_line - units_in_line
-            units_to_draw = min(duration, remaining_units)
+            units_to_draw = min(units, remaining_units)
             cell_width = units_to_draw * unit_width
 
             # Build top and bottom lines without labels
@@ -70,32 +154,25 @@ def generate_gantt_chart(gantt_chart: List[Dict]):
             line_bottom += "-" * cell_width + "+"
 
             # Prepare the label centered in the cell
-            process_id = event['process_id']
-            if process_id == 'Idle':
-                label = "Idle"
-            else:
-                label = f"P{process_id}"
-            label = label.center(cell_width)
-
-            # Add the label to the middle line
-            line_middle += label + "|"
+            label = "Idle" if process_id == IDLE else f"P{process_id}"
+            line_middle += label.center(cell_width) + "|"
 
             # Record the position of the '+' sign for time labels
             position = len(line_top) - cell_width - 1
-            time_positions.append((position, current_time))
+            time_positions.append((position, min(begin + column * time_scale, end)))
 
-            # Update counters and event details
-            current_time += units_to_draw
+            # Update counters and cell details
+            column += units_to_draw
             units_in_line += units_to_draw
 
-            if units_to_draw < duration:
-                # Update event for remaining duration
-                merged_events[index]['duration'] -= units_to_draw
+            if units_to_draw < units:
+                # Keep the remaining columns for the next line
+                cell = (process_id, units - units_to_draw)
             else:
-                index += 1  # Move to the next event
+                cell = next(cells, None)
 
         # Append the final '+' position and time with an extra space
-        time_positions.append((len(line_top) - 1, current_time))
+        time_positions.append((len(line_top) - 1, min(begin + column * time_scale, end)))
 
         # Build the time line
         time_line = [' '] * len(line_top)
@@ -105,29 +182,27 @@ def generate_gantt_chart(gantt_chart: List[Dict]):
                 time_str = f" {time_value}"
             else:
                 time_str = str(time_value)
-            time_start = pos
-            time_end = time_start + len(time_str)
+            time_end = pos + len(time_str)
             if time_end > len(time_line):
                 time_line.extend([' '] * (time_end - len(time_line)))
-            for j, char in enumerate(time_str):
-                if time_start + j < len(time_line):
-                    time_line[time_start + j] = char
-                else:
-                    time_line.append(char)
+            time_line[pos:time_end] = time_str
 
-        time_line_str = ''.join(time_line).rstrip()
+        time_line_str = ''.join(time_line).strip()
 
-        # Remove leading space from the first time line only
-        if not chart_lines:
-            time_line_str = time_line_str.lstrip()
-        else:
-            time_line_str = time_line_str.lstrip()
+        writer.write(f"{line_top}\n{line_middle}\n{line_bottom}\n{time_line_str}\n")
+
+    writer.write("\n")
 
-        # Append the current segment to chart_lines
-        chart_lines.extend([line_top, line_middle, line_bottom, time_line_str])
 
-    # Print the Gantt chart
-    print("\nGantt Chart:")
-    for line in chart_lines:
-        print(line)
-    print()
+def generate_gantt_chart(gantt_chart: GanttChart):
+    """
+    Generates and displays the Gantt chart based on the execution timeline.
+
+    Args:
+        gantt_chart (GanttChart): The execution timeline as a Timeline or a list of dictionaries.
+    """
+    if not gantt_chart:
+        print("No Gantt chart to display.")
+        return
+
+    render_gantt_chart(gantt_chart)
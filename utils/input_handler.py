@@ -1,9 +1,63 @@
+import os
+import warnings
+from array import array
+from typing import TYPE_CHECKING, Optional, Tuple
 from models.process import Process
+from models.process_table import ProcessTable
+from utils.binary_workload import is_binary_workload, read_binary_workload
+
+if TYPE_CHECKING:
+    import numpy as np
+
+INT64_MAX = (1 << 63) - 1
+# Text files smaller than this are parsed line by line, which is faster than importing NumPy
+SMALL_FILE_BYTES = 1 << 18
+
+
+def parse_record(line: str, line_number: int) -> Optional[Tuple[int, int, int]]:
+    """
+    Parses one 'arrival_time burst_time priority' line of process data.
+
+    Args:
+        line (str): The line to parse.
+        line_number (int): The line number used in error messages.
+
+    Returns:
+        Optional[Tuple[int, int, int]]: The arrival time, burst time and priority, or None for a blank line.
+
+    Raises:
+        ValueError: If the line is invalid.
+    """
+    parts = line.split()
+    if not parts:
+        return None  # Skip empty lines
+    if len(parts) != 3:
+        raise ValueError(
+            f"Line {line_number}: Expected 3 values per line (arrival_time burst_time priority)."
+        )
+    try:
+        arrival_time = int(parts[0])
+        burst_time = int(parts[1])
+        priority = int(parts[2])
+    except ValueError:
+        raise ValueError(f"Line {line_number}: All values must be integers.")
+    if arrival_time < 0 or burst_time <= 0 or priority < 0:
+        raise ValueError(
+            f"Line {line_number}: Invalid values. Arrival time and priority must be non-negative; burst time must be positive."
+        )
+    # Values are stored as 64-bit integers by every loader
+    if max(arrival_time, burst_time, priority) > INT64_MAX:
+        raise ValueError(f"Line {line_number}: Values must not exceed {INT64_MAX}.")
+    return arrival_time, burst_time, priority
+
 
 def read_process_data(file_path: str):
     """
     Reads process data from the specified input file.
 
+    Processes are numbered from 1 in file order, so every load of a file yields the
+    same ids, like the ids of a ProcessTable.
+
     Args:
         file_path (str): The path to the input file containing process data.
 
@@ -17,26 +71,121 @@ def read_process_data(file_path: str):
     processes = []
     with open(file_path, 'r') as file:
         for line_number, line in enumerate(file, start=1):
-            stripped_line = line.strip()
-            if not stripped_line:
-                continue  # Skip empty lines
-            parts = stripped_line.split()
-            if len(parts) != 3:
-                raise ValueError(
-                    f"Line {line_number}: Expected 3 values per line (arrival_time burst_time priority)."
-                )
-            try:
-                arrival_time = int(parts[0])
-                burst_time = int(parts[1])
-                priority = int(parts[2])
-            except ValueError:
-                raise ValueError(f"Line {line_number}: All values must be integers.")
-            if arrival_time < 0 or burst_time <= 0 or priority < 0:
-                raise ValueError(
-                    f"Line {line_number}: Invalid values. Arrival time and priority must be non-negative; burst time must be positive."
-                )
-            process = Process(arrival_time, burst_time, priority)
-            processes.append(process)
+            record = parse_record(line, line_number)
+            if record is not None:
+                processes.append(Process(*record, len(processes) + 1))
     if not processes:
         raise ValueError("Input file contains no valid process data.")
     return processes
+
+
+def _parse_lines(lines, first_line_number: int) -> 'np.ndarray':
+    """
+    Parses lines of process data one at a time, raising the error for the first invalid line.
+
+    Args:
+        lines (List[str]): The lines to parse.
+        first_line_number (int): The line number of the first line in the file.
+
+    Returns:
+        np.ndarray: An (n, 3) array of arrival time, burst time and priority.
+
+    Raises:
+        ValueError: If a line is invalid or incomplete.
+    """
+    import numpy as np
+    rows = []
+    for line_number, line in enumerate(lines, start=first_line_number):
+        record = parse_record(line, line_number)
+        if record is not None:
+            rows.append(record)
+    return np.array(rows, dtype=np.int64).reshape(-1, 3)
+
+
+def _read_small_table(file_path: str) -> ProcessTable:
+    """Reads a small text workload line by line into a ProcessTable, without NumPy."""
+    columns = (array('q'), array('q'), array('q'))
+    with open(file_path, 'r') as file:
+        for line_number, line in enumerate(file, start=1):
+            record = parse_record(line, line_number)
+            if record is not None:
+                for column, value in zip(columns, record):
+                    column.append(value)
+    if not columns[0]:
+        raise ValueError("Input file contains no valid process data.")
+    return ProcessTable.from_columns(*columns)
+
+
+def read_process_table(file_path: str, chunk_size: int = 1 << 24) -> ProcessTable:
+    """
+    Reads process data from the specified input file in bulk.
+
+    The file is read in chunks of roughly chunk_size bytes and each chunk is parsed with
+    NumPy. A chunk that fails to parse or validate is re-parsed line by line so errors
+    carry the same line numbers and messages as read_process_data. Files smaller than
+    SMALL_FILE_BYTES are parsed line by line instead, so small runs never import NumPy.
+
+    Args:
+        file_path (str): The path to the input file containing process data.
+        chunk_size (int): The approximate number of bytes parsed at a time.
+
+    Returns:
+        ProcessTable: A table holding the arrival time, burst time and priority of each process.
+
+    Raises:
+        FileNotFoundError: If the input file does not exist.
+        ValueError: If the input data is invalid or incomplete.
+    """
+    if os.path.getsize(file_path) < SMALL_FILE_BYTES:
+        return _read_small_table(file_path)
+    import numpy as np
+    blocks = []
+    line_number = 1
+    with open(file_path, 'r') as file:
+        while True:
+            lines = file.readlines(chunk_size)
+            if not lines:
+                break
+            try:
+                with warnings.catch_warnings():
+                    # Chunks made only of blank lines are valid and simply empty
+                    warnings.simplefilter('ignore', UserWarning)
+                    block = np.loadtxt(lines, dtype=np.int64, comments=None, ndmin=2)
+            except (ValueError, OverflowError):
+                # Re-parsed line by line below, which reports the offending line
+                block = None
+            if block is not None and block.size and block.shape[1] != 3:
+                block = None
+            if block is not None and block.size and (
+                (block[:, 0] < 0).any() or (block[:, 1] <= 0).any() or (block[:, 2] < 0).any()
+            ):
+                block = None
+            if block is None:
+                block = _parse_lines(lines, line_number)
+            if block.size:
+                blocks.append(block)
+            line_number += len(lines)
+
+    if not blocks:
+        raise ValueError("Input file contains no valid process data.")
+    data = np.concatenate(blocks) if len(blocks) > 1 else blocks[0]
+    return ProcessTable.from_columns(data[:, 0], data[:, 1], data[:, 2])
+
+
+def read_workload(file_path: str) -> ProcessTable:
+    """
+    Reads a workload from either a text file or a binary workload file.
+
+    Args:
+        file_path (str): The path to the workload file.
+
+    Returns:
+        ProcessTable: The processes of the workload.
+
+    Raises:
+        FileNotFoundError: If the input file does not exist.
+        ValueError: If the input data is invalid or incomplete.
+    """
+    if is_binary_workload(file_path):
+        return read_binary_workload(file_path)
+    return read_process_table(file_path)
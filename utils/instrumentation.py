@@ -0,0 +1,248 @@
+import heapq
+import time
+from collections import deque
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, TextIO, Tuple, TypeVar
+
+T = TypeVar('T')
+
+PHASES = ('admission', 'selection', 'dispatch', 'bookkeeping')
+# Event kind of algorithms.event_engine.COMPLETION, repeated here to avoid a circular import
+COMPLETION = 'completion'
+
+
+class SchedulerStats:
+    """
+    Collects decision counters, ready-queue depth and per-phase timings for one simulation.
+
+    Pass an instance to any scheduling function to enable instrumentation. Without
+    one, the schedulers bind the plain heapq functions and deque, so disabled
+    instrumentation adds no work to the hot loops.
+
+    Attributes:
+        decisions (int): Times a process was selected from the ready queue.
+        preemptions (int): Times a process lost the CPU before completing.
+        context_switches (int): Changes of the running process, ignoring idle gaps.
+        queue_operations (int): Insertions into and removals from the ready queue.
+        peak_queue_length (int): The largest number of processes waiting at once.
+        phase_seconds (Dict[str, float]): Time spent in admission, selection, dispatch and bookkeeping.
+    """
+
+    def __init__(self):
+        self.decisions = 0
+        self.preemptions = 0
+        self.context_switches = 0
+        self.queue_operations = 0
+        self.peak_queue_length = 0
+        self.phase_seconds = {phase: 0.0 for phase in PHASES}
+        self._queue_length = 0
+
+    def _grow(self, count: int):
+        self.queue_operations += count
+        self._queue_length += count
+        if self._queue_length > self.peak_queue_length:
+            self.peak_queue_length = self._queue_length
+
+    def _shrink(self):
+        self.queue_operations += 1
+        self.decisions += 1
+        self._queue_length -= 1
+
+    def heap_push(self) -> Callable[[List, Any], None]:
+        """Returns a counting, timed replacement for heapq.heappush."""
+        def push(heap: List, item: Any):
+            started = time.perf_counter()
+            heapq.heappush(heap, item)
+            self.phase_seconds['admission'] += time.perf_counter() - started
+            self._grow(1)
+        return push
+
+    def heap_pop(self) -> Callable[[List], Any]:
+        """Returns a counting, timed replacement for heapq.heappop."""
+        def pop(heap: List) -> Any:
+            started = time.perf_counter()
+            item = heapq.heappop(heap)
+            self.phase_seconds['selection'] += time.perf_counter() - started
+            self._shrink()
+            return item
+        return pop
+
+    def queue(self) -> deque:
+        """Returns an empty counting, timed deque for FIFO ready queues."""
+        stats = self
+
+        class InstrumentedDeque(deque):
+            def append(self, item):
+                started = time.perf_counter()
+                super().append(item)
+                stats.phase_seconds['admission'] += time.perf_counter() - started
+                stats._grow(1)
+
+            def extend(self, items):
+                items = list(items)
+                started = time.perf_counter()
+                super().extend(items)
+                stats.phase_seconds['admission'] += time.perf_counter() - started
+                stats._grow(len(items))
+
+            def popleft(self):
+                started = time.perf_counter()
+                item = super().popleft()
+                stats.phase_seconds['selection'] += time.perf_counter() - started
+                stats._shrink()
+                return item
+
+        return InstrumentedDeque()
+
+    def full_rounds(self, advance: Callable[..., T]) -> Callable[..., T]:
+        """
+        Returns a counting, timed replacement for a step that runs full Round Robin rounds at once.
+
+        Each skipped round stands for one selection and one re-enqueue of every queued
+        process, so the counters match those of running the rounds slice by slice.
+
+        Args:
+            advance (Callable[..., T]): The step, called as advance(rounds, queue, ...).
+
+        Returns:
+            Callable[..., T]: The wrapped step.
+        """
+        def skip(rounds: int, queue, *args) -> T:
+            started = time.perf_counter()
+            result = advance(rounds, queue, *args)
+            self.phase_seconds['selection'] += time.perf_counter() - started
+            slices = rounds * len(queue)
+            self.decisions += slices
+            self.queue_operations += 2 * slices
+            return result
+        return skip
+
+    def policy_hooks(self, policy) -> Tuple[Callable, Callable, Callable]:
+        """
+        Returns counting, timed versions of a scheduling policy's queue hooks.
+
+        Args:
+            policy (SchedulingPolicy): The policy whose on_arrival, select_next and on_preempt hooks are wrapped.
+
+        Returns:
+            Tuple[Callable, Callable, Callable]: The wrapped on_arrival, select_next and on_preempt hooks.
+        """
+        def on_arrival(tasks, time_now):
+            started = time.perf_counter()
+            policy.on_arrival(tasks, time_now)
+            self.phase_seconds['admission'] += time.perf_counter() - started
+            self._grow(len(tasks))
+
+        def select_next(time_now):
+            started = time.perf_counter()
+            task = policy.select_next(time_now)
+            self.phase_seconds['selection'] += time.perf_counter() - started
+            self._shrink()
+            return task
+
+        def on_preempt(task, time_now):
+            started = time.perf_counter()
+            policy.on_preempt(task, time_now)
+            self.phase_seconds['admission'] += time.perf_counter() - started
+            self._grow(1)
+
+        return on_arrival, select_next, on_preempt
+
+    def timed(self, function: Callable[..., T], phase: str) -> Callable[..., T]:
+        """Returns a version of function whose running time counts toward the given phase."""
+        def call(*args, **kwargs) -> T:
+            started = time.perf_counter()
+            result = function(*args, **kwargs)
+            self.phase_seconds[phase] += time.perf_counter() - started
+            return result
+        return call
+
+    def timed_arrivals(self, jobs: Iterable[T]) -> Iterator[T]:
+        """Wraps an arrival stream so the time spent producing arrivals counts as admission."""
+        jobs = iter(jobs)
+        while True:
+            started = time.perf_counter()
+            job = next(jobs, None)
+            self.phase_seconds['admission'] += time.perf_counter() - started
+            if job is None:
+                return
+            yield job
+
+    def observe(self, events: Iterable[Tuple]) -> Iterator[Tuple]:
+        """
+        Passes an engine's event stream through, counting preemptions and context switches.
+
+        Time spent producing events, less the admission and selection time measured inside
+        the engine, counts as dispatch; time spent by the consumer counts as bookkeeping.
+
+        Args:
+            events (Iterable[Tuple]): (kind, index, start_time, value) events from an engine.
+
+        Yields:
+            Tuple: The same events.
+        """
+        events = iter(events)
+        queue_seconds = self.phase_seconds['admission'] + self.phase_seconds['selection']
+        engine_seconds = 0.0
+        bookkeeping_seconds = 0.0
+        # Process holding the CPU and whether it has completed
+        running = None
+        completed = True
+
+        while True:
+            started = time.perf_counter()
+            event = next(events, None)
+            resumed = time.perf_counter()
+            engine_seconds += resumed - started
+            if event is None:
+                break
+
+            kind, index = event[0], event[1]
+            if kind == COMPLETION:
+                completed = True
+            elif index is not None:
+                if index != running:
+                    if running is not None:
+                        self.context_switches += 1
+                    if not completed:
+                        self.preemptions += 1
+                running = index
+                completed = False
+
+            yield event
+            bookkeeping_seconds += time.perf_counter() - resumed
+
+        queue_seconds = self.phase_seconds['admission'] + self.phase_seconds['selection'] - queue_seconds
+        self.phase_seconds['dispatch'] += max(engine_seconds - queue_seconds, 0.0)
+        self.phase_seconds['bookkeeping'] += bookkeeping_seconds
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Returns the counters and phase timings as a dictionary."""
+        return {
+            'decisions': self.decisions,
+            'preemptions': self.preemptions,
+            'context_switches': self.context_switches,
+            'queue_operations': self.queue_operations,
+            'peak_queue_length': self.peak_queue_length,
+            'phase_seconds': dict(self.phase_seconds)
+        }
+
+    def to_json(self) -> str:
+        """Returns the counters and phase timings as JSON."""
+        import json
+        return json.dumps(self.to_dict(), indent=2)
+
+    def report(self, writer: Optional[TextIO] = None):
+        """
+        Prints the counters and phase timings.
+
+        Args:
+            writer (Optional[TextIO]): Where to print; defaults to standard output.
+        """
+        print("\nScheduler Statistics:", file=writer)
+        print(f"  Scheduling decisions: {self.decisions}", file=writer)
+        print(f"  Preemptions:          {self.preemptions}", file=writer)
+        print(f"  Context switches:     {self.context_switches}", file=writer)
+        print(f"  Queue operations:     {self.queue_operations}", file=writer)
+        print(f"  Peak queue length:    {self.peak_queue_length}", file=writer)
+        for phase in PHASES:
+            print(f"  {phase.capitalize() + ' time:':22}{self.phase_seconds[phase]:.6f} s", file=writer)
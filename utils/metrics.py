@@ -0,0 +1,115 @@
+from typing import TYPE_CHECKING, Dict, Sequence, Tuple
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# Columns shorter than this are processed in pure Python: importing NumPy alone takes
+# longer than that, and small workloads never need it
+VECTORIZE_MIN_ROWS = 50_000
+
+
+def as_int_array(column: Sequence[int]) -> 'np.ndarray':
+    """
+    Returns the given integer column as a NumPy int64 array.
+
+    Columns that expose a 64-bit buffer, such as the array('q') columns of a
+    ProcessTable, are wrapped without copying.
+
+    Args:
+        column (Sequence[int]): An array('q'), memoryview, NumPy array or list of integers.
+
+    Returns:
+        np.ndarray: The column as an int64 array.
+    """
+    import numpy as np
+    if isinstance(column, np.ndarray):
+        return column.astype(np.int64, copy=False)
+    try:
+        view = memoryview(column)
+    except TypeError:
+        return np.asarray(column, dtype=np.int64)
+    if view.format == 'q':
+        return np.frombuffer(view, dtype=np.int64)
+    return np.asarray(view, dtype=np.int64)
+
+
+def compute_times(
+    arrival_times: 'np.ndarray',
+    burst_times: 'np.ndarray',
+    completion_times: 'np.ndarray'
+) -> Tuple['np.ndarray', 'np.ndarray']:
+    """
+    Computes turnaround and waiting times elementwise.
+
+    Args:
+        arrival_times (np.ndarray): The arrival time of each process.
+        burst_times (np.ndarray): The burst time of each process.
+        completion_times (np.ndarray): The completion time of each process.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: The turnaround and waiting time of each process.
+    """
+    turnaround_times = completion_times - arrival_times
+    waiting_times = turnaround_times - burst_times
+    return turnaround_times, waiting_times
+
+
+def average_times(waiting_times: Sequence[int], turnaround_times: Sequence[int]) -> Tuple[float, float]:
+    """
+    Computes the average waiting and turnaround times.
+
+    Args:
+        waiting_times (Sequence[int]): The waiting time of each process.
+        turnaround_times (Sequence[int]): The turnaround time of each process.
+
+    Returns:
+        Tuple[float, float]: The average waiting time and the average turnaround time.
+    """
+    n = len(waiting_times)
+    # Integer sums are exact; divide once at the end like the scalar averages did
+    if n < VECTORIZE_MIN_ROWS:
+        return sum(waiting_times) / n, sum(turnaround_times) / n
+    return int(as_int_array(waiting_times).sum()) / n, int(as_int_array(turnaround_times).sum()) / n
+
+
+def summarize_schedule(
+    arrival_times: Sequence[int],
+    burst_times: Sequence[int],
+    waiting_times: Sequence[int],
+    turnaround_times: Sequence[int],
+    segment_count: int
+) -> Dict[str, float]:
+    """
+    Computes summary metrics for one scheduled workload.
+
+    Args:
+        arrival_times (Sequence[int]): The arrival time of each process.
+        burst_times (Sequence[int]): The burst time of each process.
+        waiting_times (Sequence[int]): The waiting time of each process.
+        turnaround_times (Sequence[int]): The turnaround time of each process.
+        segment_count (int): The number of segments in the execution timeline.
+
+    Returns:
+        Dict[str, float]: The process count, average and maximum waiting and turnaround
+        times, makespan, throughput, CPU utilization and segment count.
+    """
+    arrival_times = as_int_array(arrival_times)
+    burst_times = as_int_array(burst_times)
+    waiting_times = as_int_array(waiting_times)
+    turnaround_times = as_int_array(turnaround_times)
+    n = len(arrival_times)
+    average_waiting_time, average_turnaround_time = average_times(waiting_times, turnaround_times)
+    first_arrival = int(arrival_times.min())
+    last_completion = int((arrival_times + turnaround_times).max())
+    makespan = last_completion - first_arrival
+    return {
+        'processes': n,
+        'average_waiting_time': average_waiting_time,
+        'average_turnaround_time': average_turnaround_time,
+        'max_waiting_time': int(waiting_times.max()),
+        'max_turnaround_time': int(turnaround_times.max()),
+        'makespan': makespan,
+        'throughput': n / makespan if makespan else 0.0,
+        'cpu_utilization': int(burst_times.sum()) / makespan if makespan else 0.0,
+        'segments': segment_count
+    }
@@ -0,0 +1,86 @@
+import csv
+import json
+from typing import Dict, Iterator, List, Optional, Sequence, TextIO, Tuple
+from models.process_table import Processes, ProcessTable, NOT_STARTED
+from models.timeline import GanttChart, as_timeline
+from utils.metrics import average_times
+
+FIELDS = [
+    'process_id', 'arrival_time', 'burst_time', 'priority', 'start_time',
+    'completion_time', 'waiting_time', 'turnaround_time'
+]
+
+
+def process_rows(processes: Processes) -> Iterator[Tuple]:
+    """
+    Yields the scheduling information of each process as a tuple ordered like FIELDS.
+
+    Args:
+        processes (Processes): The list of processes or ProcessTable with scheduling info.
+
+    Yields:
+        Tuple: One row per process; the start time is None if the process never started.
+    """
+    if isinstance(processes, ProcessTable):
+        # Read the columns directly instead of building a view per row
+        for row in zip(
+            processes.ids, processes.arrival_times, processes.burst_times, processes.priorities,
+            processes.start_times, processes.completion_times, processes.waiting_times,
+            processes.turnaround_times
+        ):
+            if row[4] == NOT_STARTED:
+                row = row[:4] + (None,) + row[5:]
+            yield row
+    else:
+        for process in processes:
+            yield (process.id, process.arrival_time, process.burst_time, process.priority,
+                   process.start_time, process.completion_time, process.waiting_time,
+                   process.turnaround_time)
+
+
+def write_csv(processes: Processes, output: TextIO):
+    """
+    Writes the scheduling information of each process as CSV.
+
+    Args:
+        processes (Processes): The list of processes or ProcessTable with scheduling info.
+        output (TextIO): The file to write to.
+    """
+    writer = csv.writer(output)
+    writer.writerow(FIELDS)
+    writer.writerows(process_rows(processes))
+
+
+def write_json(
+    processes: Processes,
+    output: TextIO,
+    gantt_chart: Optional[GanttChart] = None,
+    core_metrics: Optional[List[Dict[str, float]]] = None,
+    core_timelines: Optional[Sequence[GanttChart]] = None
+):
+    """
+    Writes the scheduling information, average times and, optionally, the timeline as JSON.
+
+    Args:
+        processes (Processes): The list of processes or ProcessTable with scheduling info.
+        output (TextIO): The file to write to.
+        gantt_chart (Optional[GanttChart]): The execution timeline to include, if any.
+        core_metrics (Optional[List[Dict[str, float]]]): The per-core metrics of a multi-core simulation, if any.
+        core_timelines (Optional[Sequence[GanttChart]]): The timeline of each core to include, if any.
+    """
+    rows = [dict(zip(FIELDS, row)) for row in process_rows(processes)]
+    result = {'processes': rows}
+    if rows:
+        average_waiting_time, average_turnaround_time = average_times(
+            [row['waiting_time'] for row in rows], [row['turnaround_time'] for row in rows]
+        )
+        result['average_waiting_time'] = average_waiting_time
+        result['average_turnaround_time'] = average_turnaround_time
+    if gantt_chart is not None:
+        result['gantt_chart'] = as_timeline(gantt_chart).to_events()
+    if core_metrics is not None:
+        result['cores'] = core_metrics
+    if core_timelines is not None:
+        result['core_gantt_charts'] = [as_timeline(timeline).to_events() for timeline in core_timelines]
+    json.dump(result, output, indent=2)
+    output.write("\n")
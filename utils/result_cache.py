@@ -0,0 +1,243 @@
+import hashlib
+import os
+import struct
+from typing import List, Optional, Sequence, Tuple
+import numpy as np
+from algorithms.registry import get_policy, run_algorithm
+from models.process_table import NOT_STARTED, Processes, ProcessTable, read_columns, take_rows, write_results
+from models.timeline import IDLE, Timeline
+from utils.metrics import as_int_array
+
+# Part of every cache key. Any commit that changes the scheduling output for an existing key
+# (the same columns, algorithm, time quantum and aging rate) must bump it, or stale entries
+# written by the older simulator are read back as current results.
+SIMULATOR_VERSION = 2
+
+# Header: magic, format version, padding, process count, segment count (little-endian)
+HEADER = struct.Struct('<4sHxxQQ')
+MAGIC = b'CPUR'
+VERSION = 1
+SUFFIX = '.bin'
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+
+def cache_key(
+    processes: Processes,
+    algorithm: str,
+    time_quantum: Optional[int] = None,
+    aging_rate: Optional[float] = None
+) -> str:
+    """
+    Returns the content hash identifying one simulation.
+
+    The key covers the arrival, burst and priority columns, the algorithm and the policy
+    class registered under its name, the time quantum, the aging rate and
+    SIMULATOR_VERSION. Process ids are left out, since they differ between loads of the
+    same workload.
+
+    Args:
+        processes (Processes): The list of processes or ProcessTable to schedule.
+        algorithm (str): The algorithm name.
+        time_quantum (Optional[int]): The time quantum, if the algorithm uses one.
+        aging_rate (Optional[float]): The priority aging rate, if the algorithm uses one.
+
+    Returns:
+        str: A hexadecimal digest usable as a file name.
+
+    Raises:
+        ValueError: If the algorithm is unknown.
+    """
+    _, arrival_times, burst_times, priorities = read_columns(processes)
+    policy = get_policy(algorithm)
+    reference = f"{policy.__module__}:{policy.__qualname__}"
+    if aging_rate is not None:
+        aging_rate = float(aging_rate)
+    digest = hashlib.blake2b(digest_size=20)
+    digest.update(f"{SIMULATOR_VERSION}\0{algorithm}\0{reference}\0{time_quantum}\0{aging_rate!r}\0{len(arrival_times)}\0".encode())
+    for column in (arrival_times, burst_times, priorities):
+        digest.update(np.ascontiguousarray(as_int_array(column), dtype='<i8').tobytes())
+    return digest.hexdigest()
+
+
+def _unique(ids: np.ndarray) -> bool:
+    """Checks whether no id repeats, without sorting when they are already increasing."""
+    return bool((ids[1:] > ids[:-1]).all()) or len(np.unique(ids)) == len(ids)
+
+
+def _positions(ids: np.ndarray, query: Sequence[int]) -> np.ndarray:
+    """Returns the row index of each queried id; ids must be unique."""
+    sorter = np.argsort(ids, kind='stable')
+    return sorter[np.searchsorted(ids, query, sorter=sorter)]
+
+
+def _result_columns(processes: Processes) -> Tuple[np.ndarray, np.ndarray]:
+    """Returns the start and completion times stored on the processes, NOT_STARTED for none."""
+    if isinstance(processes, ProcessTable):
+        return as_int_array(processes.start_times), as_int_array(processes.completion_times)
+    start_times = [NOT_STARTED if p.start_time is None else p.start_time for p in processes]
+    return as_int_array(start_times), as_int_array([p.completion_time for p in processes])
+
+
+class ResultCache:
+    """
+    A content-addressed on-disk cache of scheduling results.
+
+    Each entry is one binary file named after cache_key, holding a 24-byte header followed
+    by the start time, completion time and result order of each process and the process
+    row, start time and duration of each timeline segment, all little-endian int64. Waiting
+    and turnaround times are derived again on load. Hits refresh the file's modification
+    time, and storing an entry evicts the least recently used ones until the directory
+    fits in max_bytes.
+    """
+
+    def __init__(self, directory: str, max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Args:
+            directory (str): The cache directory; created if missing.
+            max_bytes (int): The total size the cache files are kept within.
+
+        Raises:
+            ValueError: If max_bytes is not positive.
+        """
+        if max_bytes <= 0:
+            raise ValueError("Cache size must be a positive integer.")
+        self.directory = directory
+        self.max_bytes = max_bytes
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key + SUFFIX)
+
+    def run(
+        self,
+        algorithm: str,
+        processes: Processes,
+        time_quantum: Optional[int] = None,
+        aging_rate: Optional[float] = None
+    ) -> Tuple[Processes, Timeline]:
+        """
+        Runs the named algorithm, or loads its results if this simulation is cached.
+
+        Takes the same arguments and returns the same results as
+        algorithms.registry.run_algorithm, which it calls on a miss.
+
+        Args:
+            algorithm (str): The algorithm name.
+            processes (Processes): The list of processes or ProcessTable to schedule.
+            time_quantum (Optional[int]): The time quantum, required for Round Robin scheduling.
+            aging_rate (Optional[float]): The priority aging rate, used by the priority schedulers.
+
+        Returns:
+            Tuple[Processes, Timeline]: The scheduled processes and the execution timeline.
+
+        Raises:
+            ValueError: If the algorithm is unknown or the time quantum or aging rate is invalid.
+        """
+        policy = get_policy(algorithm)
+        if not policy.uses_quantum:
+            time_quantum = None
+        if not policy.uses_aging or not aging_rate:
+            # A zero rate schedules exactly like no aging
+            aging_rate = None
+        ids = as_int_array(read_columns(processes)[0])
+        # Results are matched to processes by id, so duplicates cannot be cached
+        if not processes or not _unique(ids):
+            return run_algorithm(algorithm, processes, time_quantum, aging_rate=aging_rate)
+
+        key = cache_key(processes, algorithm, time_quantum, aging_rate)
+        path = self._path(key)
+        cached = self._load(path, len(ids))
+        if cached is not None:
+            start_times, completion_times, order, rows, segment_starts, durations = cached
+            if not isinstance(processes, ProcessTable):
+                start_times = [None if start_time == NOT_STARTED else start_time for start_time in start_times.tolist()]
+            write_results(processes, start_times, completion_times)
+            process_ids = np.where(rows == IDLE, IDLE, ids[rows])
+            gantt_chart = Timeline.from_arrays(process_ids, segment_starts, durations)
+            if np.array_equal(order, np.arange(len(ids))):
+                return processes, gantt_chart
+            return take_rows(processes, order if isinstance(processes, ProcessTable) else order.tolist()), gantt_chart
+
+        scheduled_processes, gantt_chart = run_algorithm(algorithm, processes, time_quantum, aging_rate=aging_rate)
+        order = _positions(ids, as_int_array(read_columns(scheduled_processes)[0]))
+        process_ids = as_int_array(gantt_chart.process_ids)
+        idle = process_ids == IDLE
+        rows = np.where(idle, IDLE, _positions(ids, np.where(idle, ids[0], process_ids)))
+        self._store(path, _result_columns(processes) + (order, rows, gantt_chart.start_times, gantt_chart.durations))
+        return scheduled_processes, gantt_chart
+
+    def _load(self, path: str, n: int) -> Optional[List[np.ndarray]]:
+        """Reads an entry, or returns None if it is missing or unreadable."""
+        try:
+            with open(path, 'rb') as file:
+                data = file.read()
+        except OSError:
+            return None
+        if len(data) < HEADER.size:
+            return None
+        magic, version, processes, segments = HEADER.unpack_from(data)
+        if magic != MAGIC or version != VERSION or processes != n \
+                or len(data) != HEADER.size + 8 * (3 * processes + 3 * segments):
+            return None
+        try:
+            # Mark the entry as recently used
+            os.utime(path)
+        except OSError:
+            pass
+        values = np.frombuffer(data, dtype='<i8', offset=HEADER.size).astype(np.int64)
+        bounds = np.cumsum([0, processes, processes, processes, segments, segments, segments])
+        return [values[start:end] for start, end in zip(bounds[:-1], bounds[1:])]
+
+    def _store(self, path: str, columns: Sequence[Sequence[int]]):
+        """Writes an entry atomically, then evicts entries beyond the size limit."""
+        columns = [np.ascontiguousarray(as_int_array(column), dtype='<i8') for column in columns]
+        temporary = f"{path}.{os.getpid()}.tmp"
+        try:
+            with open(temporary, 'wb') as file:
+                file.write(HEADER.pack(MAGIC, VERSION, len(columns[0]), len(columns[3])))
+                for column in columns:
+                    file.write(column.tobytes())
+            os.replace(temporary, path)
+        except OSError:
+            # The cache is best-effort; a failed write only costs a later recomputation
+            try:
+                os.remove(temporary)
+            except OSError:
+                pass
+            return
+        self.evict()
+
+    def evict(self):
+        """Deletes the least recently used entries until the cache fits in max_bytes."""
+        entries = []
+        total = 0
+        with os.scandir(self.directory) as scan:
+            for entry in scan:
+                if not entry.name.endswith(SUFFIX):
+                    continue
+                try:
+                    info = entry.stat()
+                except OSError:
+                    continue
+                entries.append((info.st_mtime, entry.path, info.st_size))
+                total += info.st_size
+        entries.sort()
+        for _, path, size in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                # Another process may have evicted it already
+                pass
+            total -= size
+
+    def clear(self):
+        """Deletes every entry."""
+        with os.scandir(self.directory) as scan:
+            for entry in scan:
+                if entry.name.endswith(SUFFIX):
+                    try:
+                        os.remove(entry.path)
+                    except OSError:
+                        pass
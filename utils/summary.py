@@ -0,0 +1,325 @@
+import json
+from typing import Any, Dict, Optional, Sequence, TextIO, Tuple
+import numpy as np
+from models.process_table import Processes, ProcessTable, NOT_STARTED
+from models.timeline import IDLE, GanttChart, as_timeline
+from utils.metrics import as_int_array
+
+# Quantiles reported for every distribution
+QUANTILES = (0.5, 0.9, 0.99, 0.999)
+# Values below 2 ** (SUB_BUCKET_BITS + 1) get a bucket each; larger ones share buckets
+# whose width is at most 1 / 2 ** SUB_BUCKET_BITS of their value
+SUB_BUCKET_BITS = 8
+SUB_BUCKETS = 1 << SUB_BUCKET_BITS
+
+METRICS = ('waiting_time', 'turnaround_time', 'response_time')
+
+
+class Histogram:
+    """
+    A mergeable log-linear histogram of non-negative integers.
+
+    Small values are counted exactly; larger ones fall into buckets of 2 ** SUB_BUCKET_BITS
+    per power of two, so quantiles are accurate to within 0.4% of their value. Memory is
+    bounded by the largest value, not the number of values, and two histograms merge by
+    adding their counts.
+
+    Attributes:
+        counts (np.ndarray): The number of values in each bucket.
+    """
+
+    def __init__(self):
+        self.counts = np.zeros(2 * SUB_BUCKETS, dtype=np.int64)
+
+    @staticmethod
+    def bucket_indices(values: np.ndarray) -> np.ndarray:
+        """Returns the bucket of each value."""
+        # frexp yields the bit length of each value, exactly below 2 ** 53
+        shift = np.maximum(np.frexp(values.astype(np.float64))[1] - SUB_BUCKET_BITS - 1, 0)
+        return shift * SUB_BUCKETS + (values >> shift)
+
+    @staticmethod
+    def bucket_bounds(index: int) -> Tuple[int, int]:
+        """Returns the smallest and largest value of a bucket."""
+        shift = max(index // SUB_BUCKETS - 1, 0)
+        low = (index - shift * SUB_BUCKETS) << shift
+        return low, low + (1 << shift) - 1
+
+    def _grow(self, size: int):
+        if size > len(self.counts):
+            self.counts = np.concatenate([self.counts, np.zeros(size - len(self.counts), dtype=np.int64)])
+
+    def add(self, values: np.ndarray):
+        """
+        Counts a batch of values.
+
+        Args:
+            values (np.ndarray): Non-negative integers.
+        """
+        if not len(values):
+            return
+        counts = np.bincount(self.bucket_indices(values))
+        self._grow(len(counts))
+        self.counts[:len(counts)] += counts
+
+    def merge(self, other: 'Histogram'):
+        """Adds the counts of another histogram to this one."""
+        self._grow(len(other.counts))
+        self.counts[:len(other.counts)] += other.counts
+
+    def quantile(self, q: float) -> Optional[int]:
+        """
+        Returns the nearest-rank q-quantile, as the midpoint of the bucket holding it.
+
+        Args:
+            q (float): The quantile, between 0 and 1.
+
+        Returns:
+            Optional[int]: The estimate, or None if the histogram is empty.
+        """
+        cumulative = np.cumsum(self.counts)
+        total = int(cumulative[-1])
+        if total == 0:
+            return None
+        rank = max(int(np.ceil(q * total)), 1)
+        low, high = self.bucket_bounds(int(np.searchsorted(cumulative, rank)))
+        return (low + high) // 2
+
+
+class Distribution:
+    """
+    Streaming summary statistics of one metric: count, mean, variance, extremes and quantiles.
+
+    The mean and variance are combined across batches with Chan et al.'s parallel
+    update, so merging partial results gives the same moments as one pass over all values.
+
+    Attributes:
+        count (int): The number of values.
+        minimum (Optional[int]): The smallest value.
+        maximum (Optional[int]): The largest value.
+        mean (float): The mean value.
+        histogram (Histogram): The value distribution used for quantiles.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.minimum: Optional[int] = None
+        self.maximum: Optional[int] = None
+        self.mean = 0.0
+        # Sum of squared deviations from the mean
+        self._m2 = 0.0
+        self.histogram = Histogram()
+
+    def _combine(self, count: int, minimum: int, maximum: int, mean: float, m2: float):
+        total = self.count + count
+        delta = mean - self.mean
+        self.mean += delta * count / total
+        self._m2 += m2 + delta * delta * self.count * count / total
+        self.count = total
+        self.minimum = minimum if self.minimum is None else min(self.minimum, minimum)
+        self.maximum = maximum if self.maximum is None else max(self.maximum, maximum)
+
+    def add(self, values: Sequence[int]):
+        """
+        Adds a batch of values.
+
+        Args:
+            values (Sequence[int]): Non-negative integers.
+        """
+        values = as_int_array(values)
+        if not len(values):
+            return
+        mean = float(values.mean())
+        self._combine(len(values), int(values.min()), int(values.max()), mean, float(((values - mean) ** 2).sum()))
+        self.histogram.add(values)
+
+    def merge(self, other: 'Distribution'):
+        """Adds the values summarized by another distribution."""
+        if other.count:
+            self._combine(other.count, other.minimum, other.maximum, other.mean, other._m2)
+            self.histogram.merge(other.histogram)
+
+    @property
+    def variance(self) -> float:
+        """The population variance, or 0.0 without values."""
+        return self._m2 / self.count if self.count else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Returns the statistics as a dictionary; quantiles are keyed 'p50', 'p90', 'p99' and 'p99.9'."""
+        result = {
+            'count': self.count,
+            'mean': self.mean,
+            'min': self.minimum,
+            'max': self.maximum,
+            'variance': self.variance
+        }
+        for q in QUANTILES:
+            estimate = self.histogram.quantile(q)
+            if estimate is not None:
+                # Keep estimates within the observed range
+                estimate = min(max(estimate, self.minimum), self.maximum)
+            result[f"p{q * 100:g}"] = estimate
+        return result
+
+
+class MetricsSummary:
+    """
+    Accumulates schedule metrics without keeping per-process data.
+
+    Processes are added in column batches, so any number of them can be summarized in
+    bounded memory. Summaries of disjoint parts of a run, or of parallel runs, combine
+    with merge, and pickle for transfer between processes.
+
+    Attributes:
+        distributions (Dict[str, Distribution]): The waiting, turnaround and response time distributions.
+        first_arrival (Optional[int]): The earliest arrival time.
+        last_completion (Optional[int]): The latest completion time.
+        busy_time (int): The non-idle time in the added timelines.
+        cores (int): The number of CPUs the timelines are spread over.
+    """
+
+    def __init__(self, cores: int = 1):
+        """
+        Args:
+            cores (int): The number of CPUs, used to normalize the utilization.
+        """
+        self.distributions = {metric: Distribution() for metric in METRICS}
+        self.first_arrival: Optional[int] = None
+        self.last_completion: Optional[int] = None
+        self.busy_time = 0
+        self.cores = cores
+
+    @property
+    def count(self) -> int:
+        """The number of processes summarized."""
+        return self.distributions['waiting_time'].count
+
+    def add_columns(
+        self,
+        arrival_times: Sequence[int],
+        burst_times: Sequence[int],
+        start_times: Sequence[int],
+        completion_times: Sequence[int]
+    ):
+        """
+        Adds a batch of completed processes.
+
+        Args:
+            arrival_times (Sequence[int]): The arrival time of each process.
+            burst_times (Sequence[int]): The burst time of each process.
+            start_times (Sequence[int]): The first dispatch time of each process.
+            completion_times (Sequence[int]): The completion time of each process.
+        """
+        arrival_times = as_int_array(arrival_times)
+        if not len(arrival_times):
+            return
+        completion_times = as_int_array(completion_times)
+        turnaround_times = completion_times - arrival_times
+        self.distributions['turnaround_time'].add(turnaround_times)
+        self.distributions['waiting_time'].add(turnaround_times - as_int_array(burst_times))
+        self.distributions['response_time'].add(as_int_array(start_times) - arrival_times)
+        first_arrival = int(arrival_times.min())
+        last_completion = int(completion_times.max())
+        if self.first_arrival is None or first_arrival < self.first_arrival:
+            self.first_arrival = first_arrival
+        if self.last_completion is None or last_completion > self.last_completion:
+            self.last_completion = last_completion
+
+    def add_processes(self, processes: Processes):
+        """
+        Adds scheduled processes, reading a ProcessTable's columns directly.
+
+        Args:
+            processes (Processes): The list of processes or ProcessTable with scheduling info.
+        """
+        if isinstance(processes, ProcessTable):
+            self.add_columns(processes.arrival_times, processes.burst_times,
+                             processes.start_times, processes.completion_times)
+        else:
+            self.add_columns(
+                [p.arrival_time for p in processes],
+                [p.burst_time for p in processes],
+                [NOT_STARTED if p.start_time is None else p.start_time for p in processes],
+                [p.completion_time for p in processes]
+            )
+
+    def add_timeline(self, gantt_chart: GanttChart):
+        """
+        Adds the busy time of an execution timeline.
+
+        Args:
+            gantt_chart (GanttChart): The timeline of one CPU, or part of one.
+        """
+        timeline = as_timeline(gantt_chart)
+        durations = as_int_array(timeline.durations)
+        self.busy_time += int(durations[as_int_array(timeline.process_ids) != IDLE].sum())
+
+    def merge(self, other: 'MetricsSummary') -> 'MetricsSummary':
+        """
+        Adds the processes and busy time summarized by another accumulator.
+
+        Args:
+            other (MetricsSummary): The partial summary to merge.
+
+        Returns:
+            MetricsSummary: This accumulator.
+
+        Raises:
+            ValueError: If the summaries cover different numbers of cores.
+        """
+        if other.cores != self.cores:
+            raise ValueError("Cannot merge summaries of runs with different numbers of cores.")
+        for metric in METRICS:
+            self.distributions[metric].merge(other.distributions[metric])
+        for value in (other.first_arrival, other.last_completion):
+            if value is None:
+                continue
+            self.first_arrival = value if self.first_arrival is None else min(self.first_arrival, value)
+            self.last_completion = value if self.last_completion is None else max(self.last_completion, value)
+        self.busy_time += other.busy_time
+        return self
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Returns the summary as a dictionary.
+
+        Throughput and utilization are measured over the span from the first arrival to the
+        last completion; utilization divides the busy time by that span times the cores.
+        """
+        makespan = 0 if self.first_arrival is None else self.last_completion - self.first_arrival
+        result = {
+            'processes': self.count,
+            'makespan': makespan,
+            'throughput': self.count / makespan if makespan else 0.0,
+            'cpu_utilization': self.busy_time / (makespan * self.cores) if makespan else 0.0
+        }
+        for metric in METRICS:
+            result[metric] = self.distributions[metric].to_dict()
+        return result
+
+    def to_json(self) -> str:
+        """Returns the summary as JSON."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def report(self, writer: Optional[TextIO] = None):
+        """
+        Prints the summary.
+
+        Args:
+            writer (Optional[TextIO]): Where to print; defaults to standard output.
+        """
+        summary = self.to_dict()
+        print("Schedule Summary:", file=writer)
+        print(f"  Processes:            {summary['processes']}", file=writer)
+        print(f"  Makespan:             {summary['makespan']}", file=writer)
+        print(f"  Throughput:           {summary['throughput']:.6f} processes per time unit", file=writer)
+        print(f"  CPU utilization:      {summary['cpu_utilization']:.2%}", file=writer)
+        for metric in METRICS:
+            values = summary[metric]
+            if not values['count']:
+                continue
+            quantiles = '  '.join(f"p{q * 100:g}={values[f'p{q * 100:g}']}" for q in QUANTILES)
+            print(f"\n  {metric.replace('_', ' ').capitalize()}:", file=writer)
+            print(f"    mean={values['mean']:.2f}  std={values['variance'] ** 0.5:.2f}  "
+                  f"min={values['min']}  max={values['max']}", file=writer)
+            print(f"    {quantiles}", file=writer)
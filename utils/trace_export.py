@@ -0,0 +1,305 @@
+import json
+import mmap
+import struct
+from typing import Dict, Iterable, Iterator, List, TextIO, Union
+import numpy as np
+from models.timeline import IDLE, GanttChart, as_timeline
+from algorithms.event_engine import SEGMENT
+from algorithms.streaming import StreamEvent
+
+# Header: magic, format version, padding, segment count (little-endian)
+HEADER = struct.Struct('<4sHxxQ')
+MAGIC = b'CPUT'
+VERSION = 1
+# One segment: process id (IDLE for idle time), start time, duration, core
+RECORD = struct.Struct('<qqqi')
+RECORD_DTYPE = np.dtype([('process_id', '<i8'), ('start_time', '<i8'), ('duration', '<i8'), ('core', '<i4')])
+# Segments buffered before each write
+BUFFER_RECORDS = 65536
+
+TRACE_FORMATS = ('chrome', 'binary')
+TRACKS = ('process', 'cpu')
+
+
+class TraceWriter:
+    """
+    Base class of the streaming trace exporters.
+
+    Segments are written as they are added, so a trace of any length is exported in
+    bounded memory. A segment that continues the previous one of the same process on the
+    same core is merged into it, as in Timeline, so traces written from a stream of
+    slices match the merged timeline. Only the last segment of each core is held back.
+
+    Writers are context managers; leaving the block closes the file.
+    """
+
+    def __init__(self):
+        # The unwritten last segment of each core: [process_id, start_time, duration]
+        self._pending: Dict[int, List[int]] = {}
+
+    def add(self, process_id: int, start_time: int, duration: int, core: int = 0):
+        """
+        Adds one execution segment.
+
+        Args:
+            process_id (int): The process id, or IDLE.
+            start_time (int): The start time of the segment.
+            duration (int): The duration of the segment.
+            core (int): The CPU that ran the segment.
+        """
+        pending = self._pending.get(core)
+        if pending is not None:
+            if pending[0] == process_id and pending[1] + pending[2] == start_time:
+                pending[2] += duration
+                return
+            self._write(pending[0], pending[1], pending[2], core)
+        self._pending[core] = [process_id, start_time, duration]
+
+    def add_timeline(self, gantt_chart: GanttChart, core: int = 0):
+        """
+        Adds every segment of an execution timeline.
+
+        Args:
+            gantt_chart (GanttChart): The timeline of one CPU.
+            core (int): The CPU the timeline belongs to.
+        """
+        for process_id, start_time, duration in as_timeline(gantt_chart):
+            self.add(process_id, start_time, duration, core)
+
+    def flush(self):
+        """Writes every segment added so far to the file; later segments are not merged into them."""
+        for core in sorted(self._pending):
+            self._write(*self._pending[core], core)
+        self._pending.clear()
+        self._sync()
+
+    def close(self):
+        """Writes the held-back segments and finishes the file."""
+        self.flush()
+        self._finish()
+
+    def _write(self, process_id: int, start_time: int, duration: int, core: int):
+        raise NotImplementedError
+
+    def _sync(self):
+        raise NotImplementedError
+
+    def _finish(self):
+        raise NotImplementedError
+
+    def __enter__(self) -> 'TraceWriter':
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class ChromeTraceWriter(TraceWriter):
+    """
+    Writes a Chrome Trace Event JSON file, which Perfetto (ui.perfetto.dev) and chrome://tracing open.
+
+    Each segment becomes a complete ('X') event named after its process, with one time
+    unit shown as one microsecond. With tracks='process' every process gets its own
+    track, whose thread id is the process id; with tracks='cpu' there is one track per
+    CPU. Idle time is left as gaps.
+    """
+
+    def __init__(self, output: Union[str, TextIO], tracks: str = 'process'):
+        """
+        Args:
+            output (Union[str, TextIO]): The path of the file to write, or an open text file,
+                which is left open when the writer closes.
+            tracks (str): 'process' for one track per process, 'cpu' for one per CPU.
+
+        Raises:
+            ValueError: If tracks is unknown.
+        """
+        if tracks not in TRACKS:
+            raise ValueError(f"Unknown trace tracks '{tracks}'. Expected 'process' or 'cpu'.")
+        super().__init__()
+        self._owns_output = isinstance(output, str)
+        self.output = open(output, 'w') if self._owns_output else output
+        self.tracks = tracks
+        self._cores = set()
+        self.output.write('{"traceEvents": [\n')
+        self._event({'ph': 'M', 'name': 'process_name', 'pid': 1, 'tid': 0,
+                     'args': {'name': 'Processes' if tracks == 'process' else 'CPUs'}}, first=True)
+
+    def _event(self, event: Dict, first: bool = False):
+        if not first:
+            self.output.write(',\n')
+        self.output.write(json.dumps(event, separators=(',', ':')))
+
+    def _write(self, process_id: int, start_time: int, duration: int, core: int):
+        if process_id == IDLE:
+            return
+        if self.tracks == 'process':
+            tid = process_id
+        else:
+            tid = core
+            # Name each CPU track the first time it is used; cores are few
+            if core not in self._cores:
+                self._cores.add(core)
+                self._event({'ph': 'M', 'name': 'thread_name', 'pid': 1, 'tid': core, 'args': {'name': f"CPU{core}"}})
+        # Formatted directly, as json.dumps per event dominates the export time
+        self.output.write(
+            f',\n{{"ph":"X","name":"P{process_id}","pid":1,"tid":{tid},"ts":{start_time},"dur":{duration},'
+            f'"args":{{"core":{core}}}}}'
+        )
+
+    def _sync(self):
+        self.output.flush()
+
+    def _finish(self):
+        self.output.write('\n]}\n')
+        if self._owns_output:
+            self.output.close()
+
+
+class BinaryTraceWriter(TraceWriter):
+    """
+    Writes a compact binary trace that read_binary_trace memory-maps.
+
+    The file holds a 16-byte header followed by one packed 28-byte record per segment:
+    process id (IDLE for idle time), start time and duration as little-endian int64 and
+    the core as int32. Records are buffered in blocks of BUFFER_RECORDS, and the segment
+    count in the header is filled in on close.
+    """
+
+    def __init__(self, file_path: str):
+        """
+        Args:
+            file_path (str): The path of the file to write.
+        """
+        super().__init__()
+        self.file_path = file_path
+        self.count = 0
+        self._file = open(file_path, 'wb')
+        self._file.write(HEADER.pack(MAGIC, VERSION, 0))
+        self._buffer = bytearray(BUFFER_RECORDS * RECORD.size)
+        self._buffered = 0
+
+    @classmethod
+    def reopen(cls, file_path: str, count: int) -> 'BinaryTraceWriter':
+        """
+        Continues an unfinished trace after its first count segments, discarding any written after them.
+
+        Args:
+            file_path (str): The path of the trace.
+            count (int): The number of segments to keep, as given by count after a flush.
+
+        Returns:
+            BinaryTraceWriter: A writer appending to the trace.
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+            ValueError: If the file is not a binary trace or holds fewer segments.
+        """
+        writer = cls.__new__(cls)
+        TraceWriter.__init__(writer)
+        writer.file_path = file_path
+        writer._file = open(file_path, 'r+b')
+        header = writer._file.read(HEADER.size)
+        size = writer._file.seek(0, 2)
+        if len(header) < HEADER.size or header[:len(MAGIC)] != MAGIC or HEADER.unpack(header)[1] != VERSION \
+                or size < HEADER.size + count * RECORD.size:
+            writer._file.close()
+            raise ValueError(f"'{file_path}' is not a binary trace holding {count} segments.")
+        writer._file.truncate(HEADER.size + count * RECORD.size)
+        writer._file.seek(0, 2)
+        writer.count = count
+        writer._buffer = bytearray(BUFFER_RECORDS * RECORD.size)
+        writer._buffered = 0
+        return writer
+
+    def _write(self, process_id: int, start_time: int, duration: int, core: int):
+        RECORD.pack_into(self._buffer, self._buffered * RECORD.size, process_id, start_time, duration, core)
+        self._buffered += 1
+        if self._buffered == BUFFER_RECORDS:
+            self._write_buffer()
+
+    def _write_buffer(self):
+        self._file.write(memoryview(self._buffer)[:self._buffered * RECORD.size])
+        self.count += self._buffered
+        self._buffered = 0
+
+    def _sync(self):
+        self._write_buffer()
+        self._file.flush()
+
+    def _finish(self):
+        self._file.seek(0)
+        self._file.write(HEADER.pack(MAGIC, VERSION, self.count))
+        self._file.close()
+
+
+def read_binary_trace(file_path: str) -> np.ndarray:
+    """
+    Memory-maps a binary trace file without reading it.
+
+    Args:
+        file_path (str): The path to the binary trace.
+
+    Returns:
+        np.ndarray: A read-only structured array with the fields 'process_id',
+        'start_time', 'duration' and 'core', one element per segment.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+        ValueError: If the file is not a complete binary trace.
+    """
+    with open(file_path, 'rb') as file:
+        header = file.read(HEADER.size)
+        if len(header) < HEADER.size or header[:len(MAGIC)] != MAGIC:
+            raise ValueError(f"'{file_path}' is not a binary trace file.")
+        _, version, count = HEADER.unpack(header)
+        if version != VERSION:
+            raise ValueError(f"Unsupported binary trace version {version}.")
+        file.seek(0, 2)
+        if file.tell() != HEADER.size + count * RECORD.size:
+            raise ValueError(f"'{file_path}' is truncated or was not closed.")
+        if count == 0:
+            return np.empty(0, dtype=RECORD_DTYPE)
+        mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    return np.frombuffer(mapped, dtype=RECORD_DTYPE, count=count, offset=HEADER.size)
+
+
+def open_trace(file_path: str, trace_format: str = 'chrome', tracks: str = 'process') -> TraceWriter:
+    """
+    Creates a trace writer for the given file.
+
+    Args:
+        file_path (str): The path of the trace file.
+        trace_format (str): 'chrome' for Chrome Trace Event JSON, 'binary' for the memory-mappable format.
+        tracks (str): The Chrome trace tracks, 'process' or 'cpu'; ignored for binary traces.
+
+    Returns:
+        TraceWriter: The writer; it closes the file when closed.
+
+    Raises:
+        ValueError: If the format or tracks are unknown.
+    """
+    if trace_format == 'binary':
+        return BinaryTraceWriter(file_path)
+    if trace_format != 'chrome':
+        raise ValueError(f"Unknown trace format '{trace_format}'. Expected 'chrome' or 'binary'.")
+    return ChromeTraceWriter(file_path, tracks)
+
+
+def trace_stream(events: Iterable[StreamEvent], writer: TraceWriter, core: int = 0) -> Iterator[StreamEvent]:
+    """
+    Writes the segments of a stream_scheduling event stream to a trace while passing every event on.
+
+    Args:
+        events (Iterable[StreamEvent]): The events of algorithms.streaming.stream_scheduling.
+        writer (TraceWriter): The trace to write to.
+        core (int): The CPU the stream runs on.
+
+    Yields:
+        StreamEvent: The same events, unchanged, once their segments are added.
+    """
+    for event in events:
+        kind, value = event
+        if kind == SEGMENT:
+            writer.add(value[0], value[1], value[2], core)
+        yield event
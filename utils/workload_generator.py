@@ -0,0 +1,140 @@
+from typing import Optional, Tuple, Union
+import numpy as np
+from models.process_table import ProcessTable
+
+ARRIVAL_PATTERNS = ('poisson', 'bursty')
+BURST_DISTRIBUTIONS = ('exponential', 'pareto')
+PRIORITY_DISTRIBUTIONS = ('uniform', 'skewed')
+
+
+def _bursts(rng: np.random.Generator, n: Union[int, Tuple[int, int]], distribution: str, mean_burst: float) -> np.ndarray:
+    """Draws positive integer burst times with the given mean; n is a count or a (workloads, processes) shape."""
+    if distribution == 'exponential':
+        bursts = rng.exponential(mean_burst, n)
+    elif distribution == 'pareto':
+        # Heavy tail with shape 1.5; scaled so the mean matches mean_burst
+        shape = 1.5
+        bursts = (rng.pareto(shape, n) + 1) * mean_burst * (shape - 1) / shape
+    else:
+        raise ValueError(f"Unknown burst distribution '{distribution}'.")
+    return np.maximum(np.rint(bursts), 1).astype(np.int64)
+
+
+def _arrivals(rng: np.random.Generator, n: Union[int, Tuple[int, int]], pattern: str, mean_gap: float) -> np.ndarray:
+    """Draws sorted non-negative integer arrival times with the given mean gap, along the last axis of n."""
+    if pattern == 'poisson':
+        gaps = rng.exponential(mean_gap, n)
+    elif pattern == 'bursty':
+        # Storms of simultaneous arrivals separated by long quiet periods
+        mean_storm_size = 50
+        storm_starts = rng.random(n) < 1 / mean_storm_size
+        storm_starts[..., 0] = True
+        gaps = np.where(storm_starts, rng.exponential(mean_gap * mean_storm_size, n), 0.0)
+    else:
+        raise ValueError(f"Unknown arrival pattern '{pattern}'.")
+    gaps[..., 0] = 0.0
+    return np.rint(np.cumsum(gaps, axis=-1)).astype(np.int64)
+
+
+def _priorities(rng: np.random.Generator, n: Union[int, Tuple[int, int]], distribution: str, levels: int) -> np.ndarray:
+    """Draws integer priorities in [0, levels)."""
+    if distribution == 'uniform':
+        return rng.integers(0, levels, n, dtype=np.int64)
+    if distribution == 'skewed':
+        # Zipf-like: most processes share the few lowest-urgency levels
+        weights = 1.0 / np.arange(1, levels + 1) ** 1.2
+        return (levels - 1 - rng.choice(levels, n, p=weights / weights.sum())).astype(np.int64)
+    raise ValueError(f"Unknown priority distribution '{distribution}'.")
+
+
+def generate_workload(
+    n: int,
+    arrivals: str = 'poisson',
+    bursts: str = 'exponential',
+    priorities: str = 'uniform',
+    load: float = 0.9,
+    mean_burst: float = 20.0,
+    priority_levels: int = 10,
+    seed: Optional[int] = 0
+) -> ProcessTable:
+    """
+    Generates a reproducible synthetic workload.
+
+    Args:
+        n (int): The number of processes.
+        arrivals (str): 'poisson' for independent arrivals or 'bursty' for arrival storms.
+        bursts (str): 'exponential' or heavy-tailed 'pareto' burst times.
+        priorities (str): 'uniform' or 'skewed' priority levels.
+        load (float): The offered CPU load, mean burst divided by mean inter-arrival gap.
+        mean_burst (float): The mean burst time.
+        priority_levels (int): The number of priority levels.
+        seed (Optional[int]): The random seed.
+
+    Returns:
+        ProcessTable: The generated processes, in arrival order.
+
+    Raises:
+        ValueError: If a parameter is out of range or a distribution is unknown.
+    """
+    if n <= 0:
+        raise ValueError("Number of processes must be positive.")
+    if load <= 0 or mean_burst <= 0 or priority_levels <= 0:
+        raise ValueError("Load, mean burst and priority levels must be positive.")
+    rng = np.random.default_rng(seed)
+    return ProcessTable.from_columns(
+        _arrivals(rng, n, arrivals, mean_burst / load),
+        _bursts(rng, n, bursts, mean_burst),
+        _priorities(rng, n, priorities, priority_levels)
+    )
+
+
+def generate_workload_batch(
+    count: int,
+    min_processes: int = 10,
+    max_processes: int = 50,
+    arrivals: str = 'poisson',
+    bursts: str = 'exponential',
+    priorities: str = 'uniform',
+    load: float = 0.9,
+    mean_burst: float = 20.0,
+    priority_levels: int = 10,
+    seed: Optional[int] = 0
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Generates a reproducible batch of small independent workloads for algorithms.batched.batch_simulate.
+
+    Every workload is drawn like generate_workload, with a process count drawn uniformly
+    from [min_processes, max_processes].
+
+    Args:
+        count (int): The number of workloads.
+        min_processes (int): The smallest number of processes in a workload.
+        max_processes (int): The largest number of processes in a workload.
+        arrivals (str): 'poisson' for independent arrivals or 'bursty' for arrival storms.
+        bursts (str): 'exponential' or heavy-tailed 'pareto' burst times.
+        priorities (str): 'uniform' or 'skewed' priority levels.
+        load (float): The offered CPU load, mean burst divided by mean inter-arrival gap.
+        mean_burst (float): The mean burst time.
+        priority_levels (int): The number of priority levels.
+        seed (Optional[int]): The random seed.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: A (count, max_processes, 3) array of arrival time, burst
+        time and priority, and the process count of each workload; rows past a workload's
+        count are padding.
+
+    Raises:
+        ValueError: If a parameter is out of range or a distribution is unknown.
+    """
+    if count < 0 or min_processes <= 0 or max_processes < min_processes:
+        raise ValueError("Workload count must be non-negative and process counts positive and ordered.")
+    if load <= 0 or mean_burst <= 0 or priority_levels <= 0:
+        raise ValueError("Load, mean burst and priority levels must be positive.")
+    rng = np.random.default_rng(seed)
+    shape = (count, max_processes)
+    workloads = np.stack([
+        _arrivals(rng, shape, arrivals, mean_burst / load),
+        _bursts(rng, shape, bursts, mean_burst),
+        _priorities(rng, shape, priorities, priority_levels)
+    ], axis=2)
+    return workloads, rng.integers(min_processes, max_processes + 1, count, dtype=np.int64)